@@ -0,0 +1,101 @@
+"""Admission control for transcript processing.
+
+Extraction is CPU-bound and transcripts can be large, so the number of
+extractions running at once is capped per process, with a bounded queue of
+waiting requests behind it. When the queue is full, or a request waits too
+long, it is rejected straight away with 503 and a Retry-After header
+instead of piling up behind the others.
+"""
+import asyncio
+import os
+from contextlib import asynccontextmanager
+from typing import Dict, Optional
+
+MAX_TRANSCRIPT_BYTES = int(os.getenv("MAX_TRANSCRIPT_BYTES", str(1024 * 1024)))
+MAX_CONCURRENT_EXTRACTIONS = int(os.getenv("MAX_CONCURRENT_EXTRACTIONS", "4"))
+MAX_QUEUED_EXTRACTIONS = int(os.getenv("MAX_QUEUED_EXTRACTIONS", "16"))
+QUEUE_TIMEOUT_SECONDS = float(os.getenv("QUEUE_TIMEOUT_SECONDS", "10"))
+RETRY_AFTER_SECONDS = int(os.getenv("RETRY_AFTER_SECONDS", "5"))
+
+
+class Overloaded(Exception):
+    """Raised when a request cannot be admitted."""
+
+    def __init__(self, detail: str, retry_after: int = RETRY_AFTER_SECONDS):
+        super().__init__(detail)
+        self.detail = detail
+        self.retry_after = retry_after
+
+
+class AdmissionController:
+    """Caps concurrent work with a semaphore and a bounded wait queue."""
+
+    def __init__(
+        self,
+        max_concurrent: int = MAX_CONCURRENT_EXTRACTIONS,
+        max_queued: int = MAX_QUEUED_EXTRACTIONS,
+        queue_timeout: float = QUEUE_TIMEOUT_SECONDS,
+    ):
+        self.max_concurrent = max_concurrent
+        self.max_queued = max_queued
+        self.queue_timeout = queue_timeout
+        self.in_flight = 0
+        self.queued = 0
+        self.admitted = 0
+        self.rejected_queue_full = 0
+        self.rejected_timeout = 0
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        # A semaphore belongs to one event loop; recreate it if the loop changed
+        loop = asyncio.get_running_loop()
+        if self._semaphore is None or self._loop is not loop:
+            self._semaphore = asyncio.Semaphore(self.max_concurrent)
+            self._loop = loop
+        return self._semaphore
+
+    @asynccontextmanager
+    async def slot(self):
+        """
+        Hold one of the concurrent slots for the duration of the block.
+
+        Raises:
+            Overloaded: If the wait queue is full or the wait times out
+        """
+        semaphore = self._get_semaphore()
+        if semaphore.locked() and self.queued >= self.max_queued:
+            self.rejected_queue_full += 1
+            raise Overloaded("Server is busy, try again later")
+
+        self.queued += 1
+        try:
+            await asyncio.wait_for(semaphore.acquire(), timeout=self.queue_timeout)
+        except asyncio.TimeoutError:
+            self.rejected_timeout += 1
+            raise Overloaded("Timed out waiting for a processing slot")
+        finally:
+            self.queued -= 1
+
+        self.in_flight += 1
+        self.admitted += 1
+        try:
+            yield
+        finally:
+            self.in_flight -= 1
+            semaphore.release()
+
+    def stats(self) -> Dict[str, int]:
+        """Current queue depth, limits and admission counters."""
+        return {
+            "in_flight": self.in_flight,
+            "queued": self.queued,
+            "max_concurrent": self.max_concurrent,
+            "max_queued": self.max_queued,
+            "admitted": self.admitted,
+            "rejected_queue_full": self.rejected_queue_full,
+            "rejected_timeout": self.rejected_timeout,
+        }
+
+
+extraction_admission = AdmissionController()
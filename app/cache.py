@@ -0,0 +1,221 @@
+"""Read-through response cache for the listing endpoints.
+
+Cached responses are keyed by namespace, query parameters and the
+namespace's generation counter, which lives in the `cache_generations`
+table. Every write path bumps the counters it affects inside its own
+transaction, so entries built from older data can never be served again,
+whichever worker process built them. Old entries simply age out of the LRU.
+
+Keys also carry the current date, since listed tasks say whether they are
+overdue, so entries built on an earlier day are never served.
+
+Request handlers use per-workspace namespaces ("tasks:acme", see
+workspace_namespaces()), so a write in one workspace leaves the others'
+entries valid. Maintenance jobs bump the global namespaces ("tasks"),
+which every listing also depends on.
+
+By default entries are kept in a bounded in-process LRU. Setting
+`CACHE_URL=redis://...` shares them between workers instead; that needs
+the optional `redis` package, and eviction is left to Redis' own
+maxmemory policy.
+"""
+import os
+import threading
+import time
+from collections import OrderedDict
+from datetime import date
+from typing import Callable, Dict, Iterable, Optional, Tuple
+
+from sqlalchemy import update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+
+from app.models import CacheGeneration
+
+CACHE_ENABLED = os.getenv("CACHE_ENABLED", "1") not in ("0", "false", "no")
+CACHE_URL = os.getenv("CACHE_URL")
+CACHE_MAX_ENTRIES = int(os.getenv("CACHE_MAX_ENTRIES", "256"))
+CACHE_TTL_SECONDS = int(os.getenv("CACHE_TTL_SECONDS", "300"))
+
+
+class LocalCacheBackend:
+    """Bounded in-process LRU store with a per-entry TTL."""
+
+    def __init__(self, max_entries: int = CACHE_MAX_ENTRIES, ttl: int = CACHE_TTL_SECONDS):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, Tuple[float, bytes]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: bytes) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def prune_expired(self) -> int:
+        """Drop expired entries, returning how many were removed."""
+        now = time.monotonic()
+        with self._lock:
+            expired = [key for key, (expires_at, _) in self._entries.items() if expires_at < now]
+            for key in expired:
+                del self._entries[key]
+        return len(expired)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class RedisCacheBackend:
+    """Store shared between workers, backed by Redis."""
+
+    def __init__(self, url: str, ttl: int = CACHE_TTL_SECONDS, prefix: str = "meeting-tracker:"):
+        import redis  # Optional dependency, only needed when CACHE_URL is set
+
+        self.client = redis.Redis.from_url(url)
+        self.ttl = ttl
+        self.prefix = prefix
+
+    def get(self, key: str) -> Optional[bytes]:
+        return self.client.get(self.prefix + key)
+
+    def set(self, key: str, value: bytes) -> None:
+        self.client.set(self.prefix + key, value, ex=self.ttl)
+
+    def prune_expired(self) -> int:
+        # Redis expires keys on its own
+        return 0
+
+    def clear(self) -> None:
+        for key in self.client.scan_iter(match=self.prefix + "*"):
+            self.client.delete(key)
+
+
+def workspace_namespaces(workspace: str, *namespaces: str) -> Tuple[str, ...]:
+    """Names of the per-workspace counterparts of some namespaces."""
+    return tuple(f"{name}:{workspace}" for name in namespaces)
+
+
+def current_generations(db: Session, namespaces: Iterable[str]) -> Dict[str, int]:
+    """Read the generation counters for some namespaces (missing rows are 0)."""
+    namespaces = list(namespaces)
+    rows = dict(
+        db.query(CacheGeneration.name, CacheGeneration.generation)
+        .filter(CacheGeneration.name.in_(namespaces))
+        .all()
+    )
+    return {name: rows.get(name, 0) for name in namespaces}
+
+
+def invalidate(db: Session, *namespaces: str) -> None:
+    """
+    Bump the generation of each namespace.
+
+    Call this inside the transaction that changes the data, before
+    committing, so the new generation becomes visible together with it.
+
+    On SQLite and PostgreSQL the counter is bumped with one upsert, so two
+    transactions creating the same counter at once both succeed instead of
+    one failing on the primary key.
+    """
+    dialect = db.get_bind().dialect.name
+    if dialect in ("sqlite", "postgresql"):
+        insert = sqlite.insert if dialect == "sqlite" else postgresql.insert
+        for name in namespaces:
+            db.execute(
+                insert(CacheGeneration)
+                .values(name=name, generation=1)
+                .on_conflict_do_update(
+                    index_elements=[CacheGeneration.name],
+                    set_={"generation": CacheGeneration.generation + 1},
+                )
+            )
+        return
+
+    for name in namespaces:
+        result = db.execute(
+            update(CacheGeneration)
+            .where(CacheGeneration.name == name)
+            .values(generation=CacheGeneration.generation + 1)
+        )
+        if result.rowcount == 0:
+            db.add(CacheGeneration(name=name, generation=1))
+
+
+class ResponseCache:
+    """Read-through cache of serialized listing responses."""
+
+    def __init__(self, backend, enabled: bool = CACHE_ENABLED):
+        self.backend = backend
+        self.enabled = enabled
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_build(
+        self,
+        db: Session,
+        namespaces: Tuple[str, ...],
+        params: Dict[str, object],
+        build: Callable[[], bytes],
+    ) -> bytes:
+        """
+        Return the cached response for these parameters, building it on a miss.
+
+        Args:
+            db: Database session, used to read the generation counters
+            namespaces: Data the response depends on, e.g. ("tasks",)
+            params: Query parameters that identify the response
+            build: Produces the serialized response body
+
+        Returns:
+            Serialized response body
+        """
+        if not self.enabled:
+            return build()
+
+        generations = current_generations(db, namespaces)
+        key = "|".join(
+            [f"{name}@{generations[name]}" for name in namespaces]
+            + [f"{name}={params[name]}" for name in sorted(params)]
+            + [f"day={date.today()}"]
+        )
+        value = self.backend.get(key)
+        if value is not None:
+            self.hits += 1
+            return value
+
+        self.misses += 1
+        value = build()
+        self.backend.set(key, value)
+        return value
+
+    def prune_expired(self) -> int:
+        return self.backend.prune_expired()
+
+    def clear(self) -> None:
+        self.backend.clear()
+
+    def stats(self) -> Dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses}
+
+
+response_cache = ResponseCache(
+    RedisCacheBackend(CACHE_URL) if CACHE_URL else LocalCacheBackend()
+)
@@ -0,0 +1,51 @@
+"""Compression helpers for large stored payloads.
+
+gzip is always available and is the default. zstd is used when
+`COMPRESSION_CODEC=zstd` is set and the optional `zstandard` package is
+installed. Decompression detects the codec from the payload's magic bytes,
+so data written with either codec stays readable.
+"""
+import gzip
+import os
+
+GZIP_MAGIC = b"\x1f\x8b"
+ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+
+COMPRESSION_CODEC = os.getenv("COMPRESSION_CODEC", "gzip")
+COMPRESSION_LEVEL = int(os.getenv("COMPRESSION_LEVEL", "6"))
+
+try:
+    import zstandard
+except ImportError:  # Optional dependency
+    zstandard = None
+
+
+def compress(data: bytes) -> bytes:
+    """Compress bytes with the configured codec."""
+    if COMPRESSION_CODEC == "zstd":
+        if zstandard is None:
+            raise RuntimeError("COMPRESSION_CODEC=zstd requires the 'zstandard' package")
+        return zstandard.ZstdCompressor(level=COMPRESSION_LEVEL).compress(data)
+    # mtime=0 keeps output deterministic for identical input
+    return gzip.compress(data, compresslevel=COMPRESSION_LEVEL, mtime=0)
+
+
+def decompress(data: bytes) -> bytes:
+    """Decompress bytes produced by compress(), whichever codec was used."""
+    if data.startswith(ZSTD_MAGIC):
+        if zstandard is None:
+            raise RuntimeError("Payload is zstd-compressed but 'zstandard' is not installed")
+        return zstandard.ZstdDecompressor().decompress(data)
+    if data.startswith(GZIP_MAGIC):
+        return gzip.decompress(data)
+    raise ValueError("Unknown compression format")
+
+
+def compress_text(value: str) -> bytes:
+    """Compress a string as UTF-8."""
+    return compress(value.encode("utf-8"))
+
+
+def decompress_text(data: bytes) -> str:
+    """Decompress bytes produced by compress_text()."""
+    return decompress(data).decode("utf-8")
@@ -1,4 +1,22 @@
-"""Database configuration and session management."""
+"""Database configuration and session management.
+
+Writes always go to DATABASE_URL. If DATABASE_READ_URL is set (e.g. a
+streaming replica), read-only routes use it instead, except for clients
+that wrote recently; see get_read_db().
+
+Every request belongs to a workspace (tenant), chosen by the X-Workspace
+header or the workspace cookie. Rows carry their workspace and all queries
+filter on it. If TENANT_DATABASE_DIR is set, each workspace instead gets its
+own SQLite file in that directory, opened on first use and kept in a
+bounded engine cache.
+"""
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional
+
+from fastapi import Cookie, Depends, Header, HTTPException, Request
 from sqlalchemy import create_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
@@ -9,36 +27,150 @@ import os
 # If running in Vercel but DATABASE_URL is missing, use /tmp (writable)
 fallback_db = "sqlite:////tmp/meeting_tracker.db" if os.environ.get("VERCEL") else "sqlite:///./meeting_tracker.db"
 DATABASE_URL = os.getenv("DATABASE_URL", fallback_db)
+DATABASE_READ_URL = os.getenv("DATABASE_READ_URL")
 
-# Create engine
-if "sqlite" in DATABASE_URL:
-    engine = create_engine(
-        DATABASE_URL,
-        connect_args={"check_same_thread": False}
-    )
-else:
-    engine = create_engine(
-        DATABASE_URL,
+# Clients that wrote within this many seconds read from the primary, so they
+# see their own writes despite replication lag
+READ_YOUR_WRITES_SECONDS = float(os.getenv("READ_YOUR_WRITES_SECONDS", "10"))
+LAST_WRITE_COOKIE = "last_write"
+
+DEFAULT_WORKSPACE = os.getenv("DEFAULT_WORKSPACE", "default")
+WORKSPACE_COOKIE = "workspace"
+WORKSPACE_PATTERN = re.compile(r"^[a-z0-9][a-z0-9_-]{0,49}$")
+
+# One SQLite file per workspace in this directory, instead of shared tables
+TENANT_DATABASE_DIR = os.getenv("TENANT_DATABASE_DIR")
+TENANT_ENGINE_CACHE_SIZE = int(os.getenv("TENANT_ENGINE_CACHE_SIZE", "64"))
+
+
+def make_engine(url: str):
+    """Create an engine with the settings used for the given backend."""
+    if "sqlite" in url:
+        return create_engine(
+            url,
+            connect_args={"check_same_thread": False}
+        )
+    return create_engine(
+        url,
         pool_pre_ping=True,
         pool_recycle=300,
     )
 
-# Create session factory
+
+# Create engines
+engine = make_engine(DATABASE_URL)
+read_engine = make_engine(DATABASE_READ_URL) if DATABASE_READ_URL else engine
+
+# Create session factories
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+ReadSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=read_engine)
 
 # Base class for models
 Base = declarative_base()
 
 
-def get_db():
+_tenant_sessions: "OrderedDict[str, sessionmaker]" = OrderedDict()
+_tenant_lock = threading.Lock()
+
+
+def is_valid_workspace(workspace: Optional[str]) -> bool:
+    """Whether a workspace name is a valid slug (also safe as a file name)."""
+    return bool(workspace) and WORKSPACE_PATTERN.match(workspace) is not None
+
+
+def get_workspace(
+    x_workspace: Optional[str] = Header(None),
+    workspace: Optional[str] = Cookie(None)
+) -> str:
+    """
+    Dependency resolving the workspace of a request.
+
+    Raises:
+        HTTPException: If the workspace name is not a valid slug
+    """
+    name = x_workspace or workspace or DEFAULT_WORKSPACE
+    if not is_valid_workspace(name):
+        raise HTTPException(status_code=400, detail="Invalid workspace")
+    return name
+
+
+def _tenant_sessionmaker(workspace: str) -> sessionmaker:
+    """Session factory for a workspace's own database file, from the cache."""
+    with _tenant_lock:
+        factory = _tenant_sessions.get(workspace)
+        if factory is not None:
+            _tenant_sessions.move_to_end(workspace)
+            return factory
+
+        os.makedirs(TENANT_DATABASE_DIR, exist_ok=True)
+        tenant_engine = make_engine(
+            f"sqlite:///{os.path.join(TENANT_DATABASE_DIR, workspace + '.db')}"
+        )
+        init_db(tenant_engine)
+        factory = sessionmaker(autocommit=False, autoflush=False, bind=tenant_engine)
+        _tenant_sessions[workspace] = factory
+
+        # Close the least recently used files beyond the cache size
+        while len(_tenant_sessions) > TENANT_ENGINE_CACHE_SIZE:
+            _, evicted = _tenant_sessions.popitem(last=False)
+            evicted.kw["bind"].dispose()
+        return factory
+
+
+def session_factory(workspace: str) -> sessionmaker:
+    """Session factory for writes in a workspace."""
+    if TENANT_DATABASE_DIR:
+        return _tenant_sessionmaker(workspace)
+    return SessionLocal
+
+
+def read_session_factory(workspace: str) -> sessionmaker:
+    """Session factory for reads in a workspace, using the replica if any."""
+    if TENANT_DATABASE_DIR:
+        return _tenant_sessionmaker(workspace)
+    return ReadSessionLocal
+
+
+def get_db(workspace: str = Depends(get_workspace)):
     """Dependency to get database session."""
-    db = SessionLocal()
+    db = session_factory(workspace)()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+def wrote_recently(request: Request) -> bool:
+    """Whether the client's last write is recent enough to need the primary."""
+    try:
+        last_write = float(request.cookies.get(LAST_WRITE_COOKIE, ""))
+    except ValueError:
+        return False
+    return time.time() - last_write < READ_YOUR_WRITES_SECONDS
+
+
+def get_read_db(request: Request, workspace: str = Depends(get_workspace)):
+    """
+    Dependency to get a session for read-only routes.
+
+    Uses the read replica when one is configured, unless the client wrote
+    within READ_YOUR_WRITES_SECONDS (tracked by the last_write cookie).
+    """
+    if wrote_recently(request):
+        factory = session_factory(workspace)
+    else:
+        factory = read_session_factory(workspace)
+    db = factory()
     try:
         yield db
     finally:
         db.close()
 
 
-def init_db():
-    """Initialize database tables."""
-    Base.metadata.create_all(bind=engine)
\ No newline at end of file
+def init_db(bind=None):
+    """Initialize database tables and apply pending migrations."""
+    from app.migrations import run_migrations
+
+    bind = bind if bind is not None else engine
+    Base.metadata.create_all(bind=bind)
+    run_migrations(bind)
@@ -0,0 +1,219 @@
+"""Task deduplication across transcripts.
+
+Recurring meetings tend to produce the same action item again and again
+("John will update the slides"). Each task gets a fingerprint built from its
+normalized owner and text; new items whose fingerprint matches an open task
+in the same workspace are merged into that task instead of being inserted
+again.
+
+The offline job can be run against an existing database with:
+
+    python -m app.dedup --batch-size 500
+"""
+import argparse
+import hashlib
+import re
+from datetime import date
+from typing import Dict, Iterable, Optional
+
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from app.cache import invalidate
+from app.database import DEFAULT_WORKSPACE
+from app.models import Task
+
+# Words that carry no meaning for matching purposes
+STOPWORDS = {"a", "an", "the", "our", "my", "his", "her", "their", "some"}
+
+_NON_WORD = re.compile(r"[^\w\s]+")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_text(value: Optional[str]) -> str:
+    """
+    Normalize free text for fingerprinting.
+
+    Lowercases, strips punctuation, drops filler words and collapses
+    whitespace, so "Update the slides." and "update slides" compare equal.
+    """
+    if not value:
+        return ""
+    words = _NON_WORD.sub(" ", value.lower()).split()
+    return " ".join(word for word in words if word not in STOPWORDS)
+
+
+def task_fingerprint(task: str, owner: Optional[str] = None) -> str:
+    """
+    Build the dedup fingerprint for a task.
+
+    Args:
+        task: Task description
+        owner: Task owner, if any
+
+    Returns:
+        40 character hex digest of the normalized owner and task text
+    """
+    key = f"{normalize_text(owner)}\x1f{normalize_text(task)}"
+    return hashlib.sha1(key.encode("utf-8")).hexdigest()
+
+
+def find_open_duplicates(
+    db: Session, fingerprints: Iterable[str], workspace: str = DEFAULT_WORKSPACE
+) -> Dict[str, Task]:
+    """
+    Look up open tasks by fingerprint.
+
+    Args:
+        db: Database session
+        fingerprints: Fingerprints to look up
+        workspace: Workspace to look in
+
+    Returns:
+        Mapping of fingerprint to the oldest open task carrying it
+    """
+    fingerprints = set(fingerprints)
+    if not fingerprints:
+        return {}
+
+    matches = {}
+    tasks = (
+        db.query(Task)
+        .filter(
+            Task.workspace == workspace,
+            Task.fingerprint.in_(fingerprints),
+            Task.status == "open",
+        )
+        .order_by(Task.id.desc())
+        .all()
+    )
+    for task in tasks:
+        # Ordered newest first, so the oldest task ends up in the map
+        matches[task.fingerprint] = task
+    return matches
+
+
+def merge_into(existing: Task, due_date: Optional[date]) -> Task:
+    """
+    Merge a newly extracted duplicate into an existing open task.
+
+    The most recent mention wins for the due date, since recurring items
+    usually carry a fresh deadline each time they come up.
+    """
+    if due_date:
+        existing.due_date = due_date
+    return existing
+
+
+def dedupe_existing_tasks(db: Session, batch_size: int = 500) -> Dict[str, int]:
+    """
+    Deduplicate tasks already stored in the database.
+
+    Runs two keyset-paginated passes so only one batch is held in memory at
+    a time: the first backfills missing fingerprints, the second folds open
+    duplicates into the oldest open task with the same fingerprint in the
+    same workspace.
+
+    Args:
+        db: Database session
+        batch_size: Number of tasks to load per batch
+
+    Returns:
+        Counts of fingerprinted and merged tasks
+    """
+    fingerprinted = 0
+    last_id = 0
+    while True:
+        batch = (
+            db.query(Task)
+            .filter(Task.id > last_id, Task.fingerprint.is_(None))
+            .order_by(Task.id)
+            .limit(batch_size)
+            .all()
+        )
+        if not batch:
+            break
+        for task in batch:
+            task.fingerprint = task_fingerprint(task.task, task.owner)
+        last_id = batch[-1].id
+        fingerprinted += len(batch)
+        db.commit()
+        db.expunge_all()
+
+    merged = 0
+    last_id = 0
+    while True:
+        batch = (
+            db.query(Task)
+            .filter(Task.id > last_id, Task.status == "open", Task.fingerprint.isnot(None))
+            .order_by(Task.id)
+            .limit(batch_size)
+            .all()
+        )
+        if not batch:
+            break
+        last_id = batch[-1].id
+
+        fingerprints_by_workspace: Dict[str, set] = {}
+        for task in batch:
+            fingerprints_by_workspace.setdefault(task.workspace, set()).add(task.fingerprint)
+        canonical_ids = {}
+        for workspace, fingerprints in fingerprints_by_workspace.items():
+            rows = (
+                db.query(Task.fingerprint, func.min(Task.id))
+                .filter(
+                    Task.workspace == workspace,
+                    Task.fingerprint.in_(fingerprints),
+                    Task.status == "open",
+                )
+                .group_by(Task.fingerprint)
+                .all()
+            )
+            for fingerprint, canonical_id in rows:
+                canonical_ids[(workspace, fingerprint)] = canonical_id
+
+        def canonical_id(task: Task) -> int:
+            return canonical_ids[(task.workspace, task.fingerprint)]
+
+        duplicates = [task for task in batch if canonical_id(task) != task.id]
+        if duplicates:
+            canonicals = {
+                task.id: task
+                for task in db.query(Task).filter(
+                    Task.id.in_({canonical_id(dup) for dup in duplicates})
+                )
+            }
+            for dup in duplicates:
+                merge_into(canonicals[canonical_id(dup)], dup.due_date)
+            db.query(Task).filter(Task.id.in_([dup.id for dup in duplicates])).delete(
+                synchronize_session=False
+            )
+            invalidate(db, "tasks", "transcripts")
+            merged += len(duplicates)
+        db.commit()
+        db.expunge_all()
+
+    return {"fingerprinted": fingerprinted, "merged": merged}
+
+
+def main(argv=None) -> int:
+    """Command line entry point for the offline dedup job."""
+    from app.database import SessionLocal, init_db
+
+    parser = argparse.ArgumentParser(description="Deduplicate stored tasks")
+    parser.add_argument("--batch-size", type=int, default=500, help="Tasks per batch")
+    args = parser.parse_args(argv)
+
+    init_db()
+    db = SessionLocal()
+    try:
+        result = dedupe_existing_tasks(db, batch_size=args.batch_size)
+    finally:
+        db.close()
+
+    print(f"Fingerprinted {result['fingerprinted']} task(s), merged {result['merged']} duplicate(s)")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
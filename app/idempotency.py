@@ -0,0 +1,217 @@
+"""Idempotency keys for transcript submission.
+
+Clients (or proxies) that retry `POST /api/transcripts` after a timeout can
+send an `Idempotency-Key` header. The first request with a key claims it by
+inserting a pending row, which the primary key makes unique across workers.
+The response is stored on that row in the same transaction that saves the
+transcript, so a retry gets the stored response back without extraction
+running again. A duplicate that arrives while the first request is still
+running polls until it finishes.
+
+Keys expire after `IDEMPOTENCY_TTL_SECONDS`. Expired rows are removed with:
+
+    python -m app.idempotency
+"""
+import argparse
+import asyncio
+import hashlib
+import os
+import time
+from datetime import datetime, timedelta
+from typing import Optional
+
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import or_
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.database import SessionLocal, session_factory
+from app.models import IdempotencyKey
+
+IDEMPOTENCY_TTL_SECONDS = int(os.getenv("IDEMPOTENCY_TTL_SECONDS", str(24 * 60 * 60)))
+IDEMPOTENCY_WAIT_SECONDS = float(os.getenv("IDEMPOTENCY_WAIT_SECONDS", "30"))
+# A pending key older than this belongs to a request that died; it may be reclaimed
+IDEMPOTENCY_LOCK_SECONDS = int(os.getenv("IDEMPOTENCY_LOCK_SECONDS", "300"))
+POLL_INTERVAL_SECONDS = 0.1
+# Stored keys are prefixed with the workspace, see scoped_key()
+MAX_KEY_LENGTH = 200
+
+
+class IdempotencyError(Exception):
+    """Raised when a keyed request cannot be accepted."""
+
+    def __init__(self, status_code: int, detail: str):
+        super().__init__(detail)
+        self.status_code = status_code
+        self.detail = detail
+
+
+def request_hash(body: str) -> str:
+    """Hash a request body so a reused key with a different body is caught."""
+    return hashlib.sha256(body.encode("utf-8")).hexdigest()
+
+
+def scoped_key(workspace: str, key: str) -> str:
+    """
+    Build the stored key, so different workspaces may use the same key.
+
+    Raises:
+        IdempotencyError: If the key is empty or too long
+    """
+    if not key or len(key) > MAX_KEY_LENGTH:
+        raise IdempotencyError(400, f"Idempotency-Key must be 1-{MAX_KEY_LENGTH} characters")
+    return f"{workspace}:{key}"
+
+
+def _check_body(record: IdempotencyKey, body_hash: str) -> None:
+    if record.request_hash != body_hash:
+        raise IdempotencyError(422, "Idempotency-Key was already used with a different request")
+
+
+def claim(db: Session, key: str, body_hash: str) -> Optional[IdempotencyKey]:
+    """
+    Claim an idempotency key for this request.
+
+    Args:
+        db: Database session
+        key: The stored key, see scoped_key()
+        body_hash: Hash of the request body, see request_hash()
+
+    Returns:
+        None if this request now owns the key, otherwise the existing record
+        (pending or completed)
+
+    Raises:
+        IdempotencyError: If the key was used for another body
+    """
+    now = datetime.utcnow()
+    # Clear the way if the key expired or its request never finished
+    db.query(IdempotencyKey).filter(
+        IdempotencyKey.key == key,
+        or_(
+            IdempotencyKey.created_at < now - timedelta(seconds=IDEMPOTENCY_TTL_SECONDS),
+            (IdempotencyKey.status == "pending")
+            & (IdempotencyKey.created_at < now - timedelta(seconds=IDEMPOTENCY_LOCK_SECONDS)),
+        ),
+    ).delete(synchronize_session=False)
+
+    try:
+        db.add(IdempotencyKey(key=key, request_hash=body_hash, status="pending", created_at=now))
+        db.commit()
+        return None
+    except IntegrityError:
+        db.rollback()
+
+    record = db.query(IdempotencyKey).filter(IdempotencyKey.key == key).first()
+    if record is None:
+        # The holder released it in the meantime; try once more
+        return claim(db, key, body_hash)
+    _check_body(record, body_hash)
+    return record
+
+
+def record_response(db: Session, key: str, status_code: int, body: str) -> None:
+    """
+    Store the response for a claimed key.
+
+    Call this inside the transaction that performs the write, before
+    committing, so the response is stored if and only if the write is.
+    """
+    db.query(IdempotencyKey).filter(IdempotencyKey.key == key).update(
+        {
+            "status": "completed",
+            "status_code": status_code,
+            "response_body": body,
+            "completed_at": datetime.utcnow(),
+        },
+        synchronize_session=False,
+    )
+
+
+def release(db: Session, key: str) -> None:
+    """Give up a claimed key after a failure, so a retry can run again."""
+    db.rollback()
+    db.query(IdempotencyKey).filter(
+        IdempotencyKey.key == key, IdempotencyKey.status == "pending"
+    ).delete(synchronize_session=False)
+    db.commit()
+
+
+def _load(key: str, workspace: str) -> Optional[IdempotencyKey]:
+    db = session_factory(workspace)()
+    try:
+        record = db.query(IdempotencyKey).filter(IdempotencyKey.key == key).first()
+        if record is not None:
+            db.expunge(record)
+        return record
+    finally:
+        db.close()
+
+
+async def wait_for_completion(
+    key: str, workspace: str, timeout: float = IDEMPOTENCY_WAIT_SECONDS
+) -> Optional[IdempotencyKey]:
+    """
+    Wait for the request holding a key to finish.
+
+    Polls with a fresh session each time so committed changes are seen.
+
+    Args:
+        key: The stored key, see scoped_key()
+        workspace: Workspace of the request, to pick its database
+        timeout: Longest time to wait, in seconds
+
+    Returns:
+        The completed record, or None if the holder failed and released the key
+
+    Raises:
+        IdempotencyError: If the holder is still running after the timeout
+    """
+    deadline = time.monotonic() + timeout
+    while True:
+        record = await run_in_threadpool(_load, key, workspace)
+        if record is None or record.status == "completed":
+            return record
+        if time.monotonic() >= deadline:
+            raise IdempotencyError(409, "A request with this Idempotency-Key is still in progress")
+        await asyncio.sleep(POLL_INTERVAL_SECONDS)
+
+
+def purge_expired(db: Session, ttl_seconds: int = IDEMPOTENCY_TTL_SECONDS) -> int:
+    """
+    Delete idempotency keys older than the TTL.
+
+    Returns:
+        Number of keys deleted
+    """
+    cutoff = datetime.utcnow() - timedelta(seconds=ttl_seconds)
+    deleted = (
+        db.query(IdempotencyKey)
+        .filter(IdempotencyKey.created_at < cutoff)
+        .delete(synchronize_session=False)
+    )
+    db.commit()
+    return deleted
+
+
+def main(argv=None) -> int:
+    """Command line entry point for the idempotency key cleanup."""
+    from app.database import init_db
+
+    parser = argparse.ArgumentParser(description="Delete expired idempotency keys")
+    parser.add_argument("--ttl-seconds", type=int, default=IDEMPOTENCY_TTL_SECONDS)
+    args = parser.parse_args(argv)
+
+    init_db()
+    db = SessionLocal()
+    try:
+        deleted = purge_expired(db, args.ttl_seconds)
+    finally:
+        db.close()
+
+    print(f"Deleted {deleted} expired idempotency key(s)")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -4,8 +4,131 @@ This uses pattern matching and NLP techniques to extract action items.
 Perfect for demos, testing, and portfolio projects.
 """
 import re
-from typing import List, Dict, Any
-from datetime import datetime, timedelta
+from typing import List, Dict, Any, Optional
+from datetime import date, datetime, timedelta
+
+
+# Action patterns to look for, in priority order. Each pattern is paired with
+# the trigger family that must occur in a sentence for the pattern to match.
+ACTION_PATTERNS = [
+    # "John will prepare the report"
+    ("will", r'(\w+)\s+will\s+(.+?)(?:\s+by\s+(.+?))?$'),
+    # "Sarah should review the document"
+    ("should", r'(\w+)\s+should\s+(.+?)(?:\s+by\s+(.+?))?$'),
+    # "Mike needs to update the slides"
+    ("need", r'(\w+)\s+needs?\s+to\s+(.+?)(?:\s+by\s+(.+?))?$'),
+    # "Jane agreed to finish the presentation"
+    ("agreed", r'(\w+)\s+agreed\s+to\s+(.+?)(?:\s+by\s+(.+?))?$'),
+    # "Bob is going to prepare"
+    ("going", r'(\w+)\s+is\s+going\s+to\s+(.+?)(?:\s+by\s+(.+?))?$'),
+    # "Alice mentioned she'll complete"
+    ("mentioned", r'(\w+)\s+mentioned\s+(?:she\'ll|he\'ll|they\'ll)\s+(.+?)(?:\s+by\s+(.+?))?$'),
+    # "We need to schedule/complete/finish"
+    ("need", r'we\s+need\s+to\s+(.+?)(?:\s+by\s+(.+?))?$'),
+    # "Someone should/must/has to"
+    ("someone", r'someone\s+(?:should|must|has\s+to)\s+(.+?)(?:\s+by\s+(.+?))?$'),
+    # "Need to" at start
+    ("need", r'^need\s+to\s+(.+?)(?:\s+by\s+(.+?))?$'),
+    # "Schedule/Complete/Finish" at start
+    ("verb", r'^(?:schedule|complete|finish|update|prepare|review|create|send)\s+(.+?)(?:\s+by\s+(.+?))?$'),
+]
+
+
+def _compile_pattern(pattern: str):
+    """
+    Compile an action pattern into a matcher over (text, pos, endpos).
+
+    '^' never matches at a search start position, so anchored patterns are
+    compiled without it and applied with match() instead of search().
+    """
+    if pattern.startswith('^'):
+        return re.compile(pattern[1:], re.IGNORECASE).match
+    return re.compile(pattern, re.IGNORECASE).search
+
+
+COMPILED_PATTERNS = [(family, _compile_pattern(pattern)) for family, pattern in ACTION_PATTERNS]
+
+# Trigger words and the pattern family each one enables
+TRIGGER_FAMILIES = {
+    "will": "will",
+    "should": "should",
+    "need": "need",
+    "agreed": "agreed",
+    "going": "going",
+    "mentioned": "mentioned",
+    "someone": "someone",
+    "schedule": "verb",
+    "complete": "verb",
+    "finish": "verb",
+    "update": "verb",
+    "prepare": "verb",
+    "review": "verb",
+    "create": "verb",
+    "send": "verb",
+}
+
+# One scanner for sentence boundaries and trigger words. Triggers are matched
+# as plain substrings so the prefilter never rejects a sentence that one of
+# the patterns above could match.
+TRIGGER_SCAN = re.compile(
+    r'(?P<end>[.!?\n]+)|(?P<trigger>' + '|'.join(TRIGGER_FAMILIES) + r')',
+    re.IGNORECASE
+)
+
+# The same scanner without IGNORECASE, run over a lowercased copy. Matching
+# case-insensitively costs several times more than the scan itself, which
+# made the prefilter slower than no prefilter when most sentences qualify.
+# Only used for ASCII text, where lower() keeps every offset and folds case
+# exactly as IGNORECASE does.
+LOWER_TRIGGER_SCAN = re.compile(TRIGGER_SCAN.pattern)
+
+
+def candidate_sentences(transcript: str):
+    """
+    Find sentences that could contain an action item, in one pass.
+
+    Splits the transcript on the same boundaries as before and records which
+    trigger families occur in each sentence. Sentences without any trigger
+    word cannot match an action pattern and are skipped. Sentences are
+    returned as offsets into the transcript, without copying any text.
+
+    Args:
+        transcript: The meeting transcript text
+
+    Yields:
+        (start, end, families) tuples
+    """
+    if transcript.isascii():
+        matches = LOWER_TRIGGER_SCAN.finditer(transcript.lower())
+    else:
+        matches = TRIGGER_SCAN.finditer(transcript)
+
+    start = 0
+    families = set()
+    for match in matches:
+        if match.lastgroup == "end":
+            if families:
+                yield start, match.start(), families
+                families = set()
+            start = match.end()
+        else:
+            family = TRIGGER_FAMILIES.get(match.group().casefold())
+            if family is None:
+                # Unusual case-insensitive match (e.g. dotless i), allow everything
+                families.update(TRIGGER_FAMILIES.values())
+            else:
+                families.add(family)
+    if families:
+        yield start, len(transcript), families
+
+
+def strip_span(text: str, start: int, end: int):
+    """Shrink a (start, end) span to exclude leading and trailing whitespace."""
+    while start < end and text[start].isspace():
+        start += 1
+    while end > start and text[end - 1].isspace():
+        end -= 1
+    return start, end
 
 
 def extract_action_items(transcript: str) -> List[Dict[str, Any]]:
@@ -13,51 +136,30 @@ def extract_action_items(transcript: str) -> List[Dict[str, Any]]:
     Extract action items from meeting transcript using pattern matching.
     
     This is a mock implementation that doesn't require any API keys.
-    It uses regex patterns to identify action items.
+    It uses regex patterns to identify action items. A keyword prefilter
+    picks out candidate sentences first, so the full patterns only run
+    where they can succeed. Patterns run directly on offsets into the
+    transcript; only the matched groups are copied out.
     
     Args:
         transcript: The meeting transcript text
         
     Returns:
-        List of dictionaries with task, owner, and due_date fields
+        List of dictionaries with task, owner, due_date, and the
+        source_start/source_end offsets of the originating sentence
     """
     action_items = []
     
-    # Split into sentences
-    sentences = re.split(r'[.!?\n]+', transcript)
-    
-    # Action patterns to look for
-    action_patterns = [
-        # "John will prepare the report"
-        r'(\w+)\s+will\s+(.+?)(?:\s+by\s+(.+?))?$',
-        # "Sarah should review the document"
-        r'(\w+)\s+should\s+(.+?)(?:\s+by\s+(.+?))?$',
-        # "Mike needs to update the slides"
-        r'(\w+)\s+needs?\s+to\s+(.+?)(?:\s+by\s+(.+?))?$',
-        # "Jane agreed to finish the presentation"
-        r'(\w+)\s+agreed\s+to\s+(.+?)(?:\s+by\s+(.+?))?$',
-        # "Bob is going to prepare"
-        r'(\w+)\s+is\s+going\s+to\s+(.+?)(?:\s+by\s+(.+?))?$',
-        # "Alice mentioned she'll complete"
-        r'(\w+)\s+mentioned\s+(?:she\'ll|he\'ll|they\'ll)\s+(.+?)(?:\s+by\s+(.+?))?$',
-        # "We need to schedule/complete/finish"
-        r'we\s+need\s+to\s+(.+?)(?:\s+by\s+(.+?))?$',
-        # "Someone should/must/has to"
-        r'someone\s+(?:should|must|has\s+to)\s+(.+?)(?:\s+by\s+(.+?))?$',
-        # "Need to" at start
-        r'^need\s+to\s+(.+?)(?:\s+by\s+(.+?))?$',
-        # "Schedule/Complete/Finish" at start
-        r'^(?:schedule|complete|finish|update|prepare|review|create|send)\s+(.+?)(?:\s+by\s+(.+?))?$',
-    ]
-    
-    for sentence in sentences:
-        sentence = sentence.strip()
-        if not sentence or len(sentence) < 10:
+    for start, end, families in candidate_sentences(transcript):
+        start, end = strip_span(transcript, start, end)
+        if end - start < 10:
             continue
             
-        # Try each pattern
-        for pattern in action_patterns:
-            match = re.search(pattern, sentence, re.IGNORECASE)
+        # Try each pattern the sentence's trigger words allow
+        for family, find in COMPILED_PATTERNS:
+            if family not in families:
+                continue
+            match = find(transcript, start, end)
             if match:
                 groups = match.groups()
                 
@@ -87,16 +189,18 @@ def extract_action_items(transcript: str) -> List[Dict[str, Any]]:
                 action_items.append({
                     "task": task.capitalize(),
                     "owner": owner,
-                    "due_date": due_date
+                    "due_date": due_date,
+                    "source_start": start,
+                    "source_end": end
                 })
                 break  # Found a match, move to next sentence
     
     return action_items
 
 
-def parse_due_date(date_str: str) -> str:
+def parse_due_date(date_str: str) -> Optional[date]:
     """
-    Parse various date formats into YYYY-MM-DD.
+    Parse various date formats into a date.
     
     Handles:
     - "Friday", "Monday" -> next occurrence
@@ -115,7 +219,7 @@ def parse_due_date(date_str: str) -> str:
     # Handle relative dates
     if "tomorrow" in date_str:
         target_date = today + timedelta(days=1)
-        return target_date.strftime("%Y-%m-%d")
+        return target_date.date()
     
     if "this week" in date_str or "week" in date_str:
         # End of week (Friday)
@@ -123,12 +227,12 @@ def parse_due_date(date_str: str) -> str:
         if days_until_friday == 0:
             days_until_friday = 7
         target_date = today + timedelta(days=days_until_friday)
-        return target_date.strftime("%Y-%m-%d")
+        return target_date.date()
     
     if "next week" in date_str:
         days_until_friday = (4 - today.weekday()) % 7 + 7
         target_date = today + timedelta(days=days_until_friday)
-        return target_date.strftime("%Y-%m-%d")
+        return target_date.date()
     
     if "end of month" in date_str or "month" in date_str:
         # Last day of current month
@@ -136,7 +240,7 @@ def parse_due_date(date_str: str) -> str:
             target_date = datetime(today.year + 1, 1, 1) - timedelta(days=1)
         else:
             target_date = datetime(today.year, today.month + 1, 1) - timedelta(days=1)
-        return target_date.strftime("%Y-%m-%d")
+        return target_date.date()
     
     # Handle day names
     days_of_week = {
@@ -150,7 +254,7 @@ def parse_due_date(date_str: str) -> str:
             if days_ahead == 0:
                 days_ahead = 7  # Next occurrence
             target_date = today + timedelta(days=days_ahead)
-            return target_date.strftime("%Y-%m-%d")
+            return target_date.date()
     
     # Try to match date patterns like "Dec 20", "December 20", "12/20"
     month_names = {
@@ -173,13 +277,17 @@ def parse_due_date(date_str: str) -> str:
                     target_date = datetime(year, month_num, day)
                     if target_date < today:
                         target_date = datetime(year + 1, month_num, day)
-                    return target_date.strftime("%Y-%m-%d")
+                    return target_date.date()
                 except ValueError:
                     pass
     
     # Check if already in YYYY-MM-DD format
-    if re.match(r'\d{4}-\d{2}-\d{2}', date_str):
-        return date_str
+    iso_match = re.match(r'\d{4}-\d{2}-\d{2}', date_str)
+    if iso_match:
+        try:
+            return date.fromisoformat(iso_match.group())
+        except ValueError:
+            pass
     
     return None
 
@@ -1,23 +1,61 @@
 """Main FastAPI application."""
-from fastapi import FastAPI, HTTPException, Depends, Request
+from fastapi import FastAPI, HTTPException, Depends, Request, UploadFile, File
+from fastapi.concurrency import run_in_threadpool
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
-from fastapi.responses import HTMLResponse, JSONResponse
-from sqlalchemy.orm import Session
-from typing import List
+from fastapi.responses import HTMLResponse, JSONResponse, StreamingResponse, Response
+from pydantic import TypeAdapter
+from sqlalchemy import and_, case, func, literal, tuple_
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
+from sqlalchemy.orm.exc import StaleDataError
+from sqlalchemy.orm import Session, load_only, selectinload
+from typing import List, Optional
+from datetime import date, datetime
+import base64
+import io
+import json
 import os
+import time
 
-from app.database import get_db, init_db
-from app.models import Transcript, Task
+from app.database import (
+    get_db, get_read_db, get_workspace, init_db, wrote_recently, is_valid_workspace,
+    session_factory, read_session_factory, LAST_WRITE_COOKIE, WORKSPACE_COOKIE
+)
+from app.models import Transcript, Task, ArchivedTranscript, Owner, TaskStats
 from app.schemas import (
     TranscriptCreate,
     TranscriptResponse,
+    TranscriptSummary,
     TaskResponse,
+    TaskPage,
     TaskUpdate,
+    TaskSelection,
+    TaskMutationBatch,
+    TaskMutationResult,
+    TaskConflict,
+    BulkTaskUpdate,
+    BulkTaskResult,
+    ArchivedTranscriptSummary,
+    OwnerSummary,
+    OwnerResponse,
+    OwnerAliasCreate,
+    ArchivedTranscriptResponse,
     ProcessTranscriptResponse,
+    TaskStatsResponse,
     StatusResponse
 )
 from app.llm import extract_action_items, check_llm_health
+from app.dedup import task_fingerprint, find_open_duplicates, merge_into
+from app.owners import owner_directory, normalize_owner
+from app import transfer
+from app.retention import load_archived_transcript
+from app.cache import response_cache, invalidate, workspace_namespaces
+from app import admission
+from app.admission import extraction_admission, Overloaded
+from app import idempotency
+from app.idempotency import IdempotencyError
+from app import scheduler
+from app.scheduler import task_counts
 
 # Initialize FastAPI app
 app = FastAPI(
@@ -26,6 +64,13 @@ app = FastAPI(
     version="1.0.0"
 )
 
+# Serializers for cached listing responses
+task_list_adapter = TypeAdapter(List[TaskResponse])
+transcript_list_adapter = TypeAdapter(List[TranscriptSummary])
+
+# Largest page GET /api/tasks/page will return
+MAX_PAGE_SIZE = 200
+
 # Mount static files and templates
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 templates = Jinja2Templates(directory=os.path.join(BASE_DIR, "templates"))
@@ -41,74 +86,223 @@ def startup_event():
         print(f"Database initialization failed: {e}")
         # Continue anyway, let requests fail if DB is down
 
+    if scheduler.SCHEDULER_ENABLED:
+        scheduler.scheduler.start()
+
+
+@app.on_event("shutdown")
+def shutdown_event():
+    """Stop the maintenance scheduler, if it runs in this process."""
+    if scheduler.SCHEDULER_ENABLED:
+        scheduler.scheduler.stop()
+
+
+@app.middleware("http")
+async def limit_transcript_size(request: Request, call_next):
+    """Reject oversized transcript submissions before the body is read."""
+    if request.method == "POST" and request.url.path == "/api/transcripts":
+        content_length = request.headers.get("content-length")
+        if content_length:
+            try:
+                size = int(content_length)
+            except ValueError:
+                return JSONResponse(status_code=400, content={"detail": "Invalid Content-Length header"})
+            # JSON escaping can inflate the text, so allow the body some headroom
+            if size > admission.MAX_TRANSCRIPT_BYTES * 2:
+                return JSONResponse(status_code=413, content={"detail": "Transcript is too large"})
+    return await call_next(request)
+
+
+@app.middleware("http")
+async def track_writes(request: Request, call_next):
+    """Remember when a client last wrote, so its reads can go to the primary."""
+    response = await call_next(request)
+    if request.method in ("POST", "PATCH", "PUT", "DELETE") and response.status_code < 400:
+        response.set_cookie(LAST_WRITE_COOKIE, str(time.time()), httponly=True, samesite="lax")
+    return response
+
 
 # HTML Routes
 @app.get("/", response_class=HTMLResponse)
-async def home(request: Request):
-    """Serve the home page."""
-    return templates.TemplateResponse("index.html", {"request": request})
+async def home(request: Request, workspace: Optional[str] = None):
+    """Serve the home page; ?workspace=name switches the browser to a workspace."""
+    response = templates.TemplateResponse("index.html", {"request": request})
+    if workspace is not None:
+        if not is_valid_workspace(workspace):
+            raise HTTPException(status_code=400, detail="Invalid workspace")
+        response.set_cookie(WORKSPACE_COOKIE, workspace, samesite="lax")
+    return response
 
 
 # API Routes
 @app.post("/api/transcripts", response_model=ProcessTranscriptResponse)
 async def process_transcript(
     transcript_data: TranscriptCreate,
+    request: Request,
+    workspace: str = Depends(get_workspace),
     db: Session = Depends(get_db)
 ):
     """
     Process a meeting transcript and extract action items.
+
+    At most MAX_CONCURRENT_EXTRACTIONS transcripts are processed at once;
+    further requests wait in a bounded queue or are turned away.
+
+    With an Idempotency-Key header, a retried request gets the stored
+    response of the first one instead of being processed again.
     
     Args:
         transcript_data: The transcript text
+        request: Incoming request, for the Idempotency-Key header
+        workspace: Workspace the transcript belongs to
         db: Database session
         
     Returns:
         Transcript ID and extracted tasks
         
     Raises:
-        HTTPException: If transcript is empty or LLM processing fails
+        HTTPException: If transcript is empty or too large, the idempotency
+            key is invalid or busy, the service is saturated, or LLM
+            processing fails
     """
     # Validate transcript is not empty
     if not transcript_data.text.strip():
         raise HTTPException(status_code=400, detail="Transcript cannot be empty")
+    if len(transcript_data.text.encode("utf-8")) > admission.MAX_TRANSCRIPT_BYTES:
+        raise HTTPException(status_code=413, detail="Transcript is too large")
+
+    key = request.headers.get("Idempotency-Key")
+    if key is None:
+        return await run_extraction(db, transcript_data.text, workspace)
+
+    body_hash = idempotency.request_hash(transcript_data.text)
+    try:
+        key = idempotency.scoped_key(workspace, key)
+        while True:
+            record = await run_in_threadpool(idempotency.claim, db, key, body_hash)
+            if record is not None and record.status == "pending":
+                record = await idempotency.wait_for_completion(key, workspace)
+                if record is None:
+                    # The first request failed and gave the key up
+                    continue
+            break
+    except IdempotencyError as e:
+        raise HTTPException(status_code=e.status_code, detail=e.detail)
+
+    if record is not None:
+        return Response(
+            content=record.response_body,
+            status_code=record.status_code,
+            media_type="application/json",
+            headers={"Idempotent-Replayed": "true"}
+        )
+
+    try:
+        return await run_extraction(db, transcript_data.text, workspace, key)
+    except Exception:
+        await run_in_threadpool(idempotency.release, db, key)
+        raise
+
+
+async def run_extraction(
+    db: Session, text: str, workspace: str, idempotency_key: Optional[str] = None
+) -> ProcessTranscriptResponse:
+    """
+    Process a transcript once an extraction slot is free.
+
+    Raises:
+        HTTPException: 503 with Retry-After if no slot can be had
+    """
+    try:
+        async with extraction_admission.slot():
+            return await run_in_threadpool(store_transcript, db, text, workspace, idempotency_key)
+    except Overloaded as e:
+        raise HTTPException(
+            status_code=503,
+            detail=e.detail,
+            headers={"Retry-After": str(e.retry_after)}
+        )
+
+
+def store_transcript(
+    db: Session, text: str, workspace: str, idempotency_key: Optional[str] = None
+) -> ProcessTranscriptResponse:
+    """
+    Extract action items from a transcript and save both.
+
+    Args:
+        db: Database session
+        text: The transcript text
+        workspace: Workspace the transcript belongs to
+        idempotency_key: Claimed key to store the response under, if any
+
+    Returns:
+        Transcript ID and extracted tasks
 
+    Raises:
+        HTTPException: If LLM processing or saving fails
+    """
     try:
         # Extract action items using LLM
-        action_items = extract_action_items(transcript_data.text)
+        action_items = extract_action_items(text)
+
+        # New owners join this transaction, so a failed save leaves none behind
+        owner_ids = resolve_owners(db, workspace, [item["owner"] for item in action_items])
 
         # Save transcript to database
-        transcript = Transcript(text=transcript_data.text)
+        transcript = Transcript(text=text, workspace=workspace)
         db.add(transcript)
-        db.commit()
-        db.refresh(transcript)
+        db.flush()
 
-        # Save tasks to database
+        # Save tasks to database, merging items that duplicate an open task
+        fingerprints = [task_fingerprint(item["task"], item["owner"]) for item in action_items]
+        open_tasks = find_open_duplicates(db, fingerprints, workspace)
         tasks = []
-        for item in action_items:
+        for item, fingerprint in zip(action_items, fingerprints):
+            task = open_tasks.get(fingerprint)
+            if task is not None:
+                merge_into(task, item["due_date"])
+                if task not in tasks:
+                    tasks.append(task)
+                continue
+
             task = Task(
                 transcript_id=transcript.id,
+                workspace=workspace,
                 task=item["task"],
                 owner=item["owner"],
+                owner_id=owner_ids.get(item["owner"]),
                 due_date=item["due_date"],
-                status="open"
+                status="open",
+                fingerprint=fingerprint,
+                source_start=item["source_start"],
+                source_end=item["source_end"]
             )
             db.add(task)
             tasks.append(task)
+            open_tasks[fingerprint] = task
 
-        db.commit()
-
-        # Refresh tasks to get IDs
-        for task in tasks:
-            db.refresh(task)
+        # Flush to get task IDs
+        db.flush()
 
         # Convert to response schema
         task_responses = [TaskResponse.model_validate(task) for task in tasks]
-
-        return ProcessTranscriptResponse(
+        response = ProcessTranscriptResponse(
             transcript_id=transcript.id,
             tasks=task_responses
         )
 
+        # Stored in the same transaction, so a retry sees it only if the write landed
+        if idempotency_key is not None:
+            idempotency.record_response(db, idempotency_key, 200, response.model_dump_json())
+
+        invalidate(db, *workspace_namespaces(workspace, "tasks", "transcripts"))
+        db.commit()
+
+        return response
+
+    except HTTPException:
+        raise
     except Exception as e:
         db.rollback()
         raise HTTPException(status_code=500, detail=f"Failed to process transcript: {str(e)}")
@@ -117,36 +311,386 @@ async def process_transcript(
 @app.get("/api/tasks", response_model=List[TaskResponse])
 async def get_tasks(
     status: str = None,
-    db: Session = Depends(get_db)
+    due_before: Optional[date] = None,
+    due_after: Optional[date] = None,
+    overdue: bool = False,
+    sort: str = "created_at",
+    workspace: str = Depends(get_workspace),
+    db: Session = Depends(get_read_db)
 ):
     """
-    Get all tasks with optional status filter.
+    Get all tasks with optional status and due date filters.
+
+    Due date filters are answered from the (workspace, status, due_date) index.
+    Responses are cached until the next task write.
     
     Args:
         status: Filter by status (open/done)
+        due_before: Only tasks due on or before this date
+        due_after: Only tasks due on or after this date
+        overdue: Only open tasks whose due date has passed
+        sort: "created_at" (newest first, default) or "due_date" (soonest first)
+        workspace: Workspace to list
         db: Database session
         
     Returns:
         List of tasks
     """
-    query = db.query(Task)
-    
+    if status and status not in ["open", "done"]:
+        raise HTTPException(status_code=400, detail="Status must be 'open' or 'done'")
+    if sort not in ["created_at", "due_date"]:
+        raise HTTPException(status_code=400, detail="Sort must be 'created_at' or 'due_date'")
+
+    params = {
+        "status": status,
+        "due_before": due_before,
+        "due_after": due_after,
+        # Cache keys carry today's date too, see app/cache.py
+        "overdue": overdue,
+        "sort": sort,
+    }
+    body = response_cache.get_or_build(
+        db, ("tasks", *workspace_namespaces(workspace, "tasks")), params,
+        lambda: task_list_adapter.dump_json(
+            list_tasks(db, workspace, status, due_before, due_after, overdue, sort)
+        )
+    )
+    return Response(content=body, media_type="application/json")
+
+
+@app.get("/api/tasks/page", response_model=TaskPage)
+async def get_task_page(
+    status: str = None,
+    sort: str = "created_at",
+    limit: int = 50,
+    cursor: Optional[str] = None,
+    workspace: str = Depends(get_workspace),
+    db: Session = Depends(get_read_db)
+):
+    """
+    Get one page of tasks, for incremental loading.
+
+    Pages are fetched with keyset pagination: each page continues after the
+    last row of the previous one, as a range scan of a workspace-leading
+    index ending in (sort column, id), so every page costs the same however
+    deep the client scrolls.
+
+    Args:
+        status: Filter by status (open/done)
+        sort: "created_at" (newest first, default) or "due_date" (soonest first)
+        limit: Page size (1-200, default 50)
+        cursor: next_cursor from the previous page
+        workspace: Workspace to list
+        db: Database session
+
+    Returns:
+        The page of tasks and the cursor for the next page, if any
+    """
+    if status and status not in ["open", "done"]:
+        raise HTTPException(status_code=400, detail="Status must be 'open' or 'done'")
+    if sort not in ["created_at", "due_date"]:
+        raise HTTPException(status_code=400, detail="Sort must be 'created_at' or 'due_date'")
+    if not 1 <= limit <= MAX_PAGE_SIZE:
+        raise HTTPException(status_code=400, detail=f"Limit must be between 1 and {MAX_PAGE_SIZE}")
+    after = decode_cursor(cursor, sort) if cursor else None
+
+    def build():
+        tasks = list_tasks(
+            db, workspace, status, None, None, False, sort, limit=limit + 1, after=after
+        )
+        next_cursor = encode_cursor(tasks[limit - 1], sort) if len(tasks) > limit else None
+        return TaskPage(tasks=tasks[:limit], next_cursor=next_cursor).model_dump_json().encode()
+
+    params = {"status": status, "sort": sort, "limit": limit, "cursor": cursor}
+    body = response_cache.get_or_build(
+        db, ("tasks", *workspace_namespaces(workspace, "tasks")), params, build
+    )
+    return Response(content=body, media_type="application/json")
+
+
+def encode_cursor(task: TaskResponse, sort: str) -> str:
+    """Opaque cursor pointing just after a task in the given sort order."""
+    value = task.due_date if sort == "due_date" else task.created_at
+    raw = json.dumps([value.isoformat() if value is not None else None, task.id])
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def decode_cursor(cursor: str, sort: str):
+    """
+    Decode a cursor from encode_cursor().
+
+    Raises:
+        HTTPException: If the cursor is malformed
+    """
+    try:
+        value, task_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        if value is not None:
+            value = date.fromisoformat(value) if sort == "due_date" else datetime.fromisoformat(value)
+        return value, int(task_id)
+    except (ValueError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+def list_tasks(
+    db: Session,
+    workspace: str,
+    status: Optional[str],
+    due_before: Optional[date],
+    due_after: Optional[date],
+    overdue: bool,
+    sort: str,
+    limit: Optional[int] = None,
+    after: Optional[tuple] = None
+) -> List[TaskResponse]:
+    """
+    Run the task listing query behind GET /api/tasks and /api/tasks/page.
+
+    Args:
+        limit: Maximum number of rows
+        after: (sort value, id) of the row to continue after, see decode_cursor()
+    """
+    query = db.query(Task).filter(Task.workspace == workspace)
+
     if status:
-        if status not in ["open", "done"]:
-            raise HTTPException(status_code=400, detail="Status must be 'open' or 'done'")
         query = query.filter(Task.status == status)
-    
-    tasks = query.order_by(Task.created_at.desc()).all()
+    if overdue:
+        # Judged by today's date, not the stored flag, which only the scheduler
+        # moves on as days pass; served by the (workspace, status, due_date) index
+        query = query.filter(Task.status == "open", Task.due_date < date.today())
+    if due_before is not None:
+        query = query.filter(Task.due_date <= due_before)
+    if due_after is not None:
+        query = query.filter(Task.due_date >= due_after)
+    if (due_before or due_after) and not status and not overdue:
+        # Spell out every status so the (workspace, status, due_date) index stays usable
+        query = query.filter(Task.status.in_(["open", "done"]))
+
+    if sort == "due_date":
+        # Dated tasks first, then undated ones. Each part is a range of a
+        # (..., due_date, id) index, so pages never sort the whole workspace.
+        dated = query.filter(Task.due_date.isnot(None))
+        undated = query.filter(Task.due_date.is_(None))
+        if after is not None:
+            value, task_id = after
+            if value is None:
+                dated = None
+                undated = undated.filter(Task.id > task_id)
+            else:
+                dated = dated.filter(tuple_(Task.due_date, Task.id) > tuple_(value, task_id))
+
+        tasks = []
+        if dated is not None:
+            tasks = _limit(dated.order_by(Task.due_date, Task.id), limit).all()
+        if limit is None or len(tasks) < limit:
+            rest = None if limit is None else limit - len(tasks)
+            tasks += _limit(undated.order_by(Task.id), rest).all()
+    else:
+        if after is not None:
+            query = query.filter(tuple_(Task.created_at, Task.id) < tuple_(*after))
+        query = query.order_by(Task.created_at.desc(), Task.id.desc())
+        tasks = _limit(query, limit).all()
+
     return [TaskResponse.model_validate(task) for task in tasks]
 
 
+def _limit(query, limit: Optional[int]):
+    return query if limit is None else query.limit(limit)
+
+
+def select_tasks(db: Session, selection: TaskSelection, workspace: str):
+    """
+    Build a query for the workspace's tasks matched by a bulk selection.
+
+    Raises:
+        HTTPException: If the selection has no ids and no filter, which
+            would otherwise match every task
+    """
+    query = db.query(Task)
+    if selection.ids is not None:
+        query = query.filter(Task.id.in_(selection.ids))
+    if selection.transcript_id is not None:
+        query = query.filter(Task.transcript_id == selection.transcript_id)
+    if selection.status is not None:
+        query = query.filter(Task.status == selection.status)
+    if selection.owner is not None:
+        query = query.filter(Task.owner == selection.owner)
+
+    if query.whereclause is None:
+        raise HTTPException(status_code=400, detail="Provide task ids or at least one filter")
+    return query.filter(Task.workspace == workspace)
+
+
+@app.patch("/api/tasks", response_model=BulkTaskResult)
+async def update_tasks(
+    bulk_update: BulkTaskUpdate,
+    workspace: str = Depends(get_workspace),
+    db: Session = Depends(get_db)
+):
+    """
+    Update many tasks with a single UPDATE statement.
+
+    Args:
+        bulk_update: Task ids and/or filter, plus the fields to set
+        workspace: Workspace of the tasks
+        db: Database session
+
+    Returns:
+        Number of tasks updated
+
+    Raises:
+        HTTPException: If no selection or no changes were given
+    """
+    changes = bulk_update.changes.model_dump(exclude_unset=True)
+    if not changes:
+        raise HTTPException(status_code=400, detail="No changes provided")
+
+    if "status" in changes or "due_date" in changes:
+        # Recompute the overdue flag from the new values
+        status = literal(changes["status"]) if "status" in changes else Task.status
+        due_date = literal(changes["due_date"]) if "due_date" in changes else Task.due_date
+        changes["overdue"] = case(
+            (and_(status == "open", due_date < date.today()), True), else_=False
+        )
+    changes["version"] = Task.version + 1
+    affected = select_tasks(db, bulk_update, workspace).update(changes, synchronize_session=False)
+    invalidate(db, *workspace_namespaces(workspace, "tasks", "transcripts"))
+    db.commit()
+    return BulkTaskResult(affected=affected)
+
+
+@app.delete("/api/tasks", response_model=BulkTaskResult)
+async def delete_tasks(
+    selection: TaskSelection,
+    workspace: str = Depends(get_workspace),
+    db: Session = Depends(get_db)
+):
+    """
+    Delete many tasks with a single DELETE statement.
+
+    Args:
+        selection: Task ids and/or filter
+        workspace: Workspace of the tasks
+        db: Database session
+
+    Returns:
+        Number of tasks deleted
+
+    Raises:
+        HTTPException: If no selection was given
+    """
+    affected = select_tasks(db, selection, workspace).delete(synchronize_session=False)
+    invalidate(db, *workspace_namespaces(workspace, "tasks", "transcripts"))
+    db.commit()
+    return BulkTaskResult(affected=affected)
+
+
+def resolve_owners(db: Session, workspace: str, names: List[Optional[str]]) -> dict:
+    """
+    Resolve owner names inside the request's transaction.
+
+    Owners created here are rolled back with the request if it fails.
+
+    Raises:
+        HTTPException: If another request created the same owner meanwhile
+    """
+    try:
+        return owner_directory.resolve(db, workspace, names, commit=False)
+    except IntegrityError:
+        db.rollback()
+        raise HTTPException(status_code=409, detail="Owner was created concurrently, retry")
+
+
+@app.post("/api/tasks/mutations", response_model=TaskMutationResult)
+async def apply_task_mutations(
+    batch: TaskMutationBatch,
+    workspace: str = Depends(get_workspace),
+    db: Session = Depends(get_db)
+):
+    """
+    Apply a batch of queued task changes in one transaction.
+
+    Each change carries the task version the client last saw. Changes to
+    tasks whose version has moved on (or that were deleted) are skipped and
+    returned as conflicts, with the current row, for the client to resolve.
+
+    Args:
+        batch: Task changes, at most one per task
+        workspace: Workspace of the tasks
+        db: Database session
+
+    Returns:
+        The updated tasks and any conflicts
+
+    Raises:
+        HTTPException: If a task appears twice, or a concurrent write
+            interleaved with this batch
+    """
+    ids = [mutation.id for mutation in batch.mutations]
+    if len(set(ids)) != len(ids):
+        raise HTTPException(status_code=400, detail="Each task may appear only once per batch")
+
+    tasks = {
+        task.id: task
+        for task in db.query(Task)
+        .filter(Task.workspace == workspace, Task.id.in_(ids))
+        .with_for_update()
+    }
+
+    applicable = []
+    conflicts = []
+    for mutation in batch.mutations:
+        task = tasks.get(mutation.id)
+        if task is None or task.version != mutation.version:
+            conflicts.append(TaskConflict(
+                id=mutation.id,
+                current=TaskResponse.model_validate(task) if task is not None else None
+            ))
+        else:
+            applicable.append((mutation, task))
+
+    # New owners join this transaction, so they are only kept if the batch commits
+    owner_ids = resolve_owners(db, workspace, [
+        mutation.changes.owner for mutation, _ in applicable
+        if "owner" in mutation.changes.model_fields_set
+    ])
+
+    updated = []
+    for mutation, task in applicable:
+        update_data = mutation.changes.model_dump(exclude_unset=True)
+        for field, value in update_data.items():
+            setattr(task, field, value)
+        if "owner" in update_data:
+            task.owner_id = owner_ids.get(task.owner)
+        if "task" in update_data or "owner" in update_data:
+            task.fingerprint = task_fingerprint(task.task, task.owner)
+        if db.is_modified(task):
+            updated.append(task)
+
+    if updated:
+        try:
+            db.flush()
+        except StaleDataError:
+            db.rollback()
+            raise HTTPException(status_code=409, detail="Tasks changed during the update, retry the batch")
+        invalidate(db, *workspace_namespaces(workspace, "tasks", "transcripts"))
+    task_responses = [TaskResponse.model_validate(task) for task in updated]
+    db.commit()
+
+    return TaskMutationResult(tasks=task_responses, conflicts=conflicts)
+
+
 @app.get("/api/tasks/{task_id}", response_model=TaskResponse)
-async def get_task(task_id: int, db: Session = Depends(get_db)):
+async def get_task(
+    task_id: int,
+    workspace: str = Depends(get_workspace),
+    db: Session = Depends(get_read_db)
+):
     """
     Get a specific task by ID.
     
     Args:
         task_id: Task ID
+        workspace: Workspace of the task
         db: Database session
         
     Returns:
@@ -155,7 +699,7 @@ async def get_task(task_id: int, db: Session = Depends(get_db)):
     Raises:
         HTTPException: If task not found
     """
-    task = db.query(Task).filter(Task.id == task_id).first()
+    task = db.query(Task).filter(Task.id == task_id, Task.workspace == workspace).first()
     if not task:
         raise HTTPException(status_code=404, detail="Task not found")
     return TaskResponse.model_validate(task)
@@ -165,6 +709,7 @@ async def get_task(task_id: int, db: Session = Depends(get_db)):
 async def update_task(
     task_id: int,
     task_update: TaskUpdate,
+    workspace: str = Depends(get_workspace),
     db: Session = Depends(get_db)
 ):
     """
@@ -173,69 +718,472 @@ async def update_task(
     Args:
         task_id: Task ID
         task_update: Fields to update
+        workspace: Workspace of the task
         db: Database session
         
     Returns:
         Updated task
         
     Raises:
-        HTTPException: If task not found
+        HTTPException: If task not found, or it changed concurrently
     """
-    task = db.query(Task).filter(Task.id == task_id).first()
+    update_data = task_update.model_dump(exclude_unset=True)
+    task = db.query(Task).filter(Task.id == task_id, Task.workspace == workspace).first()
     if not task:
         raise HTTPException(status_code=404, detail="Task not found")
 
+    owner_ids = {}
+    if "owner" in update_data:
+        owner_ids = resolve_owners(db, workspace, [update_data["owner"]])
+
     # Update fields if provided
-    update_data = task_update.model_dump(exclude_unset=True)
     for field, value in update_data.items():
         setattr(task, field, value)
+    if "owner" in update_data:
+        task.owner_id = owner_ids.get(task.owner)
+    if "task" in update_data or "owner" in update_data:
+        task.fingerprint = task_fingerprint(task.task, task.owner)
 
-    db.commit()
+    invalidate(db, *workspace_namespaces(workspace, "tasks", "transcripts"))
+    try:
+        db.commit()
+    except StaleDataError:
+        db.rollback()
+        raise HTTPException(status_code=409, detail="Task changed during the update, retry")
     db.refresh(task)
     return TaskResponse.model_validate(task)
 
 
 @app.delete("/api/tasks/{task_id}")
-async def delete_task(task_id: int, db: Session = Depends(get_db)):
+async def delete_task(
+    task_id: int,
+    workspace: str = Depends(get_workspace),
+    db: Session = Depends(get_db)
+):
     """
     Delete a task.
     
     Args:
         task_id: Task ID
+        workspace: Workspace of the task
         db: Database session
         
     Returns:
         Success message
         
     Raises:
-        HTTPException: If task not found
+        HTTPException: If task not found, or it changed concurrently
     """
-    task = db.query(Task).filter(Task.id == task_id).first()
+    task = db.query(Task).filter(Task.id == task_id, Task.workspace == workspace).first()
     if not task:
         raise HTTPException(status_code=404, detail="Task not found")
 
     db.delete(task)
-    db.commit()
+    invalidate(db, *workspace_namespaces(workspace, "tasks", "transcripts"))
+    try:
+        db.commit()
+    except StaleDataError:
+        db.rollback()
+        raise HTTPException(status_code=409, detail="Task changed during the delete, retry")
     return {"message": "Task deleted successfully"}
 
 
-@app.get("/api/transcripts", response_model=List[TranscriptResponse])
-async def get_transcripts(limit: int = 5, db: Session = Depends(get_db)):
+@app.get("/api/owners", response_model=List[OwnerSummary])
+async def get_owners(
+    workspace: str = Depends(get_workspace),
+    db: Session = Depends(get_read_db)
+):
+    """
+    List owners with their open and done task counts.
+
+    The counts come from one GROUP BY over the (workspace, owner_id, status)
+    index.
+
+    Args:
+        workspace: Workspace to list
+        db: Database session
+
+    Returns:
+        Owners sorted by name
+    """
+    counts = {}
+    for owner_id, status, count in (
+        db.query(Task.owner_id, Task.status, func.count())
+        .filter(Task.workspace == workspace, Task.owner_id.isnot(None))
+        .group_by(Task.owner_id, Task.status)
+    ):
+        counts[(owner_id, status)] = count
+
+    owners = db.query(Owner).filter(Owner.workspace == workspace).order_by(Owner.name).all()
+    return [
+        OwnerSummary(
+            id=owner.id,
+            name=owner.name,
+            open_tasks=counts.get((owner.id, "open"), 0),
+            done_tasks=counts.get((owner.id, "done"), 0)
+        )
+        for owner in owners
+    ]
+
+
+def get_workspace_owner(db: Session, owner_id: int, workspace: str) -> Owner:
+    """
+    Load an owner of the workspace.
+
+    Raises:
+        HTTPException: If the owner does not exist in the workspace
+    """
+    owner = db.query(Owner).filter(Owner.id == owner_id, Owner.workspace == workspace).first()
+    if not owner:
+        raise HTTPException(status_code=404, detail="Owner not found")
+    return owner
+
+
+@app.get("/api/owners/{owner_id}", response_model=OwnerResponse)
+async def get_owner(
+    owner_id: int,
+    workspace: str = Depends(get_workspace),
+    db: Session = Depends(get_read_db)
+):
+    """
+    Get an owner and its aliases.
+
+    Args:
+        owner_id: Owner ID
+        workspace: Workspace of the owner
+        db: Database session
+
+    Returns:
+        Owner details
+
+    Raises:
+        HTTPException: If owner not found
+    """
+    owner = get_workspace_owner(db, owner_id, workspace)
+    return OwnerResponse(id=owner.id, name=owner.name, aliases=sorted(a.alias for a in owner.aliases))
+
+
+@app.get("/api/owners/{owner_id}/tasks", response_model=List[TaskResponse])
+async def get_owner_tasks(
+    owner_id: int,
+    status: str = None,
+    workspace: str = Depends(get_workspace),
+    db: Session = Depends(get_read_db)
+):
+    """
+    Get the tasks of one owner, newest first.
+
+    Args:
+        owner_id: Owner ID
+        status: Filter by status (open/done)
+        workspace: Workspace of the owner
+        db: Database session
+
+    Returns:
+        List of tasks
+
+    Raises:
+        HTTPException: If owner not found or status is invalid
+    """
+    if status and status not in ["open", "done"]:
+        raise HTTPException(status_code=400, detail="Status must be 'open' or 'done'")
+    get_workspace_owner(db, owner_id, workspace)
+
+    query = db.query(Task).filter(Task.workspace == workspace, Task.owner_id == owner_id)
+    if status:
+        query = query.filter(Task.status == status)
+    tasks = query.order_by(Task.created_at.desc()).all()
+    return [TaskResponse.model_validate(task) for task in tasks]
+
+
+@app.post("/api/owners/{owner_id}/aliases", response_model=OwnerResponse)
+async def add_owner_alias(
+    owner_id: int,
+    alias_data: OwnerAliasCreate,
+    workspace: str = Depends(get_workspace),
+    db: Session = Depends(get_db)
+):
+    """
+    Make another spelling of a name resolve to an owner.
+
+    Only affects tasks created or reassigned afterwards.
+
+    Args:
+        owner_id: Owner ID
+        alias_data: The alias to add
+        workspace: Workspace of the owner
+        db: Database session
+
+    Returns:
+        Owner details with the new alias
+
+    Raises:
+        HTTPException: If owner not found, or the alias is empty or in use
+    """
+    if not normalize_owner(alias_data.alias):
+        raise HTTPException(status_code=400, detail="Alias cannot be empty")
+    owner = get_workspace_owner(db, owner_id, workspace)
+    try:
+        owner_directory.add_alias(db, owner, alias_data.alias)
+    except ValueError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+
+    db.refresh(owner)
+    return OwnerResponse(id=owner.id, name=owner.name, aliases=sorted(a.alias for a in owner.aliases))
+
+
+@app.get("/api/transcripts", response_model=List[TranscriptSummary])
+async def get_transcripts(
+    limit: int = 5,
+    workspace: str = Depends(get_workspace),
+    db: Session = Depends(get_read_db)
+):
     """
     Get recent transcripts with their tasks.
+
+    Only the stored preview and length are loaded, never the full text.
+    Responses are cached until the next transcript or task write.
     
     Args:
         limit: Number of transcripts to return (default 5)
+        workspace: Workspace to list
         db: Database session
         
     Returns:
-        List of transcripts with tasks
+        List of transcript summaries with tasks
+    """
+    def build():
+        transcripts = db.query(Transcript).options(
+            load_only(Transcript.id, Transcript.preview, Transcript.text_length, Transcript.created_at),
+            selectinload(Transcript.tasks)
+        ).filter(
+            Transcript.workspace == workspace
+        ).order_by(
+            Transcript.created_at.desc()
+        ).limit(limit).all()
+        return transcript_list_adapter.dump_json(
+            [TranscriptSummary.model_validate(t) for t in transcripts]
+        )
+
+    body = response_cache.get_or_build(
+        db, ("transcripts", *workspace_namespaces(workspace, "transcripts")), {"limit": limit}, build
+    )
+    return Response(content=body, media_type="application/json")
+
+
+@app.get("/api/transcripts/{transcript_id}", response_model=TranscriptResponse)
+async def get_transcript(
+    transcript_id: int,
+    workspace: str = Depends(get_workspace),
+    db: Session = Depends(get_read_db)
+):
+    """
+    Get a transcript with its full text and tasks.
+
+    Args:
+        transcript_id: Transcript ID
+        workspace: Workspace of the transcript
+        db: Database session
+
+    Returns:
+        Transcript details
+
+    Raises:
+        HTTPException: If transcript not found
+    """
+    transcript = db.query(Transcript).filter(
+        Transcript.id == transcript_id, Transcript.workspace == workspace
+    ).first()
+    if not transcript:
+        raise HTTPException(status_code=404, detail="Transcript not found")
+    return TranscriptResponse.model_validate(transcript)
+
+
+@app.get("/api/archive/transcripts", response_model=List[ArchivedTranscriptSummary])
+async def get_archived_transcripts(
+    limit: int = 20,
+    workspace: str = Depends(get_workspace),
+    db: Session = Depends(get_read_db)
+):
+    """
+    List archived transcripts without decompressing them.
+
+    Args:
+        limit: Number of archived transcripts to return (default 20)
+        workspace: Workspace to list
+        db: Database session
+
+    Returns:
+        Archived transcript metadata, most recently created first
     """
-    transcripts = db.query(Transcript).order_by(
-        Transcript.created_at.desc()
+    archived = db.query(ArchivedTranscript).filter(
+        ArchivedTranscript.workspace == workspace
+    ).order_by(
+        ArchivedTranscript.created_at.desc()
     ).limit(limit).all()
-    
-    return [TranscriptResponse.model_validate(t) for t in transcripts]
+    return [ArchivedTranscriptSummary.model_validate(a) for a in archived]
+
+
+@app.get("/api/archive/transcripts/{transcript_id}", response_model=ArchivedTranscriptResponse)
+async def get_archived_transcript(
+    transcript_id: int,
+    workspace: str = Depends(get_workspace),
+    db: Session = Depends(get_read_db)
+):
+    """
+    Restore an archived transcript and its tasks.
+
+    Args:
+        transcript_id: Original transcript ID
+        workspace: Workspace of the transcript
+        db: Database session
+
+    Returns:
+        Transcript text and tasks as they were when archived
+
+    Raises:
+        HTTPException: If the transcript is not archived
+    """
+    data = load_archived_transcript(db, transcript_id, workspace)
+    if data is None:
+        raise HTTPException(status_code=404, detail="Archived transcript not found")
+    return ArchivedTranscriptResponse.model_validate(data)
+
+
+def _stream_export(kind: str, fmt: str, workspace: str, factory):
+    """Stream an export with its own session, open for the whole response."""
+    db = factory()
+    try:
+        yield from transfer.iter_export(db, kind, fmt, workspace)
+    finally:
+        db.close()
+
+
+@app.get("/api/export/{kind}")
+def export_data(
+    request: Request,
+    kind: str,
+    format: str = "ndjson",
+    workspace: str = Depends(get_workspace)
+):
+    """
+    Stream all of a workspace's tasks or transcripts as NDJSON or CSV.
+
+    Reads from the replica, if configured, unless the client wrote recently.
+
+    Args:
+        request: Incoming request, for the last-write cookie
+        kind: "tasks" or "transcripts"
+        format: "ndjson" (default) or "csv"
+        workspace: Workspace to export
+
+    Returns:
+        Streaming file download
+
+    Raises:
+        HTTPException: If kind or format is unknown
+    """
+    if kind not in transfer.EXPORTS:
+        raise HTTPException(status_code=404, detail="Unknown export")
+    if format not in transfer.FORMATS:
+        raise HTTPException(status_code=400, detail="Format must be 'ndjson' or 'csv'")
+
+    return StreamingResponse(
+        _stream_export(
+            kind, format, workspace,
+            session_factory(workspace) if wrote_recently(request) else read_session_factory(workspace)
+        ),
+        media_type=transfer.MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="{kind}.{format}"'}
+    )
+
+
+@app.post("/api/import/{kind}")
+def import_data(
+    kind: str,
+    format: str = "ndjson",
+    file: UploadFile = File(...),
+    workspace: str = Depends(get_workspace),
+    db: Session = Depends(get_db)
+):
+    """
+    Bulk load tasks or transcripts from an NDJSON or CSV upload.
+
+    The whole file is loaded in one transaction; nothing is imported if any
+    record is rejected.
+
+    Args:
+        kind: "tasks" or "transcripts"
+        format: "ndjson" (default) or "csv"
+        file: Uploaded file
+        workspace: Workspace to import into
+        db: Database session
+
+    Returns:
+        Number of imported rows
+
+    Raises:
+        HTTPException: If kind or format is unknown, or the file is rejected
+    """
+    if kind not in transfer.EXPORTS:
+        raise HTTPException(status_code=404, detail="Unknown import")
+    if format not in transfer.FORMATS:
+        raise HTTPException(status_code=400, detail="Format must be 'ndjson' or 'csv'")
+
+    stream = io.TextIOWrapper(file.file, encoding="utf-8", newline="")
+    try:
+        count = transfer.import_records(
+            db, kind, transfer.parse_records(stream, format), workspace=workspace
+        )
+    except transfer.TransferError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except SQLAlchemyError as e:
+        raise HTTPException(status_code=400, detail=f"Import failed: {e.__class__.__name__}")
+    finally:
+        stream.detach()
+
+    return {"imported": count}
+
+
+@app.get("/api/admission")
+async def admission_stats():
+    """
+    Report transcript processing load.
+
+    Returns:
+        In-flight and queued extractions, limits, and rejection counts
+    """
+    return extraction_admission.stats()
+
+
+@app.get("/api/stats", response_model=TaskStatsResponse)
+async def get_task_stats(
+    workspace: str = Depends(get_workspace),
+    db: Session = Depends(get_read_db)
+):
+    """
+    Get the task counters of a workspace.
+
+    Counters are refreshed periodically by the scheduler (app/scheduler.py),
+    so this is a primary key lookup. Until the first refresh they are
+    counted live.
+
+    Args:
+        workspace: Workspace to report
+        db: Database session
+
+    Returns:
+        Open, done and overdue task counts, and when they were refreshed
+    """
+    stats = db.get(TaskStats, workspace)
+    if stats is not None:
+        return TaskStatsResponse(
+            open_tasks=stats.open_tasks,
+            done_tasks=stats.done_tasks,
+            overdue_tasks=stats.overdue_tasks,
+            refreshed_at=stats.refreshed_at,
+        )
+    return TaskStatsResponse(**task_counts(db, workspace).get(workspace, {}))
 
 
 @app.get("/status", response_model=StatusResponse)
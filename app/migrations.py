@@ -0,0 +1,319 @@
+"""Lightweight schema migrations for existing databases.
+
+`init_db()` creates any missing tables with `create_all`, but that never
+touches tables that already exist. Each migration below brings an older
+database up to date with the current models. Migrations are applied once,
+in order, and recorded in the `schema_migrations` table. They must also be
+safe to run against a freshly created schema, where the columns and indexes
+they add already exist.
+"""
+from datetime import datetime
+from typing import Callable, List, Tuple
+
+from sqlalchemy import (
+    Column,
+    DateTime,
+    MetaData,
+    String,
+    Table,
+    inspect,
+    select,
+    text,
+)
+from sqlalchemy.engine import Connection, Engine
+
+_metadata = MetaData()
+
+schema_migrations = Table(
+    "schema_migrations",
+    _metadata,
+    Column("name", String(100), primary_key=True),
+    Column("applied_at", DateTime, nullable=False),
+)
+
+MIGRATIONS: List[Tuple[str, Callable[[Connection], None]]] = []
+
+
+def migration(name: str):
+    """Register a migration function under a unique, ordered name."""
+    def decorator(func: Callable[[Connection], None]):
+        MIGRATIONS.append((name, func))
+        return func
+    return decorator
+
+
+def column_names(conn: Connection, table: str) -> set:
+    """Return the column names currently present on a table."""
+    return {col["name"] for col in inspect(conn).get_columns(table)}
+
+
+def add_column(conn: Connection, table: str, name: str, ddl: str) -> None:
+    """Add a column unless it already exists."""
+    if name not in column_names(conn, table):
+        conn.execute(text(f"ALTER TABLE {table} ADD COLUMN {name} {ddl}"))
+
+
+def create_index(conn: Connection, name: str, table: str, columns: str) -> None:
+    """Create an index unless it already exists."""
+    conn.execute(text(f"CREATE INDEX IF NOT EXISTS {name} ON {table} ({columns})"))
+
+
+def run_migrations(engine: Engine) -> List[str]:
+    """
+    Apply all pending migrations.
+
+    Args:
+        engine: Engine bound to the database to migrate
+
+    Returns:
+        Names of the migrations applied by this call
+    """
+    _metadata.create_all(bind=engine)
+
+    with engine.connect() as conn:
+        applied = set(conn.execute(select(schema_migrations.c.name)).scalars())
+
+    newly_applied = []
+    for name, func in MIGRATIONS:
+        if name in applied:
+            continue
+        with engine.begin() as conn:
+            func(conn)
+            conn.execute(
+                schema_migrations.insert().values(name=name, applied_at=datetime.utcnow())
+            )
+        newly_applied.append(name)
+    return newly_applied
+
+
+@migration("0001_task_fingerprint")
+def _task_fingerprint(conn: Connection) -> None:
+    """Add the dedup fingerprint column and its lookup index to tasks."""
+    add_column(conn, "tasks", "fingerprint", "VARCHAR(40)")
+    create_index(conn, "ix_tasks_fingerprint_status", "tasks", "fingerprint, status")
+
+
+@migration("0002_retention_indexes")
+def _retention_indexes(conn: Connection) -> None:
+    """Index the created_at columns used by listings and retention."""
+    create_index(conn, "ix_transcripts_created_at", "transcripts", "created_at")
+    create_index(conn, "ix_tasks_status_created_at", "tasks", "status, created_at")
+
+
+@migration("0003_compressed_transcripts")
+def _compressed_transcripts(conn: Connection) -> None:
+    """Compress existing transcript text and backfill preview/text_length."""
+    from app.compression import GZIP_MAGIC, ZSTD_MAGIC, compress_text
+    from app.models import PREVIEW_LENGTH, make_preview
+
+    add_column(conn, "transcripts", "preview", f"VARCHAR({PREVIEW_LENGTH})")
+    add_column(conn, "transcripts", "text_length", "INTEGER")
+
+    if conn.dialect.name == "postgresql":
+        text_type = next(
+            col["type"] for col in inspect(conn).get_columns("transcripts") if col["name"] == "text"
+        )
+        if text_type.python_type is str:
+            conn.execute(text(
+                "ALTER TABLE transcripts ALTER COLUMN text TYPE BYTEA USING convert_to(text, 'UTF8')"
+            ))
+
+    last_id = 0
+    while True:
+        rows = conn.execute(
+            text(
+                "SELECT id, text FROM transcripts WHERE id > :last_id AND text_length IS NULL "
+                "ORDER BY id LIMIT 500"
+            ),
+            {"last_id": last_id},
+        ).all()
+        if not rows:
+            break
+        last_id = rows[-1].id
+
+        updates = []
+        for row in rows:
+            value = row.text
+            if isinstance(value, str):
+                raw = value
+            else:
+                value = bytes(value)
+                if value.startswith(GZIP_MAGIC) or value.startswith(ZSTD_MAGIC):
+                    continue
+                raw = value.decode("utf-8")
+            updates.append({
+                "id": row.id,
+                "text": compress_text(raw),
+                "preview": make_preview(raw),
+                "text_length": len(raw),
+            })
+        if updates:
+            conn.execute(
+                text(
+                    "UPDATE transcripts SET text = :text, preview = :preview, "
+                    "text_length = :text_length WHERE id = :id"
+                ),
+                updates,
+            )
+
+
+@migration("0004_task_source_span")
+def _task_source_span(conn: Connection) -> None:
+    """Add the source sentence offsets to tasks."""
+    add_column(conn, "tasks", "source_start", "INTEGER")
+    add_column(conn, "tasks", "source_end", "INTEGER")
+
+
+@migration("0005_task_due_date_type")
+def _task_due_date_type(conn: Connection) -> None:
+    """Convert tasks.due_date from free-form strings to a DATE column."""
+    from datetime import date
+
+    if conn.dialect.name == "postgresql":
+        due_type = next(
+            col["type"] for col in inspect(conn).get_columns("tasks") if col["name"] == "due_date"
+        )
+        needs_conversion = due_type.python_type is str
+    else:
+        # SQLite keeps the declared type; values only need normalizing
+        needs_conversion = True
+
+    if needs_conversion:
+        # Keep ISO dates, clear anything else (relative dates can no longer
+        # be resolved against the day they were written)
+        last_id = 0
+        while True:
+            rows = conn.execute(
+                text(
+                    "SELECT id, due_date FROM tasks WHERE id > :last_id AND due_date IS NOT NULL "
+                    "ORDER BY id LIMIT 500"
+                ),
+                {"last_id": last_id},
+            ).all()
+            if not rows:
+                break
+            last_id = rows[-1].id
+
+            updates = []
+            for row in rows:
+                value = str(row.due_date).strip()
+                try:
+                    normalized = date.fromisoformat(value[:10]).isoformat()
+                except ValueError:
+                    normalized = None
+                if normalized != row.due_date:
+                    updates.append({"id": row.id, "due_date": normalized})
+            if updates:
+                conn.execute(text("UPDATE tasks SET due_date = :due_date WHERE id = :id"), updates)
+
+        if conn.dialect.name == "postgresql":
+            conn.execute(text(
+                "ALTER TABLE tasks ALTER COLUMN due_date TYPE DATE USING due_date::date"
+            ))
+
+    create_index(conn, "ix_tasks_status_due_date", "tasks", "status, due_date")
+
+
+@migration("0006_task_version")
+def _task_version(conn: Connection) -> None:
+    """Add the optimistic concurrency version column to tasks."""
+    add_column(conn, "tasks", "version", "INTEGER NOT NULL DEFAULT 1")
+
+
+@migration("0007_workspaces")
+def _workspaces(conn: Connection) -> None:
+    """Add the workspace column and switch to workspace-leading indexes."""
+    from app.database import DEFAULT_WORKSPACE
+
+    for table in ("transcripts", "tasks", "archived_transcripts", "archived_tasks"):
+        add_column(conn, table, "workspace", f"VARCHAR(50) NOT NULL DEFAULT '{DEFAULT_WORKSPACE}'")
+
+    create_index(conn, "ix_transcripts_workspace_created_at", "transcripts", "workspace, created_at")
+    create_index(
+        conn, "ix_tasks_workspace_fingerprint_status", "tasks", "workspace, fingerprint, status"
+    )
+    create_index(
+        conn, "ix_tasks_workspace_status_created_at", "tasks", "workspace, status, created_at"
+    )
+    create_index(conn, "ix_tasks_workspace_status_due_date", "tasks", "workspace, status, due_date")
+    create_index(
+        conn, "ix_archived_transcripts_workspace_created_at", "archived_transcripts",
+        "workspace, created_at"
+    )
+
+    if conn.dialect.name == "postgresql":
+        # Room for per-workspace cache namespaces such as "transcripts:<workspace>"
+        conn.execute(text("ALTER TABLE cache_generations ALTER COLUMN name TYPE VARCHAR(100)"))
+
+    # Superseded by the workspace-leading versions above
+    conn.execute(text("DROP INDEX IF EXISTS ix_tasks_fingerprint_status"))
+    conn.execute(text("DROP INDEX IF EXISTS ix_tasks_status_due_date"))
+
+
+@migration("0008_owner_directory")
+def _owner_directory(conn: Connection) -> None:
+    """Link tasks to owner records, creating owners for existing names."""
+    from app.models import Owner, OwnerAlias
+    from app.owners import normalize_owner
+
+    add_column(conn, "tasks", "owner_id", "INTEGER REFERENCES owners(id)")
+    create_index(
+        conn, "ix_tasks_workspace_owner_id_status", "tasks", "workspace, owner_id, status"
+    )
+
+    owner_ids = {
+        (row.workspace, row.alias): row.owner_id
+        for row in conn.execute(text("SELECT workspace, alias, owner_id FROM owner_aliases"))
+    }
+    names = conn.execute(text(
+        "SELECT DISTINCT workspace, owner FROM tasks WHERE owner_id IS NULL AND owner IS NOT NULL"
+    )).all()
+
+    updates = []
+    for workspace, name in names:
+        alias = normalize_owner(name)
+        if not alias:
+            continue
+        owner_id = owner_ids.get((workspace, alias))
+        if owner_id is None:
+            owner_id = conn.execute(
+                Owner.__table__.insert().values(
+                    workspace=workspace,
+                    name=name.strip(),
+                    normalized_name=alias,
+                    created_at=datetime.utcnow(),
+                )
+            ).inserted_primary_key[0]
+            conn.execute(
+                OwnerAlias.__table__.insert().values(
+                    workspace=workspace, alias=alias, owner_id=owner_id
+                )
+            )
+            owner_ids[(workspace, alias)] = owner_id
+        updates.append({"owner_id": owner_id, "workspace": workspace, "owner": name})
+
+    if updates:
+        conn.execute(
+            text(
+                "UPDATE tasks SET owner_id = :owner_id "
+                "WHERE workspace = :workspace AND owner = :owner AND owner_id IS NULL"
+            ),
+            updates,
+        )
+
+
+@migration("0009_task_overdue")
+def _task_overdue(conn: Connection) -> None:
+    """Add the overdue flag maintained by the scheduler, flagging current overdue tasks."""
+    add_column(conn, "tasks", "overdue", "BOOLEAN NOT NULL DEFAULT FALSE")
+    create_index(conn, "ix_tasks_workspace_overdue", "tasks", "workspace, overdue")
+    conn.execute(text(
+        "UPDATE tasks SET overdue = TRUE WHERE status = 'open' AND due_date < CURRENT_DATE"
+    ))
+
+
+@migration("0010_task_keyset_indexes")
+def _task_keyset_indexes(conn: Connection) -> None:
+    """Index the unfiltered keyset listings by created_at and due_date."""
+    create_index(conn, "ix_tasks_workspace_created_at_id", "tasks", "workspace, created_at, id")
+    create_index(conn, "ix_tasks_workspace_due_date_id", "tasks", "workspace, due_date, id")
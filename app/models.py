@@ -1,33 +1,228 @@
 """SQLAlchemy ORM models."""
-from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey
-from sqlalchemy.orm import relationship
-from datetime import datetime
-from app.database import Base
+from sqlalchemy import (
+    Boolean, Column, Integer, String, Text, Date, DateTime, ForeignKey, Index, LargeBinary,
+    UniqueConstraint, false
+)
+from sqlalchemy.orm import relationship, validates
+from sqlalchemy.types import TypeDecorator
+from datetime import date, datetime
+from app.database import Base, DEFAULT_WORKSPACE
+from app.compression import compress_text, decompress_text
+
+# Number of characters kept in Transcript.preview
+PREVIEW_LENGTH = 200
+
+
+def workspace_column():
+    """Owning workspace (tenant); see app/database.py."""
+    return Column(
+        String(50), default=DEFAULT_WORKSPACE, server_default=DEFAULT_WORKSPACE, nullable=False
+    )
+
+
+class CompressedText(TypeDecorator):
+    """
+    Text column stored compressed as binary.
+
+    Values are compressed on write and decompressed on read, so the
+    attribute behaves like a plain string. Rows written before compression
+    was enabled are returned as is.
+    """
+    impl = LargeBinary
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        return compress_text(value)
+
+    def process_result_value(self, value, dialect):
+        if value is None or isinstance(value, str):
+            return value
+        value = bytes(value)
+        try:
+            return decompress_text(value)
+        except ValueError:
+            # Uncompressed bytes left by a column type change (e.g. Postgres text -> bytea)
+            return value.decode("utf-8")
+
+
+def make_preview(text: str) -> str:
+    """Build the short, single-line preview stored alongside a transcript."""
+    # Only look at a bounded prefix so huge transcripts stay cheap
+    return " ".join(text[:PREVIEW_LENGTH * 2].split())[:PREVIEW_LENGTH]
 
 
 class Transcript(Base):
     """Transcript model - stores meeting transcripts."""
     __tablename__ = "transcripts"
+    __table_args__ = (
+        Index("ix_transcripts_created_at", "created_at"),
+        Index("ix_transcripts_workspace_created_at", "workspace", "created_at"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
-    text = Column(Text, nullable=False)
+    workspace = workspace_column()
+    text = Column(CompressedText, nullable=False)
+    preview = Column(String(PREVIEW_LENGTH), nullable=True)  # Set from text, see make_preview()
+    text_length = Column(Integer, nullable=True)  # Length of text in characters
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
 
     # Relationship to tasks
     tasks = relationship("Task", back_populates="transcript", cascade="all, delete-orphan")
 
+    @validates("text")
+    def _set_text_metadata(self, key, value):
+        """Keep preview and text_length in sync with text."""
+        if value is not None:
+            self.preview = make_preview(value)
+            self.text_length = len(value)
+        return value
+
 
 class Task(Base):
     """Task model - stores action items extracted from transcripts."""
     __tablename__ = "tasks"
+    __table_args__ = (
+        Index("ix_tasks_workspace_fingerprint_status", "workspace", "fingerprint", "status"),
+        Index("ix_tasks_status_created_at", "status", "created_at"),  # Retention scans
+        Index("ix_tasks_workspace_status_created_at", "workspace", "status", "created_at"),
+        Index("ix_tasks_workspace_status_due_date", "workspace", "status", "due_date"),
+        Index("ix_tasks_workspace_owner_id_status", "workspace", "owner_id", "status"),
+        Index("ix_tasks_workspace_overdue", "workspace", "overdue"),
+        # Keyset pages of all statuses, see list_tasks() in app/main.py
+        Index("ix_tasks_workspace_created_at_id", "workspace", "created_at", "id"),
+        Index("ix_tasks_workspace_due_date_id", "workspace", "due_date", "id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
+    workspace = workspace_column()
     transcript_id = Column(Integer, ForeignKey("transcripts.id"), nullable=False)
     task = Column(Text, nullable=False)
     owner = Column(String(255), nullable=True)
-    due_date = Column(String(50), nullable=True)  # Store as string in YYYY-MM-DD format
+    owner_id = Column(Integer, ForeignKey("owners.id"), nullable=True)  # Resolved owner, see app/owners.py
+    due_date = Column(Date, nullable=True)
     status = Column(String(20), default="open", nullable=False)  # "open" or "done"
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    fingerprint = Column(String(40), nullable=True)  # Normalized owner + text hash, see app/dedup.py
+    source_start = Column(Integer, nullable=True)  # Offset of the originating sentence in the transcript
+    source_end = Column(Integer, nullable=True)
+    version = Column(Integer, default=1, server_default="1", nullable=False)  # Bumped on every update
+    overdue = Column(Boolean, default=False, server_default=false(), nullable=False)  # See app/scheduler.py
 
     # Relationship to transcript
     transcript = relationship("Transcript", back_populates="tasks")
+
+    # ORM updates check and increment version, failing on concurrent changes
+    __mapper_args__ = {"version_id_col": version}
+
+    @validates("status", "due_date")
+    def _set_overdue(self, key, value):
+        """Keep the overdue flag in sync when a task is created or edited."""
+        status = value if key == "status" else self.status
+        due_date = value if key == "due_date" else self.due_date
+        self.overdue = (status or "open") == "open" and due_date is not None and due_date < date.today()
+        return value
+
+
+class Owner(Base):
+    """Owner model - one person tasks are assigned to, per workspace."""
+    __tablename__ = "owners"
+    __table_args__ = (
+        UniqueConstraint("workspace", "normalized_name", name="uq_owners_workspace_normalized_name"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    workspace = workspace_column()
+    name = Column(String(255), nullable=False)  # Display name, as first seen
+    normalized_name = Column(String(255), nullable=False)
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+
+    aliases = relationship("OwnerAlias", back_populates="owner", cascade="all, delete-orphan")
+
+
+class OwnerAlias(Base):
+    """Owner alias - a normalized spelling that resolves to an owner."""
+    __tablename__ = "owner_aliases"
+    __table_args__ = (
+        UniqueConstraint("workspace", "alias", name="uq_owner_aliases_workspace_alias"),
+    )
+
+    id = Column(Integer, primary_key=True)
+    workspace = workspace_column()
+    alias = Column(String(255), nullable=False)  # Normalized, see app/owners.py
+    owner_id = Column(Integer, ForeignKey("owners.id"), nullable=False, index=True)
+
+    owner = relationship("Owner", back_populates="aliases")
+
+
+class ArchivedTranscript(Base):
+    """Archived transcript - compressed copy of a pruned transcript and its tasks."""
+    __tablename__ = "archived_transcripts"
+    __table_args__ = (
+        Index("ix_archived_transcripts_workspace_created_at", "workspace", "created_at"),
+    )
+
+    id = Column(Integer, primary_key=True, autoincrement=False)  # Original transcript ID
+    workspace = workspace_column()
+    created_at = Column(DateTime, nullable=False)
+    archived_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    task_count = Column(Integer, default=0, nullable=False)
+    payload = Column(LargeBinary, nullable=False)  # Compressed JSON, see app/retention.py
+
+
+class ArchivedTask(Base):
+    """Archived task - compressed copy of a pruned done task."""
+    __tablename__ = "archived_tasks"
+
+    id = Column(Integer, primary_key=True, autoincrement=False)  # Original task ID
+    workspace = workspace_column()
+    transcript_id = Column(Integer, nullable=False, index=True)
+    created_at = Column(DateTime, nullable=False)
+    archived_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    payload = Column(LargeBinary, nullable=False)  # Compressed JSON, see app/retention.py
+
+
+class CacheGeneration(Base):
+    """Cache generation counter - bumped by writes to invalidate cached listings."""
+    __tablename__ = "cache_generations"
+
+    name = Column(String(100), primary_key=True)  # Namespace, e.g. "tasks" or "tasks:acme"
+    generation = Column(Integer, default=0, nullable=False)
+
+
+class IdempotencyKey(Base):
+    """Idempotency key - remembers the response to a keyed transcript submission."""
+    __tablename__ = "idempotency_keys"
+
+    key = Column(String(255), primary_key=True)  # Client supplied Idempotency-Key header
+    request_hash = Column(String(64), nullable=False)  # SHA-256 of the request body
+    status = Column(String(20), default="pending", nullable=False)  # "pending" or "completed"
+    status_code = Column(Integer, nullable=True)
+    response_body = Column(Text, nullable=True)
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False, index=True)
+    completed_at = Column(DateTime, nullable=True)
+
+
+class TaskStats(Base):
+    """Task counters per workspace, refreshed by the scheduler (app/scheduler.py)."""
+    __tablename__ = "task_stats"
+
+    workspace = Column(String(50), primary_key=True)
+    open_tasks = Column(Integer, default=0, nullable=False)
+    done_tasks = Column(Integer, default=0, nullable=False)
+    overdue_tasks = Column(Integer, default=0, nullable=False)
+    refreshed_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+
+
+class JobLease(Base):
+    """Job lease - which scheduler instance may run a maintenance job, and when it is next due."""
+    __tablename__ = "job_leases"
+
+    name = Column(String(100), primary_key=True)  # Job name, see app/scheduler.py
+    holder = Column(String(255), nullable=True)  # Instance holding the lease
+    leased_until = Column(DateTime, nullable=True)  # Lease expiry; None when not running
+    next_run_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    last_started_at = Column(DateTime, nullable=True)
+    last_finished_at = Column(DateTime, nullable=True)
+    last_result = Column(Text, nullable=True)  # JSON counts, or the error of a failed run
@@ -0,0 +1,169 @@
+"""Owner directory: resolve free-text task owners to owner records.
+
+Extraction produces owners as plain names ("John"). At ingestion each name
+is normalized (see app/dedup.py) and looked up in the workspace's
+`owner_aliases`; unknown names get a new owner whose normalized name is its
+first alias. Tasks then store `owner_id`, so "tasks of this owner" is an
+index lookup and per-owner rollups are a GROUP BY on the
+(workspace, owner_id, status) index.
+
+Alias mappings never change once created, so resolved ids are kept in a
+bounded in-process cache and most ingestions need no owner queries at all.
+"""
+import os
+import threading
+from collections import OrderedDict
+from typing import Dict, Iterable, Optional, Tuple
+
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.dedup import normalize_text
+from app.models import Owner, OwnerAlias
+
+OWNER_CACHE_SIZE = int(os.getenv("OWNER_CACHE_SIZE", "10000"))
+
+
+def normalize_owner(name: Optional[str]) -> str:
+    """Normalize an owner name for matching, e.g. "  John. " -> "john"."""
+    return normalize_text(name)[:255]
+
+
+class OwnerDirectory:
+    """Resolves owner names to ids, with a bounded in-process LRU cache."""
+
+    def __init__(self, max_entries: int = OWNER_CACHE_SIZE):
+        self.max_entries = max_entries
+        self._ids: "OrderedDict[Tuple[str, str], int]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _cached(self, workspace: str, aliases: Iterable[str]) -> Dict[str, int]:
+        found = {}
+        with self._lock:
+            for alias in aliases:
+                owner_id = self._ids.get((workspace, alias))
+                if owner_id is not None:
+                    self._ids.move_to_end((workspace, alias))
+                    found[alias] = owner_id
+        return found
+
+    def _remember(self, workspace: str, ids: Dict[str, int]) -> None:
+        with self._lock:
+            for alias, owner_id in ids.items():
+                self._ids[(workspace, alias)] = owner_id
+            while len(self._ids) > self.max_entries:
+                self._ids.popitem(last=False)
+
+    def _lookup(self, db: Session, workspace: str, aliases: Iterable[str]) -> Dict[str, int]:
+        return dict(
+            db.query(OwnerAlias.alias, OwnerAlias.owner_id)
+            .filter(OwnerAlias.workspace == workspace, OwnerAlias.alias.in_(set(aliases)))
+            .all()
+        )
+
+    def _create(self, db: Session, workspace: str, names: Dict[str, str]) -> Dict[str, int]:
+        created = {}
+        for alias, name in names.items():
+            owner = Owner(workspace=workspace, name=name, normalized_name=alias)
+            owner.aliases.append(OwnerAlias(workspace=workspace, alias=alias))
+            db.add(owner)
+            db.flush()
+            created[alias] = owner.id
+        return created
+
+    def resolve(
+        self,
+        db: Session,
+        workspace: str,
+        names: Iterable[Optional[str]],
+        commit: bool = True,
+    ) -> Dict[str, int]:
+        """
+        Resolve owner names to owner ids, creating owners for unknown names.
+
+        With commit=True, new owners are committed in their own short
+        transaction, so call this before making other changes in the
+        session. A concurrent insert of the same owner is detected by the
+        unique constraint and resolved by reading the winner's row. With
+        commit=False new owners are only flushed, joining the caller's
+        transaction, and are not cached until a later lookup.
+
+        Args:
+            db: Database session
+            workspace: Workspace the owners belong to
+            names: Owner names as extracted or entered (None/blank ignored)
+            commit: Commit newly created owners straight away
+
+        Returns:
+            Mapping of each given non-blank name to its owner id
+        """
+        names = list(names)
+        by_alias: Dict[str, str] = {}
+        for name in names:
+            alias = normalize_owner(name)
+            if alias:
+                by_alias.setdefault(alias, name.strip())
+        if not by_alias:
+            return {}
+
+        ids = self._cached(workspace, by_alias)
+        missing = [alias for alias in by_alias if alias not in ids]
+        if missing:
+            found = self._lookup(db, workspace, missing)
+            self._remember(workspace, found)
+            ids.update(found)
+
+            to_create = {alias: by_alias[alias] for alias in missing if alias not in found}
+            if to_create and commit:
+                try:
+                    created = self._create(db, workspace, to_create)
+                    db.commit()
+                except IntegrityError:
+                    # Another request created some of them first
+                    db.rollback()
+                    created = self._lookup(db, workspace, to_create)
+                    created.update(self._create(db, workspace, {
+                        alias: name for alias, name in to_create.items() if alias not in created
+                    }))
+                    db.commit()
+                self._remember(workspace, created)
+                ids.update(created)
+            elif to_create:
+                ids.update(self._create(db, workspace, to_create))
+
+        return {
+            name: ids[normalize_owner(name)]
+            for name in names
+            if normalize_owner(name)
+        }
+
+    def add_alias(self, db: Session, owner: Owner, alias_name: str) -> OwnerAlias:
+        """
+        Make another spelling resolve to an owner.
+
+        Raises:
+            ValueError: If the alias is blank or already used in the workspace
+        """
+        alias = normalize_owner(alias_name)
+        if not alias:
+            raise ValueError("Alias cannot be empty")
+        existing = self._lookup(db, owner.workspace, [alias])
+        if existing:
+            raise ValueError("Alias is already in use")
+
+        entry = OwnerAlias(workspace=owner.workspace, alias=alias, owner_id=owner.id)
+        db.add(entry)
+        try:
+            db.commit()
+        except IntegrityError:
+            db.rollback()
+            raise ValueError("Alias is already in use")
+        self._remember(owner.workspace, {alias: owner.id})
+        return entry
+
+    def clear(self) -> None:
+        with self._lock:
+            self._ids.clear()
+
+
+owner_directory = OwnerDirectory()
@@ -0,0 +1,247 @@
+"""Data retention: archive old transcripts and done tasks.
+
+Transcripts older than `RETENTION_TRANSCRIPT_DAYS` with no open tasks, and
+done tasks older than `RETENTION_TASK_DAYS`, are moved into the compressed
+`archived_transcripts`/`archived_tasks` tables. Work is done in small
+batches, each committed on its own, so no statement holds locks for long.
+Both thresholds are disabled unless configured.
+
+Run it with:
+
+    python -m app.retention --transcript-days 365 --task-days 90
+"""
+import argparse
+import json
+import os
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import and_, exists
+from sqlalchemy.orm import Session
+
+from app.cache import invalidate
+from app.compression import compress_text, decompress_text
+from app.models import ArchivedTask, ArchivedTranscript, Task, Transcript
+from app.transfer import serialize_value
+
+
+def _env_days(name: str) -> Optional[int]:
+    value = os.getenv(name)
+    return int(value) if value else None
+
+
+RETENTION_TRANSCRIPT_DAYS = _env_days("RETENTION_TRANSCRIPT_DAYS")
+RETENTION_TASK_DAYS = _env_days("RETENTION_TASK_DAYS")
+RETENTION_BATCH_SIZE = int(os.getenv("RETENTION_BATCH_SIZE", "200"))
+
+TASK_FIELDS = [
+    "id", "transcript_id", "task", "owner", "due_date", "status", "created_at",
+    "source_start", "source_end",
+]
+
+
+def _task_data(task: Task) -> Dict[str, Any]:
+    return {field: serialize_value(getattr(task, field)) for field in TASK_FIELDS}
+
+
+def _pack(data: Dict[str, Any]) -> bytes:
+    return compress_text(json.dumps(data))
+
+
+def _unpack(payload: bytes) -> Dict[str, Any]:
+    return json.loads(decompress_text(payload))
+
+
+def archive_transcripts(db: Session, older_than_days: int, batch_size: int = RETENTION_BATCH_SIZE) -> int:
+    """
+    Archive transcripts older than a threshold that have no open tasks.
+
+    Each transcript is stored with all of its tasks in one compressed
+    payload, then removed from the live tables.
+
+    Args:
+        db: Database session
+        older_than_days: Minimum transcript age in days
+        batch_size: Transcripts per batch/transaction
+
+    Returns:
+        Number of transcripts archived
+    """
+    cutoff = datetime.utcnow() - timedelta(days=older_than_days)
+    has_open_tasks = exists().where(and_(Task.transcript_id == Transcript.id, Task.status == "open"))
+
+    archived = 0
+    last_id = 0
+    while True:
+        transcripts = (
+            db.query(Transcript)
+            .filter(Transcript.id > last_id, Transcript.created_at < cutoff, ~has_open_tasks)
+            .order_by(Transcript.id)
+            .limit(batch_size)
+            .all()
+        )
+        if not transcripts:
+            break
+        last_id = transcripts[-1].id
+        ids = [t.id for t in transcripts]
+
+        tasks_by_transcript: Dict[int, List[Dict[str, Any]]] = {}
+        for task in db.query(Task).filter(Task.transcript_id.in_(ids)).order_by(Task.id):
+            tasks_by_transcript.setdefault(task.transcript_id, []).append(_task_data(task))
+
+        db.add_all([
+            ArchivedTranscript(
+                id=t.id,
+                workspace=t.workspace,
+                created_at=t.created_at,
+                task_count=len(tasks_by_transcript.get(t.id, [])),
+                payload=_pack({"text": t.text, "tasks": tasks_by_transcript.get(t.id, [])}),
+            )
+            for t in transcripts
+        ])
+        db.query(Task).filter(Task.transcript_id.in_(ids)).delete(synchronize_session=False)
+        db.query(Transcript).filter(Transcript.id.in_(ids)).delete(synchronize_session=False)
+        invalidate(db, "tasks", "transcripts")
+        db.commit()
+        db.expunge_all()
+        archived += len(ids)
+
+    return archived
+
+
+def archive_done_tasks(db: Session, older_than_days: int, batch_size: int = RETENTION_BATCH_SIZE) -> int:
+    """
+    Archive done tasks older than a threshold.
+
+    Args:
+        db: Database session
+        older_than_days: Minimum task age in days
+        batch_size: Tasks per batch/transaction
+
+    Returns:
+        Number of tasks archived
+    """
+    cutoff = datetime.utcnow() - timedelta(days=older_than_days)
+
+    archived = 0
+    while True:
+        # Archived rows leave the table, so the next batch starts from the top
+        tasks = (
+            db.query(Task)
+            .filter(Task.status == "done", Task.created_at < cutoff)
+            .order_by(Task.id)
+            .limit(batch_size)
+            .all()
+        )
+        if not tasks:
+            break
+
+        db.add_all([
+            ArchivedTask(
+                id=task.id,
+                workspace=task.workspace,
+                transcript_id=task.transcript_id,
+                created_at=task.created_at,
+                payload=_pack(_task_data(task)),
+            )
+            for task in tasks
+        ])
+        db.query(Task).filter(Task.id.in_([task.id for task in tasks])).delete(synchronize_session=False)
+        invalidate(db, "tasks", "transcripts")
+        db.commit()
+        db.expunge_all()
+        archived += len(tasks)
+
+    return archived
+
+
+def run_retention(
+    db: Session,
+    transcript_days: Optional[int] = RETENTION_TRANSCRIPT_DAYS,
+    task_days: Optional[int] = RETENTION_TASK_DAYS,
+    batch_size: int = RETENTION_BATCH_SIZE,
+) -> Dict[str, int]:
+    """
+    Run all configured retention rules.
+
+    Transcripts go first so their done tasks are archived alongside them.
+
+    Returns:
+        Counts of archived transcripts and tasks
+    """
+    result = {"transcripts": 0, "tasks": 0}
+    if transcript_days is not None:
+        result["transcripts"] = archive_transcripts(db, transcript_days, batch_size)
+    if task_days is not None:
+        result["tasks"] = archive_done_tasks(db, task_days, batch_size)
+    return result
+
+
+def load_archived_transcript(
+    db: Session, transcript_id: int, workspace: Optional[str] = None
+) -> Optional[Dict[str, Any]]:
+    """
+    Restore the contents of an archived transcript.
+
+    Tasks archived on their own before the transcript was archived are
+    included as well.
+
+    Args:
+        db: Database session
+        transcript_id: Original transcript ID
+        workspace: Only find the transcript in this workspace
+
+    Returns:
+        Transcript fields with its tasks, or None if it is not archived
+    """
+    query = db.query(ArchivedTranscript).filter(ArchivedTranscript.id == transcript_id)
+    if workspace is not None:
+        query = query.filter(ArchivedTranscript.workspace == workspace)
+    archived = query.first()
+    if archived is None:
+        return None
+
+    data = _unpack(archived.payload)
+    earlier_tasks = (
+        db.query(ArchivedTask)
+        .filter(ArchivedTask.transcript_id == transcript_id)
+        .order_by(ArchivedTask.id)
+    )
+    tasks = [_unpack(task.payload) for task in earlier_tasks] + data["tasks"]
+    tasks.sort(key=lambda task: task["id"])
+
+    return {
+        "id": archived.id,
+        "text": data["text"],
+        "created_at": archived.created_at,
+        "archived_at": archived.archived_at,
+        "tasks": tasks,
+    }
+
+
+def main(argv=None) -> int:
+    """Command line entry point for the retention job."""
+    from app.database import SessionLocal, init_db
+
+    parser = argparse.ArgumentParser(description="Archive old transcripts and done tasks")
+    parser.add_argument("--transcript-days", type=int, default=RETENTION_TRANSCRIPT_DAYS)
+    parser.add_argument("--task-days", type=int, default=RETENTION_TASK_DAYS)
+    parser.add_argument("--batch-size", type=int, default=RETENTION_BATCH_SIZE)
+    args = parser.parse_args(argv)
+
+    if args.transcript_days is None and args.task_days is None:
+        parser.error("set --transcript-days and/or --task-days (or RETENTION_* env vars)")
+
+    init_db()
+    db = SessionLocal()
+    try:
+        result = run_retention(db, args.transcript_days, args.task_days, args.batch_size)
+    finally:
+        db.close()
+
+    print(f"Archived {result['transcripts']} transcript(s) and {result['tasks']} task(s)")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
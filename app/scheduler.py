@@ -0,0 +1,438 @@
+"""Scheduled maintenance jobs.
+
+Periodic jobs keep time-dependent and derived data current on the server,
+so clients never have to download everything to work it out:
+
+- `overdue`: sets `tasks.overdue` on open tasks whose due date has passed
+  (and clears it when that stops being true), as indexed range updates
+  in small committed batches
+- `stats`: refreshes the per-workspace counters in `task_stats`
+- `analyze`: refreshes the query planner statistics
+- `vacuum`: reclaims free space (SQLite `VACUUM`)
+- `expire`: drops expired cache entries and idempotency keys, and runs the
+  retention rules if any are configured (see app/retention.py)
+
+Each job has a row in `job_leases`. Before running a job an instance takes
+its lease with a conditional UPDATE, which only succeeds when the job is
+due and no one else holds an unexpired lease, so several app instances
+never run the same job at once. The lease is renewed after every batch and
+released with the next due time when the job finishes.
+
+Jobs run in a background thread of the web app when SCHEDULER_ENABLED is
+set, or in a separate worker process:
+
+    python worker.py
+    python -m app.scheduler --once --job overdue
+"""
+import argparse
+import json
+import os
+import socket
+import threading
+import uuid
+from datetime import date, datetime, timedelta
+from typing import Any, Callable, Dict, List, Optional
+
+from sqlalchemy import and_, case, false, func, or_, text, true, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session, sessionmaker
+
+from app import database, idempotency
+from app.cache import invalidate, response_cache, workspace_namespaces
+from app.models import JobLease, Task, TaskStats
+from app.retention import RETENTION_TASK_DAYS, RETENTION_TRANSCRIPT_DAYS, run_retention
+
+SCHEDULER_ENABLED = os.getenv("SCHEDULER_ENABLED", "0") not in ("0", "false", "no")
+SCHEDULER_POLL_SECONDS = float(os.getenv("SCHEDULER_POLL_SECONDS", "30"))
+SCHEDULER_BATCH_SIZE = int(os.getenv("SCHEDULER_BATCH_SIZE", "500"))
+JOB_LEASE_SECONDS = int(os.getenv("JOB_LEASE_SECONDS", "300"))
+
+# Seconds between runs of each job
+OVERDUE_INTERVAL_SECONDS = int(os.getenv("OVERDUE_INTERVAL_SECONDS", "300"))
+STATS_INTERVAL_SECONDS = int(os.getenv("STATS_INTERVAL_SECONDS", "300"))
+ANALYZE_INTERVAL_SECONDS = int(os.getenv("ANALYZE_INTERVAL_SECONDS", "3600"))
+VACUUM_INTERVAL_SECONDS = int(os.getenv("VACUUM_INTERVAL_SECONDS", str(7 * 24 * 3600)))
+EXPIRE_INTERVAL_SECONDS = int(os.getenv("EXPIRE_INTERVAL_SECONDS", "600"))
+
+
+class LeaseLost(Exception):
+    """Raised when a running job finds its lease has been taken over."""
+
+
+def databases() -> List[sessionmaker]:
+    """Session factories of every database holding task data."""
+    if not database.TENANT_DATABASE_DIR:
+        return [database.SessionLocal]
+    if not os.path.isdir(database.TENANT_DATABASE_DIR):
+        return []
+    workspaces = sorted(
+        name[:-3] for name in os.listdir(database.TENANT_DATABASE_DIR) if name.endswith(".db")
+    )
+    return [
+        database.session_factory(workspace)
+        for workspace in workspaces
+        if database.is_valid_workspace(workspace)
+    ]
+
+
+def _workspaces(db: Session) -> List[str]:
+    return [workspace for (workspace,) in db.query(Task.workspace).distinct()]
+
+
+def _no_heartbeat() -> None:
+    pass
+
+
+def flag_overdue_tasks(
+    db: Session,
+    today: Optional[date] = None,
+    batch_size: int = SCHEDULER_BATCH_SIZE,
+    heartbeat: Callable[[], None] = _no_heartbeat,
+) -> Dict[str, int]:
+    """
+    Set the overdue flag on open tasks past their due date, and clear stale flags.
+
+    Edits through the API keep the flag right as they happen; this catches
+    tasks that became overdue because the date moved on, and rows changed
+    by bulk statements. Candidates are found per workspace through the
+    (workspace, status, due_date) and (workspace, overdue) indexes and
+    updated in batches, each committed on its own. The version column is
+    left alone: the flag is derived data, not an edit clients could
+    conflict with.
+
+    Args:
+        db: Database session
+        today: Date to compare due dates with (default: today)
+        batch_size: Tasks per batch/transaction
+        heartbeat: Called after each batch
+
+    Returns:
+        Numbers of tasks flagged and cleared
+    """
+    today = today or date.today()
+    result = {"flagged": 0, "cleared": 0}
+    for workspace in _workspaces(db):
+        rules = [
+            ("flagged", True, [
+                Task.status == "open", Task.due_date < today, Task.overdue == false(),
+            ]),
+            ("cleared", False, [
+                Task.overdue == true(),
+                or_(Task.status != "open", Task.due_date.is_(None), Task.due_date >= today),
+            ]),
+        ]
+        for counter, flag, conditions in rules:
+            while True:
+                ids = [
+                    task_id for (task_id,) in
+                    db.query(Task.id)
+                    .filter(Task.workspace == workspace, *conditions)
+                    .limit(batch_size)
+                ]
+                if not ids:
+                    break
+                db.query(Task).filter(Task.id.in_(ids)).update(
+                    {Task.overdue: flag}, synchronize_session=False
+                )
+                # Transcript listings embed their tasks, flag included
+                invalidate(db, *workspace_namespaces(workspace, "tasks", "transcripts"))
+                db.commit()
+                result[counter] += len(ids)
+                heartbeat()
+    return result
+
+
+def task_counts(db: Session, workspace: Optional[str] = None) -> Dict[str, Dict[str, int]]:
+    """
+    Count open, done and overdue tasks per workspace with one GROUP BY.
+
+    Overdue tasks are counted by today's date, like the ?overdue=true filter,
+    so the count does not depend on the overdue job having run.
+
+    Args:
+        db: Database session
+        workspace: Only count this workspace
+
+    Returns:
+        Mapping of workspace to its counts
+    """
+    query = db.query(
+        Task.workspace,
+        func.sum(case((Task.status == "open", 1), else_=0)),
+        func.sum(case((Task.status == "done", 1), else_=0)),
+        func.sum(case((and_(Task.status == "open", Task.due_date < date.today()), 1), else_=0)),
+    )
+    if workspace is not None:
+        query = query.filter(Task.workspace == workspace)
+    return {
+        row[0]: {"open_tasks": row[1] or 0, "done_tasks": row[2] or 0, "overdue_tasks": row[3] or 0}
+        for row in query.group_by(Task.workspace)
+    }
+
+
+def refresh_task_stats(db: Session) -> int:
+    """
+    Recompute the stored task counters of every workspace.
+
+    Returns:
+        Number of workspaces refreshed
+    """
+    counts = task_counts(db)
+    now = datetime.utcnow()
+    for stats in db.query(TaskStats):
+        # Workspaces whose tasks are all gone keep a row of zeros
+        counts.setdefault(stats.workspace, {"open_tasks": 0, "done_tasks": 0, "overdue_tasks": 0})
+    for workspace, values in counts.items():
+        db.merge(TaskStats(workspace=workspace, refreshed_at=now, **values))
+    db.commit()
+    return len(counts)
+
+
+def optimize_database(bind, vacuum: bool = False) -> None:
+    """
+    Refresh planner statistics, and optionally reclaim free space.
+
+    Runs outside a transaction, as VACUUM requires. On SQLite, ANALYZE goes
+    through `PRAGMA optimize`, which only re-analyzes tables that need it.
+
+    Args:
+        bind: Engine of the database
+        vacuum: Also run VACUUM
+    """
+    sqlite = bind.dialect.name == "sqlite"
+    if vacuum:
+        statement = "VACUUM" if sqlite else "VACUUM ANALYZE"
+    else:
+        statement = "PRAGMA optimize" if sqlite else "ANALYZE"
+    with bind.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        conn.execute(text(statement))
+
+
+def _each_database(work: Callable[[Session], Dict[str, int]]) -> Dict[str, int]:
+    """Run a job step against every database, adding up the counts."""
+    total: Dict[str, int] = {}
+    for factory in databases():
+        db = factory()
+        try:
+            for name, value in work(db).items():
+                total[name] = total.get(name, 0) + value
+        finally:
+            db.close()
+    return total
+
+
+def _optimize_all(vacuum: bool) -> Dict[str, int]:
+    factories = databases()
+    for factory in factories:
+        optimize_database(factory.kw["bind"], vacuum=vacuum)
+    return {"databases": len(factories)}
+
+
+def _expire(db: Session) -> Dict[str, int]:
+    result = {"idempotency_keys": idempotency.purge_expired(db)}
+    if RETENTION_TRANSCRIPT_DAYS is not None or RETENTION_TASK_DAYS is not None:
+        archived = run_retention(db)
+        result["archived_transcripts"] = archived["transcripts"]
+        result["archived_tasks"] = archived["tasks"]
+    return result
+
+
+class Job:
+    """A maintenance job: a name, how often it is due, and what it runs."""
+
+    def __init__(self, name: str, interval: int, run: Callable[[Callable[[], None]], Dict[str, int]]):
+        self.name = name
+        self.interval = interval
+        self.run = run  # Called with a heartbeat; returns counts for the log
+
+
+JOBS = [
+    Job("overdue", OVERDUE_INTERVAL_SECONDS, lambda heartbeat: _each_database(
+        lambda db: flag_overdue_tasks(db, heartbeat=heartbeat)
+    )),
+    Job("stats", STATS_INTERVAL_SECONDS, lambda heartbeat: _each_database(
+        lambda db: {"workspaces": refresh_task_stats(db)}
+    )),
+    Job("analyze", ANALYZE_INTERVAL_SECONDS, lambda heartbeat: _optimize_all(vacuum=False)),
+    Job("vacuum", VACUUM_INTERVAL_SECONDS, lambda heartbeat: _optimize_all(vacuum=True)),
+    Job("expire", EXPIRE_INTERVAL_SECONDS, lambda heartbeat: {
+        "cache_entries": response_cache.prune_expired(),
+        **_each_database(_expire),
+    }),
+]
+
+
+def acquire_lease(db: Session, name: str, holder: str, duration: int = JOB_LEASE_SECONDS) -> bool:
+    """
+    Take the lease of a job if it is due and not held by anyone else.
+
+    Args:
+        db: Session on the shared database
+        name: Job name
+        holder: Identifies the calling instance
+        duration: Seconds until the lease expires unless renewed
+
+    Returns:
+        Whether the caller now holds the lease
+    """
+    now = datetime.utcnow()
+    taken = db.execute(
+        update(JobLease)
+        .where(
+            JobLease.name == name,
+            JobLease.next_run_at <= now,
+            or_(JobLease.leased_until.is_(None), JobLease.leased_until < now),
+        )
+        .values(holder=holder, leased_until=now + timedelta(seconds=duration), last_started_at=now)
+    ).rowcount
+    if taken:
+        db.commit()
+        return True
+
+    db.rollback()
+    if db.get(JobLease, name) is not None:
+        return False
+    # First run of this job anywhere
+    db.add(JobLease(
+        name=name, holder=holder, leased_until=now + timedelta(seconds=duration),
+        next_run_at=now, last_started_at=now,
+    ))
+    try:
+        db.commit()
+    except IntegrityError:
+        # Another instance created it first
+        db.rollback()
+        return False
+    return True
+
+
+def renew_lease(db: Session, name: str, holder: str, duration: int = JOB_LEASE_SECONDS) -> bool:
+    """Extend a lease the caller holds. Returns False if it was taken over."""
+    renewed = db.execute(
+        update(JobLease)
+        .where(JobLease.name == name, JobLease.holder == holder)
+        .values(leased_until=datetime.utcnow() + timedelta(seconds=duration))
+    ).rowcount
+    db.commit()
+    return bool(renewed)
+
+
+def release_lease(db: Session, name: str, holder: str, interval: int, result: str) -> None:
+    """Give up a lease, scheduling the job's next run `interval` seconds from now."""
+    now = datetime.utcnow()
+    db.execute(
+        update(JobLease)
+        .where(JobLease.name == name, JobLease.holder == holder)
+        .values(
+            leased_until=None,
+            next_run_at=now + timedelta(seconds=interval),
+            last_finished_at=now,
+            last_result=result,
+        )
+    )
+    db.commit()
+
+
+class Scheduler:
+    """Runs due jobs, taking each one's lease first."""
+
+    def __init__(self, jobs: Optional[List[Job]] = None, holder: Optional[str] = None):
+        self.jobs = JOBS if jobs is None else jobs
+        self.holder = holder or f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def run_job(self, job: Job) -> Optional[Dict[str, Any]]:
+        """
+        Run one job if its lease can be taken.
+
+        Returns:
+            The job's counts, or None if it was not due or ran elsewhere
+        """
+        db = database.SessionLocal()
+        try:
+            if not acquire_lease(db, job.name, self.holder):
+                return None
+
+            def heartbeat() -> None:
+                if not renew_lease(db, job.name, self.holder):
+                    raise LeaseLost(job.name)
+
+            try:
+                result = job.run(heartbeat)
+            except LeaseLost:
+                return None
+            except Exception as e:
+                print(f"Job {job.name} failed: {e}")
+                release_lease(db, job.name, self.holder, job.interval, json.dumps({"error": str(e)}))
+                return None
+            release_lease(db, job.name, self.holder, job.interval, json.dumps(result))
+            return result
+        finally:
+            db.close()
+
+    def run_pending(self) -> Dict[str, Dict[str, Any]]:
+        """Run every job that is due, returning the counts of those that ran here."""
+        results = {}
+        for job in self.jobs:
+            if self._stop.is_set():
+                break
+            result = self.run_job(job)
+            if result is not None:
+                results[job.name] = result
+        return results
+
+    def run_forever(self, poll_seconds: float = SCHEDULER_POLL_SECONDS) -> None:
+        """Run due jobs every poll_seconds until stop() is called."""
+        while not self._stop.is_set():
+            try:
+                self.run_pending()
+            except Exception as e:
+                # Keep the loop alive if the database is briefly unavailable
+                print(f"Scheduler error: {e}")
+            self._stop.wait(poll_seconds)
+
+    def start(self) -> None:
+        """Run the scheduler in a background thread of this process."""
+        self._stop.clear()
+        self._thread = threading.Thread(target=self.run_forever, name="scheduler", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the background thread, letting the current job finish."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+
+scheduler = Scheduler()
+
+
+def main(argv=None) -> int:
+    """Command line entry point for the maintenance worker."""
+    parser = argparse.ArgumentParser(description="Run scheduled maintenance jobs")
+    parser.add_argument("--once", action="store_true", help="run due jobs once and exit")
+    parser.add_argument("--job", action="append", choices=[job.name for job in JOBS],
+                        help="only run this job (repeatable)")
+    parser.add_argument("--poll-seconds", type=float, default=SCHEDULER_POLL_SECONDS)
+    args = parser.parse_args(argv)
+
+    database.init_db()
+    jobs = [job for job in JOBS if not args.job or job.name in args.job]
+    worker = Scheduler(jobs)
+
+    if args.once:
+        for name, result in worker.run_pending().items():
+            print(f"{name}: {json.dumps(result)}")
+        return 0
+
+    try:
+        worker.run_forever(args.poll_seconds)
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,14 +1,21 @@
 """Pydantic schemas for request/response validation."""
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
 from typing import Optional, List
-from datetime import datetime
+from datetime import date, datetime
 
 
 class TaskBase(BaseModel):
     """Base task schema."""
     task: str
     owner: Optional[str] = None
-    due_date: Optional[str] = None  # YYYY-MM-DD format
+    due_date: Optional[date] = None  # YYYY-MM-DD format
+
+
+def reject_null(value):
+    """Reject an explicit null for a field whose column is NOT NULL."""
+    if value is None:
+        raise ValueError("may be omitted but not null")
+    return value
 
 
 class TaskCreate(TaskBase):
@@ -20,8 +27,36 @@ class TaskUpdate(BaseModel):
     """Schema for updating a task."""
     task: Optional[str] = None
     owner: Optional[str] = None
-    due_date: Optional[str] = None
+    due_date: Optional[date] = None
+    status: Optional[str] = Field(None, pattern="^(open|done)$")
+
+    _not_null = field_validator("task", "status")(reject_null)
+
+
+class TaskSelection(BaseModel):
+    """Schema selecting a set of tasks by id list and/or filter."""
+    ids: Optional[List[int]] = Field(None, min_length=1, max_length=1000)
+    transcript_id: Optional[int] = None
+    status: Optional[str] = Field(None, pattern="^(open|done)$")
+    owner: Optional[str] = None
+
+
+class BulkTaskChanges(BaseModel):
+    """Fields that can be set on many tasks at once."""
     status: Optional[str] = Field(None, pattern="^(open|done)$")
+    due_date: Optional[date] = None
+
+    _not_null = field_validator("status")(reject_null)
+
+
+class BulkTaskUpdate(TaskSelection):
+    """Schema for updating a set of tasks."""
+    changes: BulkTaskChanges
+
+
+class BulkTaskResult(BaseModel):
+    """Schema for bulk mutation response."""
+    affected: int
 
 
 class TaskResponse(TaskBase):
@@ -30,10 +65,72 @@ class TaskResponse(TaskBase):
     transcript_id: int
     status: str
     created_at: datetime
+    source_start: Optional[int] = None
+    source_end: Optional[int] = None
+    owner_id: Optional[int] = None
+    version: int = 1
+    overdue: bool = False
 
     class Config:
         from_attributes = True
 
+    @field_validator("overdue")
+    @classmethod
+    def overdue_today(cls, value, info):
+        """Judge overdue by today's date; the stored flag lags until the scheduler runs."""
+        due_date = info.data.get("due_date")
+        return info.data.get("status") == "open" and due_date is not None and due_date < date.today()
+
+
+class TaskPage(BaseModel):
+    """Schema for one page of a task listing."""
+    tasks: List[TaskResponse]
+    next_cursor: Optional[str] = None  # Pass as ?cursor= to get the next page
+
+
+class TaskMutation(BaseModel):
+    """One queued change to a task, made against a known version."""
+    id: int
+    version: int
+    changes: TaskUpdate
+
+
+class TaskMutationBatch(BaseModel):
+    """Schema for a batch of queued task changes."""
+    mutations: List[TaskMutation] = Field(..., min_length=1, max_length=500)
+
+
+class TaskConflict(BaseModel):
+    """A mutation that was not applied because the task changed meanwhile."""
+    id: int
+    current: Optional[TaskResponse] = None  # None if the task was deleted
+
+
+class TaskMutationResult(BaseModel):
+    """Schema for batch mutation response: only the rows that changed."""
+    tasks: List[TaskResponse]
+    conflicts: List[TaskConflict]
+
+
+class OwnerSummary(BaseModel):
+    """Schema for an owner with task counts."""
+    id: int
+    name: str
+    open_tasks: int = 0
+    done_tasks: int = 0
+
+
+class OwnerResponse(BaseModel):
+    """Schema for an owner and the spellings that resolve to it."""
+    id: int
+    name: str
+    aliases: List[str] = []
+
+
+class OwnerAliasCreate(BaseModel):
+    """Schema for adding an owner alias."""
+    alias: str = Field(..., min_length=1, max_length=255)
+
 
 class TranscriptCreate(BaseModel):
     """Schema for creating a transcript."""
@@ -51,12 +148,52 @@ class TranscriptResponse(BaseModel):
         from_attributes = True
 
 
+class TranscriptSummary(BaseModel):
+    """Schema for transcript history listings, without the full text."""
+    id: int
+    preview: Optional[str] = None
+    text_length: Optional[int] = None
+    created_at: datetime
+    tasks: List[TaskResponse] = []
+
+    class Config:
+        from_attributes = True
+
+
+class ArchivedTranscriptSummary(BaseModel):
+    """Schema for an archived transcript listing entry."""
+    id: int
+    created_at: datetime
+    archived_at: datetime
+    task_count: int
+
+    class Config:
+        from_attributes = True
+
+
+class ArchivedTranscriptResponse(BaseModel):
+    """Schema for a restored archived transcript."""
+    id: int
+    text: str
+    created_at: datetime
+    archived_at: datetime
+    tasks: List[TaskResponse] = []
+
+
 class ProcessTranscriptResponse(BaseModel):
     """Schema for process transcript response."""
     transcript_id: int
     tasks: List[TaskResponse]
 
 
+class TaskStatsResponse(BaseModel):
+    """Schema for a workspace's task counters."""
+    open_tasks: int = 0
+    done_tasks: int = 0
+    overdue_tasks: int = 0
+    refreshed_at: Optional[datetime] = None  # None when counted live
+
+
 class StatusResponse(BaseModel):
     """Schema for status endpoint response."""
     backend: str
@@ -1,6 +1,29 @@
 // State
 let currentFilter = 'all';
-let allTasks = [];
+let selectedTaskIds = new Set();
+let transcriptChars = new Map();
+
+// Characters of context shown around a task's source sentence
+const SOURCE_CONTEXT_CHARS = 120;
+
+// Task list: rows are fetched a page at a time and only the rows near the
+// viewport are in the DOM
+const PAGE_SIZE = 50;
+const ESTIMATED_ROW_HEIGHT = 100;
+const OVERSCAN_PX = 600;
+let loadedTasks = [];
+let nextCursor = null;
+let pageRequest = null;
+let listGeneration = 0;
+let rowHeights = new Map();
+let taskVersions = new Map();
+let renderPending = false;
+
+// Status changes are queued and sent together after this many milliseconds
+const MUTATION_FLUSH_MS = 400;
+let pendingMutations = new Map();
+let mutationTimer = null;
+let mutationChain = Promise.resolve();
 
 // Initialize on page load
 document.addEventListener('DOMContentLoaded', () => {
@@ -9,6 +32,13 @@ document.addEventListener('DOMContentLoaded', () => {
     setupEventListeners();
 });
 
+// Send queued changes before the page goes away
+window.addEventListener('pagehide', () => {
+    if (pendingMutations.size === 0) return;
+    const body = JSON.stringify({ mutations: takePendingMutations() });
+    navigator.sendBeacon('/api/tasks/mutations', new Blob([body], { type: 'application/json' }));
+});
+
 // Setup event listeners
 function setupEventListeners() {
     // Transcript form submission
@@ -23,10 +53,13 @@ function setupEventListeners() {
             document.querySelectorAll('.filter-btn').forEach(b => b.classList.remove('active'));
             e.target.classList.add('active');
             
-            // Render tasks with filter
-            renderTasks();
+            // Fetch tasks with filter
+            loadTasks();
         });
     });
+
+    // Render the rows that scroll into view
+    document.getElementById('tasksList').addEventListener('scroll', scheduleRender);
 }
 
 // Handle transcript submission
@@ -102,40 +135,176 @@ function showResult(message, type) {
     }
 }
 
-// Load tasks from API
+// Load the first page of tasks for the current filter
 async function loadTasks() {
-    try {
-        const response = await fetch('/api/tasks');
-        if (!response.ok) throw new Error('Failed to load tasks');
-        
-        allTasks = await response.json();
-        renderTasks();
-    } catch (error) {
-        console.error('Error loading tasks:', error);
-        document.getElementById('tasksList').innerHTML = 
-            '<p class="empty-state">Error loading tasks. Please refresh the page.</p>';
-    }
+    listGeneration++;
+    loadedTasks = [];
+    nextCursor = null;
+    pageRequest = null;
+
+    const container = document.getElementById('tasksList');
+    container.innerHTML = '';
+    container.scrollTop = 0;
+
+    await loadMoreTasks(true);
+}
+
+// Fetch the next page and append it to the loaded rows
+function loadMoreTasks(first = false) {
+    if (pageRequest) return pageRequest;
+    if (!first && !nextCursor) return Promise.resolve();
+
+    const generation = listGeneration;
+    const params = new URLSearchParams({ limit: PAGE_SIZE });
+    if (currentFilter !== 'all') params.set('status', currentFilter);
+    if (nextCursor) params.set('cursor', nextCursor);
+
+    pageRequest = (async () => {
+        try {
+            const response = await fetch(`/api/tasks/page?${params}`);
+            if (!response.ok) throw new Error('Failed to load tasks');
+
+            const page = await response.json();
+            // The filter changed while this page was loading
+            if (generation !== listGeneration) return;
+
+            // A row edited since the last page can show up again; keep the first copy
+            const shown = new Set(loadedTasks.map(task => task.id));
+            loadedTasks.push(...page.tasks.filter(task => !shown.has(task.id)));
+            page.tasks.forEach(rememberVersion);
+            nextCursor = page.next_cursor;
+            pageRequest = null;
+            renderTasks();
+        } catch (error) {
+            console.error('Error loading tasks:', error);
+            if (generation === listGeneration) {
+                pageRequest = null;
+                document.getElementById('tasksList').innerHTML =
+                    '<p class="empty-state">Error loading tasks. Please refresh the page.</p>';
+            }
+        }
+    })();
+    return pageRequest;
 }
 
-// Render tasks based on current filter
+// Render the loaded tasks
 function renderTasks() {
     const container = document.getElementById('tasksList');
-    
-    // Filter tasks
-    let tasks = allTasks;
-    if (currentFilter !== 'all') {
-        tasks = allTasks.filter(task => task.status === currentFilter);
-    }
 
-    if (tasks.length === 0) {
-        const emptyMessage = currentFilter === 'all' 
+    if (loadedTasks.length === 0) {
+        // Every loaded row was removed; show the next page if there is one
+        if (nextCursor) {
+            loadMoreTasks();
+            return;
+        }
+        const emptyMessage = currentFilter === 'all'
             ? 'No action items yet. Process a transcript to get started.'
             : `No ${currentFilter} tasks.`;
         container.innerHTML = `<p class="empty-state">${emptyMessage}</p>`;
+        updateBulkActions();
+        return;
+    }
+
+    if (!container.querySelector('.tasks-window')) {
+        container.innerHTML = '<div class="tasks-spacer"><div class="tasks-window"></div></div>';
+    }
+    renderWindow();
+    updateBulkActions();
+}
+
+// Coalesce scroll events into one render per frame
+function scheduleRender() {
+    if (renderPending) return;
+    renderPending = true;
+    requestAnimationFrame(() => {
+        renderPending = false;
+        if (loadedTasks.length > 0) renderWindow();
+    });
+}
+
+function rowHeight(task) {
+    return rowHeights.get(task.id) || ESTIMATED_ROW_HEIGHT;
+}
+
+// Put the rows around the viewport in the DOM, reusing nodes already there
+function renderWindow() {
+    const container = document.getElementById('tasksList');
+    const spacer = container.querySelector('.tasks-spacer');
+    const rows = container.querySelector('.tasks-window');
+    if (!rows) return;
+
+    const top = container.scrollTop - OVERSCAN_PX;
+    const bottom = container.scrollTop + container.clientHeight + OVERSCAN_PX;
+
+    let start = 0;
+    let offset = 0;
+    while (start < loadedTasks.length && offset + rowHeight(loadedTasks[start]) < top) {
+        offset += rowHeight(loadedTasks[start]);
+        start++;
+    }
+    const windowTop = offset;
+    let end = start;
+    while (end < loadedTasks.length && offset < bottom) {
+        offset += rowHeight(loadedTasks[end]);
+        end++;
+    }
+
+    // Reused nodes keep their open source and edit panels
+    const existing = new Map([...rows.children].map(node => [Number(node.dataset.taskId), node]));
+    const fragment = document.createDocumentFragment();
+    for (const task of loadedTasks.slice(start, end)) {
+        fragment.appendChild(existing.get(task.id) || createTaskNode(task));
+    }
+    rows.replaceChildren(fragment);
+    rows.style.transform = `translateY(${windowTop}px)`;
+
+    measureRows(rows);
+    spacer.style.height = `${loadedTasks.reduce((total, task) => total + rowHeight(task), 0)}px`;
+
+    // Fetch more before the user reaches the end of what is loaded
+    if (end >= loadedTasks.length && nextCursor) {
+        loadMoreTasks();
+    }
+}
+
+// Record the rendered height of each row, including its margin
+function measureRows(rows) {
+    for (const node of rows.children) {
+        const margin = parseFloat(getComputedStyle(node).marginBottom) || 0;
+        rowHeights.set(Number(node.dataset.taskId), node.offsetHeight + margin);
+    }
+}
+
+function createTaskNode(task) {
+    const template = document.createElement('template');
+    template.innerHTML = createTaskCard(task).trim();
+    return template.content.firstElementChild;
+}
+
+function rememberVersion(task) {
+    taskVersions.set(task.id, task.version);
+}
+
+// Swap in a changed task, dropping it if it no longer matches the filter
+function replaceTask(task) {
+    rememberVersion(task);
+    const index = loadedTasks.findIndex(t => t.id === task.id);
+    if (index === -1) return;
+
+    if (currentFilter !== 'all' && task.status !== currentFilter) {
+        removeTask(task.id);
         return;
     }
+    loadedTasks[index] = task;
+    const node = document.getElementById(`task-${task.id}`);
+    if (node) node.replaceWith(createTaskNode(task));
+}
 
-    container.innerHTML = tasks.map(task => createTaskCard(task)).join('');
+function removeTask(taskId) {
+    loadedTasks = loadedTasks.filter(task => task.id !== taskId);
+    rowHeights.delete(taskId);
+    const node = document.getElementById(`task-${taskId}`);
+    if (node) node.remove();
 }
 
 // Create task card HTML
@@ -146,11 +315,13 @@ function createTaskCard(task) {
         : `<button class="task-btn" onclick="markTaskOpen(${task.id})">Reopen</button>`;
 
     return `
-        <div class="task-card ${doneClass}" id="task-${task.id}">
+        <div class="task-card ${doneClass}" id="task-${task.id}" data-task-id="${task.id}">
             <div class="task-header">
+                <input type="checkbox" class="task-select" onchange="toggleSelection(${task.id}, this.checked)" ${selectedTaskIds.has(task.id) ? 'checked' : ''}>
                 <div class="task-text">${escapeHtml(task.task)}</div>
                 <div class="task-actions">
                     ${statusBtn}
+                    ${task.source_start != null ? `<button class="task-btn" onclick="toggleSource(${task.id})">Source</button>` : ''}
                     <button class="task-btn" onclick="toggleEdit(${task.id})">Edit</button>
                     <button class="task-btn delete" onclick="deleteTask(${task.id})">Delete</button>
                 </div>
@@ -158,7 +329,9 @@ function createTaskCard(task) {
             <div class="task-meta">
                 ${task.owner ? `<div class="task-meta-item"><strong>Owner:</strong> ${escapeHtml(task.owner)}</div>` : ''}
                 ${task.due_date ? `<div class="task-meta-item"><strong>Due:</strong> ${task.due_date}</div>` : ''}
+                ${task.overdue && task.status === 'open' ? '<div class="task-meta-item overdue">Overdue</div>' : ''}
             </div>
+            <div id="source-${task.id}" class="task-source" style="display: none;"></div>
             <div id="edit-${task.id}" class="edit-form" style="display: none;">
                 <div class="form-group">
                     <label>Task Description</label>
@@ -181,10 +354,52 @@ function createTaskCard(task) {
     `;
 }
 
+// Toggle the originating sentence of a task, highlighted in its transcript
+async function toggleSource(taskId) {
+    const panel = document.getElementById(`source-${taskId}`);
+    if (panel.style.display !== 'none') {
+        panel.style.display = 'none';
+        renderWindow();
+        return;
+    }
+
+    const task = loadedTasks.find(t => t.id === taskId);
+    try {
+        let chars = transcriptChars.get(task.transcript_id);
+        if (!chars) {
+            const response = await fetch(`/api/transcripts/${task.transcript_id}`);
+            if (!response.ok) throw new Error('Failed to load transcript');
+
+            // Offsets are code points, so index by character rather than UTF-16 unit
+            chars = Array.from((await response.json()).text);
+            transcriptChars.set(task.transcript_id, chars);
+        }
+
+        panel.innerHTML = renderSourceExcerpt(chars, task.source_start, task.source_end);
+        panel.style.display = 'block';
+        renderWindow();
+    } catch (error) {
+        alert(`Error: ${error.message}`);
+    }
+}
+
+// Render a transcript excerpt with the source sentence highlighted
+function renderSourceExcerpt(chars, start, end) {
+    const from = Math.max(0, start - SOURCE_CONTEXT_CHARS);
+    const to = Math.min(chars.length, end + SOURCE_CONTEXT_CHARS);
+
+    return (from > 0 ? '…' : '') +
+        escapeHtml(chars.slice(from, start).join('')) +
+        `<mark>${escapeHtml(chars.slice(start, end).join(''))}</mark>` +
+        escapeHtml(chars.slice(end, to).join('')) +
+        (to < chars.length ? '…' : '');
+}
+
 // Toggle edit form
 function toggleEdit(taskId) {
     const editForm = document.getElementById(`edit-${taskId}`);
     editForm.style.display = editForm.style.display === 'none' ? 'block' : 'none';
+    renderWindow();
 }
 
 // Save task edit
@@ -209,8 +424,9 @@ async function saveEdit(taskId) {
 
         if (!response.ok) throw new Error('Failed to update task');
 
-        await loadTasks();
-        toggleEdit(taskId);
+        // The new card replaces the one with the open edit form
+        replaceTask(await response.json());
+        renderTasks();
     } catch (error) {
         alert(`Error: ${error.message}`);
     }
@@ -228,20 +444,83 @@ async function markTaskOpen(taskId) {
 
 // Update task status
 async function updateTaskStatus(taskId, status) {
+    queueTaskMutation(taskId, { status });
+}
+
+// Apply a change locally and queue it for the next batch
+function queueTaskMutation(taskId, changes) {
+    const task = loadedTasks.find(t => t.id === taskId);
+    if (!task) return;
+
+    // Later changes to the same task overwrite earlier ones
+    pendingMutations.set(taskId, { ...(pendingMutations.get(taskId) || {}), ...changes });
+    replaceTask({ ...task, ...changes });
+    renderTasks();
+
+    clearTimeout(mutationTimer);
+    mutationTimer = setTimeout(flushMutations, MUTATION_FLUSH_MS);
+}
+
+// Drain the queue into mutations against the last known task versions
+function takePendingMutations() {
+    const mutations = [...pendingMutations].map(([id, changes]) => ({
+        id,
+        version: taskVersions.get(id),
+        changes
+    }));
+    pendingMutations = new Map();
+    return mutations;
+}
+
+// Send queued changes, one batch at a time so versions stay current
+function flushMutations() {
+    mutationTimer = null;
+    mutationChain = mutationChain.then(sendMutations);
+    return mutationChain;
+}
+
+async function sendMutations() {
+    if (pendingMutations.size === 0) return;
+    const mutations = takePendingMutations();
+
     try {
-        const response = await fetch(`/api/tasks/${taskId}`, {
-            method: 'PATCH',
+        const response = await fetch('/api/tasks/mutations', {
+            method: 'POST',
             headers: {
                 'Content-Type': 'application/json',
             },
-            body: JSON.stringify({ status })
+            body: JSON.stringify({ mutations })
         });
 
-        if (!response.ok) throw new Error('Failed to update task');
+        if (!response.ok) {
+            const error = await response.json();
+            throw new Error(error.detail || 'Failed to update tasks');
+        }
 
-        await loadTasks();
+        const result = await response.json();
+        const changed = new Map(result.tasks.map(task => [task.id, task]));
+        for (const conflict of result.conflicts) {
+            changed.set(conflict.id, conflict.current);
+        }
+
+        // Take the server's copy of each changed or conflicting task, keeping
+        // changes queued while this batch was in flight
+        for (const [id, task] of changed) {
+            if (task === null) {
+                removeTask(id);
+                continue;
+            }
+            rememberVersion(task);
+            replaceTask({ ...task, ...(pendingMutations.get(id) || {}) });
+        }
+        renderTasks();
+
+        if (result.conflicts.length > 0) {
+            alert(`${result.conflicts.length} task(s) were changed elsewhere and have been refreshed.`);
+        }
     } catch (error) {
         alert(`Error: ${error.message}`);
+        await loadTasks();
     }
 }
 
@@ -258,6 +537,80 @@ async function deleteTask(taskId) {
 
         if (!response.ok) throw new Error('Failed to delete task');
 
+        selectedTaskIds.delete(taskId);
+        removeTask(taskId);
+        renderTasks();
+    } catch (error) {
+        alert(`Error: ${error.message}`);
+    }
+}
+
+// Toggle a task in the multi-select
+function toggleSelection(taskId, checked) {
+    if (checked) {
+        selectedTaskIds.add(taskId);
+    } else {
+        selectedTaskIds.delete(taskId);
+    }
+    updateBulkActions();
+}
+
+// Clear the multi-select
+function clearSelection() {
+    selectedTaskIds.clear();
+    document.querySelectorAll('.task-select').forEach(checkbox => { checkbox.checked = false; });
+    updateBulkActions();
+}
+
+// Show or hide the bulk action bar
+function updateBulkActions() {
+    const bar = document.getElementById('bulkActions');
+    if (selectedTaskIds.size === 0) {
+        bar.style.display = 'none';
+        return;
+    }
+    document.getElementById('selectedCount').textContent = `${selectedTaskIds.size} selected`;
+    bar.style.display = 'flex';
+}
+
+// Send a bulk mutation for the selected tasks
+async function bulkRequest(method, body) {
+    const response = await fetch('/api/tasks', {
+        method,
+        headers: {
+            'Content-Type': 'application/json',
+        },
+        body: JSON.stringify({ ids: [...selectedTaskIds], ...body })
+    });
+
+    if (!response.ok) {
+        const error = await response.json();
+        throw new Error(error.detail || 'Bulk update failed');
+    }
+
+    return response.json();
+}
+
+// Set the status of all selected tasks
+async function bulkUpdateStatus(status) {
+    try {
+        await bulkRequest('PATCH', { changes: { status } });
+        selectedTaskIds.clear();
+        await loadTasks();
+    } catch (error) {
+        alert(`Error: ${error.message}`);
+    }
+}
+
+// Delete all selected tasks
+async function bulkDelete() {
+    if (!confirm(`Are you sure you want to delete ${selectedTaskIds.size} task(s)?`)) {
+        return;
+    }
+
+    try {
+        await bulkRequest('DELETE', {});
+        selectedTaskIds.clear();
         await loadTasks();
     } catch (error) {
         alert(`Error: ${error.message}`);
@@ -294,7 +647,7 @@ function renderTranscriptHistory(transcripts) {
                 <span>${formatDate(transcript.created_at)}</span>
                 <span class="task-count">${transcript.tasks.length} task(s)</span>
             </div>
-            <div class="history-text">${escapeHtml(transcript.text)}</div>
+            <div class="history-text">${escapeHtml(transcript.preview)}${transcript.text_length > (transcript.preview || '').length ? '…' : ''}</div>
         </div>
     `).join('');
 }
@@ -0,0 +1,400 @@
+"""Streaming export and bulk import of tasks and transcripts.
+
+Exports read rows through a server-side cursor (`yield_per`) and emit
+NDJSON or CSV in fixed-size chunks, so memory stays flat at any table size.
+Imports parse the file lazily and insert it in chunks with `executemany`,
+or with `COPY` on Postgres, inside a single transaction.
+
+Command line usage:
+
+    python -m app.transfer export tasks --workspace acme --format csv --output tasks.csv
+    python -m app.transfer import tasks tasks.csv --workspace acme
+
+Files carry no workspace column: every export covers one workspace and
+every import loads into one, so tenants never mix through a file.
+"""
+import argparse
+import csv
+import io
+import json
+import sys
+from datetime import date, datetime
+from typing import Any, Dict, Iterable, Iterator, List, Optional, TextIO
+
+from sqlalchemy import Table, insert, select, text
+from sqlalchemy.orm import Session
+
+from app.cache import invalidate
+from app.database import DEFAULT_WORKSPACE
+from app.dedup import task_fingerprint
+from app.models import CompressedText, Task, Transcript, make_preview
+from app.owners import owner_directory
+
+FORMATS = ("ndjson", "csv")
+
+MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",
+}
+
+EXPORTS = {
+    "transcripts": (Transcript, ["id", "text", "created_at"]),
+    "tasks": (
+        Task,
+        [
+            "id", "transcript_id", "task", "owner", "due_date", "status", "created_at",
+            "fingerprint", "source_start", "source_end",
+        ],
+    ),
+}
+
+# Rows fetched per round trip from the server-side cursor
+YIELD_PER = 1000
+
+# Rows inserted per executemany/COPY call
+IMPORT_CHUNK_SIZE = 1000
+
+# Approximate size of each chunk handed to the response stream
+CHUNK_BYTES = 64 * 1024
+
+
+class TransferError(ValueError):
+    """Raised when an import file cannot be parsed or loaded."""
+
+
+def serialize_value(value: Any) -> Any:
+    """Convert a column value into a JSON/CSV friendly value."""
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return value
+
+
+def iter_rows(db: Session, kind: str, workspace: str) -> Iterator[Dict[str, Any]]:
+    """
+    Iterate over a workspace's rows of an exportable table in id order.
+
+    Args:
+        db: Database session
+        kind: "tasks" or "transcripts"
+        workspace: Workspace to export
+
+    Yields:
+        One dict per row with JSON/CSV friendly values
+    """
+    model, fields = EXPORTS[kind]
+    columns = [getattr(model, field) for field in fields]
+    query = select(*columns).where(model.workspace == workspace).order_by(model.id)
+    result = db.execute(query.execution_options(yield_per=YIELD_PER))
+    for row in result:
+        yield {field: serialize_value(value) for field, value in zip(fields, row)}
+
+
+def iter_export(db: Session, kind: str, fmt: str, workspace: str) -> Iterator[str]:
+    """
+    Stream a table as NDJSON or CSV text chunks.
+
+    Args:
+        db: Database session
+        kind: "tasks" or "transcripts"
+        fmt: "ndjson" or "csv"
+        workspace: Workspace to export
+
+    Yields:
+        Text chunks of roughly CHUNK_BYTES each
+    """
+    _, fields = EXPORTS[kind]
+    buffer = io.StringIO()
+    writer = None
+    if fmt == "csv":
+        writer = csv.DictWriter(buffer, fieldnames=fields)
+        writer.writeheader()
+
+    for row in iter_rows(db, kind, workspace):
+        if writer is not None:
+            writer.writerow(row)
+        else:
+            buffer.write(json.dumps(row))
+            buffer.write("\n")
+
+        if buffer.tell() >= CHUNK_BYTES:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate(0)
+
+    if buffer.tell():
+        yield buffer.getvalue()
+
+
+def parse_records(stream: TextIO, fmt: str) -> Iterator[Dict[str, Any]]:
+    """
+    Lazily parse an NDJSON or CSV file into records.
+
+    Empty CSV cells are read as NULL.
+
+    Raises:
+        TransferError: If the file is not valid UTF-8, or a line is not JSON
+    """
+    # The stream decodes as it is read, so bad bytes surface mid-parse
+    try:
+        if fmt == "csv":
+            for record in csv.DictReader(stream):
+                yield {key: (value if value != "" else None) for key, value in record.items()}
+            return
+
+        for line_number, line in enumerate(stream, start=1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError as e:
+                raise TransferError(f"Invalid JSON on line {line_number}: {e}")
+    except UnicodeDecodeError as e:
+        raise TransferError(f"File is not valid UTF-8: {e.reason} at byte {e.start}")
+
+
+def _parse_datetime(value: Any) -> Optional[datetime]:
+    if value is None or isinstance(value, datetime):
+        return value
+    return datetime.fromisoformat(value)
+
+
+def _parse_date(value: Any) -> Optional[date]:
+    if value is None or isinstance(value, date):
+        return value
+    return date.fromisoformat(value)
+
+
+def _coerce(kind: str, record: Dict[str, Any]) -> Dict[str, Any]:
+    """Keep known fields and convert values to column types."""
+    _, fields = EXPORTS[kind]
+    row = {field: record.get(field) for field in fields}
+
+    if row["id"] is not None:
+        row["id"] = int(row["id"])
+    row["created_at"] = _parse_datetime(row["created_at"]) or datetime.utcnow()
+
+    if kind == "transcripts":
+        if not row["text"]:
+            raise TransferError(f"Transcript {row['id']} has no text")
+        row["preview"] = make_preview(row["text"])
+        row["text_length"] = len(row["text"])
+        return row
+
+    if row["transcript_id"] is None or not row["task"]:
+        raise TransferError(f"Task {row['id']} needs transcript_id and task")
+    row["transcript_id"] = int(row["transcript_id"])
+    row["due_date"] = _parse_date(row["due_date"])
+    row["status"] = row["status"] or "open"
+    if row["status"] not in ("open", "done"):
+        raise TransferError(f"Task {row['id']} has invalid status {row['status']!r}")
+    # Inserts bypass the ORM, so set the flag Task._set_overdue() would
+    row["overdue"] = (
+        row["status"] == "open" and row["due_date"] is not None and row["due_date"] < date.today()
+    )
+    row["fingerprint"] = row["fingerprint"] or task_fingerprint(row["task"], row["owner"])
+    for field in ("source_start", "source_end"):
+        if row[field] is not None:
+            row[field] = int(row[field])
+    return row
+
+
+def _copy_rows(db: Session, table: Table, rows: List[Dict[str, Any]]) -> None:
+    """Load rows with Postgres COPY through the raw psycopg2 cursor."""
+    fields = list(rows[0])
+    columns = table.c
+    # COPY bypasses column types, so compress by hand and send bytea as hex
+    compressed = {field for field in fields if isinstance(columns[field].type, CompressedText)}
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    for row in rows:
+        writer.writerow([
+            "\\x" + columns[field].type.process_bind_param(row[field], None).hex()
+            if field in compressed and row[field] is not None
+            else serialize_value(row[field])
+            for field in fields
+        ])
+    buffer.seek(0)
+
+    cursor = db.connection().connection.cursor()
+    try:
+        cursor.copy_expert(
+            f"COPY {table.name} ({', '.join(fields)}) FROM STDIN WITH (FORMAT csv)", buffer
+        )
+    finally:
+        cursor.close()
+
+
+def _insert_chunk(db: Session, kind: str, rows: List[Dict[str, Any]]) -> None:
+    """Insert one chunk, splitting rows with and without explicit ids."""
+    model, _ = EXPORTS[kind]
+    with_id = [row for row in rows if row["id"] is not None]
+    without_id = [{k: v for k, v in row.items() if k != "id"} for row in rows if row["id"] is None]
+
+    for batch in (with_id, without_id):
+        if not batch:
+            continue
+        if db.get_bind().dialect.name == "postgresql":
+            _copy_rows(db, model.__table__, batch)
+        else:
+            db.execute(insert(model.__table__), batch)
+
+
+def _check_workspace(
+    db: Session, kind: str, rows: List[Dict[str, Any]], workspace: str
+) -> List[Dict[str, Any]]:
+    """
+    Keep an import chunk inside its workspace.
+
+    Raises:
+        TransferError: If a task's transcript is not in the workspace, or
+            an explicit id belongs to another workspace's row
+    """
+    model, _ = EXPORTS[kind]
+    ids = {row["id"] for row in rows if row["id"] is not None}
+    if ids:
+        taken = db.execute(
+            select(model.id).where(model.id.in_(ids), model.workspace != workspace)
+        ).scalars().first()
+        if taken is not None:
+            raise TransferError(f"{kind[:-1].capitalize()} {taken} belongs to another workspace")
+
+    if kind == "tasks":
+        transcript_ids = {row["transcript_id"] for row in rows}
+        found = set(db.execute(
+            select(Transcript.id).where(
+                Transcript.id.in_(transcript_ids), Transcript.workspace == workspace
+            )
+        ).scalars())
+        missing = transcript_ids - found
+        if missing:
+            raise TransferError(f"Transcript {min(missing)} not found in workspace {workspace!r}")
+    return rows
+
+
+def _with_owner_ids(
+    db: Session, kind: str, rows: List[Dict[str, Any]], workspace: str
+) -> List[Dict[str, Any]]:
+    """Resolve the owner of each imported task, inside the import transaction."""
+    if kind != "tasks":
+        return rows
+    owner_ids = owner_directory.resolve(db, workspace, [row["owner"] for row in rows], commit=False)
+    for row in rows:
+        row["owner_id"] = owner_ids.get(row["owner"])
+    return rows
+
+
+def import_records(
+    db: Session,
+    kind: str,
+    records: Iterable[Dict[str, Any]],
+    chunk_size: int = IMPORT_CHUNK_SIZE,
+    workspace: str = DEFAULT_WORKSPACE,
+) -> int:
+    """
+    Bulk load records into a table inside a single transaction.
+
+    Args:
+        db: Database session
+        kind: "tasks" or "transcripts"
+        records: Parsed records, typically from parse_records()
+        chunk_size: Rows per executemany/COPY call
+        workspace: Workspace the imported rows are placed in
+
+    Returns:
+        Number of rows imported
+
+    Raises:
+        TransferError: If a record is invalid or refers to another
+            workspace's rows; nothing is imported
+    """
+    model, _ = EXPORTS[kind]
+    count = 0
+    chunk = []
+    try:
+        for record in records:
+            try:
+                row = _coerce(kind, record)
+                row["workspace"] = workspace
+                chunk.append(row)
+            except TransferError:
+                raise
+            except (AttributeError, TypeError, ValueError) as e:
+                raise TransferError(f"Invalid record {count + len(chunk) + 1}: {e}")
+            if len(chunk) >= chunk_size:
+                _check_workspace(db, kind, chunk, workspace)
+                _insert_chunk(db, kind, _with_owner_ids(db, kind, chunk, workspace))
+                count += len(chunk)
+                chunk = []
+        if chunk:
+            _check_workspace(db, kind, chunk, workspace)
+            _insert_chunk(db, kind, _with_owner_ids(db, kind, chunk, workspace))
+            count += len(chunk)
+
+        if db.get_bind().dialect.name == "postgresql":
+            # Explicit ids bypass the serial sequence, so move it past them
+            table = model.__tablename__
+            db.execute(text(
+                f"SELECT setval(pg_get_serial_sequence('{table}', 'id'), "
+                f"COALESCE((SELECT MAX(id) FROM {table}), 1))"
+            ))
+        invalidate(db, "tasks", "transcripts")
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    return count
+
+
+def main(argv=None) -> int:
+    """Command line entry point for exports and imports."""
+    from app.database import init_db, session_factory
+
+    parser = argparse.ArgumentParser(description="Export or import tasks and transcripts")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    export_parser = subparsers.add_parser("export", help="Stream a table to a file")
+    export_parser.add_argument("kind", choices=sorted(EXPORTS))
+    export_parser.add_argument("--format", choices=FORMATS, default=None)
+    export_parser.add_argument("--output", "-o", default="-", help="Output file (default: stdout)")
+    export_parser.add_argument("--workspace", required=True, help="Workspace to export")
+
+    import_parser = subparsers.add_parser("import", help="Bulk load a file into a table")
+    import_parser.add_argument("kind", choices=sorted(EXPORTS))
+    import_parser.add_argument("path", help="NDJSON or CSV file")
+    import_parser.add_argument("--format", choices=FORMATS, default=None)
+    import_parser.add_argument("--chunk-size", type=int, default=IMPORT_CHUNK_SIZE)
+    import_parser.add_argument("--workspace", required=True, help="Workspace to import into")
+
+    args = parser.parse_args(argv)
+    path = args.output if args.command == "export" else args.path
+    fmt = args.format or ("csv" if path.endswith(".csv") else "ndjson")
+
+    init_db()
+    db = session_factory(args.workspace)()
+    try:
+        if args.command == "export":
+            out = sys.stdout if path == "-" else open(path, "w", newline="", encoding="utf-8")
+            try:
+                for chunk in iter_export(db, args.kind, fmt, args.workspace):
+                    out.write(chunk)
+            finally:
+                if out is not sys.stdout:
+                    out.close()
+        else:
+            with open(path, newline="", encoding="utf-8") as stream:
+                count = import_records(
+                    db, args.kind, parse_records(stream, fmt),
+                    chunk_size=args.chunk_size, workspace=args.workspace
+                )
+            print(f"Imported {count} {args.kind}")
+    except TransferError as e:
+        print(f"Import failed: {e}", file=sys.stderr)
+        return 1
+    finally:
+        db.close()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,136 @@
+"""
+Benchmark transcript storage: plain TEXT vs compressed text + preview.
+
+Builds two throwaway SQLite databases with the same synthetic transcripts,
+one with the original schema (plain `text` column, listings read full rows)
+and one with the current models (compressed `text`, listings read only the
+stored preview), then reports file size and history-listing latency.
+
+Usage:
+    python bench_transcript_storage.py [--transcripts 2000] [--size 8000]
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+from sqlalchemy import Column, DateTime, Integer, MetaData, Table, Text, create_engine, select
+from sqlalchemy.orm import Session, load_only
+
+sys.path.insert(0, os.path.abspath("."))
+
+from app.database import Base  # noqa: E402
+from app.models import Transcript  # noqa: E402
+
+SENTENCES = [
+    "John will prepare the quarterly sales report by Friday.",
+    "Sarah mentioned she'll reach out to the design team this week.",
+    "We reviewed the onboarding funnel and the drop-off after signup.",
+    "Mike needs to update the pricing slides before the board meeting.",
+    "The team agreed the beta should stay behind a feature flag.",
+    "Alice raised concerns about the migration timeline.",
+    "We need to schedule a follow-up with legal next Monday.",
+    "Support volume is down twelve percent compared to last month.",
+    "Bob is going to draft the hiring plan for the platform team.",
+    "Nobody had updates on the vendor contract yet.",
+]
+
+
+def make_transcript(size: int) -> str:
+    parts = []
+    length = 0
+    while length < size:
+        sentence = random.choice(SENTENCES)
+        parts.append(sentence)
+        length += len(sentence) + 1
+    return " ".join(parts)
+
+
+def file_size(path: str) -> int:
+    return os.path.getsize(path)
+
+
+def vacuum(engine) -> None:
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        conn.exec_driver_sql("VACUUM")
+
+
+def time_listing(run, repeat: int = 50) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        run()
+    return (time.perf_counter() - start) / repeat * 1000
+
+
+def bench_legacy(path: str, texts, limits):
+    metadata = MetaData()
+    transcripts = Table(
+        "transcripts",
+        metadata,
+        Column("id", Integer, primary_key=True),
+        Column("text", Text, nullable=False),
+        Column("created_at", DateTime, nullable=False),
+    )
+    engine = create_engine(f"sqlite:///{path}")
+    metadata.create_all(engine)
+    with engine.begin() as conn:
+        conn.execute(transcripts.insert(), [{"text": t, "created_at": c} for t, c in texts])
+    vacuum(engine)
+
+    latencies = {}
+    with engine.connect() as conn:
+        for limit in limits:
+            query = select(transcripts).order_by(transcripts.c.created_at.desc()).limit(limit)
+            latencies[limit] = time_listing(lambda: conn.execute(query).all())
+    engine.dispose()
+    return file_size(path), latencies
+
+
+def bench_compressed(path: str, texts, limits):
+    engine = create_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(engine)
+    with Session(engine) as db:
+        db.add_all([Transcript(text=t, created_at=c) for t, c in texts])
+        db.commit()
+    vacuum(engine)
+
+    latencies = {}
+    with Session(engine) as db:
+        for limit in limits:
+            def run():
+                db.query(Transcript).options(
+                    load_only(Transcript.id, Transcript.preview, Transcript.text_length, Transcript.created_at)
+                ).order_by(Transcript.created_at.desc()).limit(limit).all()
+                db.expunge_all()
+            latencies[limit] = time_listing(run)
+    engine.dispose()
+    return file_size(path), latencies
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--transcripts", type=int, default=2000)
+    parser.add_argument("--size", type=int, default=8000, help="Characters per transcript")
+    args = parser.parse_args()
+
+    random.seed(42)
+    now = datetime.utcnow()
+    texts = [(make_transcript(args.size), now - timedelta(minutes=i)) for i in range(args.transcripts)]
+    limits = (5, 50)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        legacy_size, legacy_latency = bench_legacy(os.path.join(tmp, "legacy.db"), texts, limits)
+        new_size, new_latency = bench_compressed(os.path.join(tmp, "compressed.db"), texts, limits)
+
+    print(f"{args.transcripts} transcripts of ~{args.size} characters")
+    print(f"{'':24}{'plain TEXT':>14}{'compressed':>14}")
+    print(f"{'database size (MB)':24}{legacy_size / 1e6:>14.2f}{new_size / 1e6:>14.2f}")
+    for limit in limits:
+        print(f"{f'listing limit={limit} (ms)':24}{legacy_latency[limit]:>14.3f}{new_latency[limit]:>14.3f}")
+
+
+if __name__ == "__main__":
+    main()
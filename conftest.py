@@ -0,0 +1,42 @@
+"""Shared pytest fixtures.
+
+Points the application at a throwaway SQLite database before any app module
+is imported, so the test suite never touches a real database.
+"""
+import os
+import tempfile
+
+_TEST_DB_DIR = tempfile.mkdtemp(prefix="meeting-tracker-tests-")
+os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(_TEST_DB_DIR, 'test.db')}"
+
+import pytest  # noqa: E402
+from fastapi.testclient import TestClient  # noqa: E402
+
+from app.database import Base, SessionLocal, engine, init_db  # noqa: E402
+import app.models  # noqa: E402,F401
+
+
+@pytest.fixture
+def db():
+    """Fresh database session on empty tables."""
+    from app.cache import response_cache
+    from app.owners import owner_directory
+
+    Base.metadata.drop_all(bind=engine)
+    init_db()
+    response_cache.clear()
+    owner_directory.clear()
+    session = SessionLocal()
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+@pytest.fixture
+def client(db):
+    """Test client for the FastAPI app, backed by the fresh database."""
+    from app.main import app
+
+    with TestClient(app) as test_client:
+        yield test_client
@@ -0,0 +1,90 @@
+"""Tests for transcript admission control."""
+import asyncio
+
+import pytest
+
+from app import admission
+from app.admission import AdmissionController, Overloaded
+
+
+def test_rejects_when_queue_is_full():
+    controller = AdmissionController(max_concurrent=1, max_queued=0, queue_timeout=1)
+
+    async def scenario():
+        async with controller.slot():
+            with pytest.raises(Overloaded):
+                async with controller.slot():
+                    pass
+
+    asyncio.run(scenario())
+    assert controller.stats()["rejected_queue_full"] == 1
+    assert controller.stats()["in_flight"] == 0
+
+
+def test_queued_request_times_out():
+    controller = AdmissionController(max_concurrent=1, max_queued=1, queue_timeout=0.01)
+
+    async def scenario():
+        async with controller.slot():
+            with pytest.raises(Overloaded):
+                async with controller.slot():
+                    pass
+
+    asyncio.run(scenario())
+    assert controller.stats()["rejected_timeout"] == 1
+    assert controller.stats()["queued"] == 0
+
+
+def test_queued_request_runs_once_a_slot_frees():
+    controller = AdmissionController(max_concurrent=1, max_queued=1, queue_timeout=1)
+    order = []
+
+    async def work(name):
+        async with controller.slot():
+            order.append(name)
+            await asyncio.sleep(0.01)
+
+    async def scenario():
+        await asyncio.gather(work("first"), work("second"))
+
+    asyncio.run(scenario())
+    assert order == ["first", "second"]
+    assert controller.stats()["admitted"] == 2
+
+
+def test_oversized_transcript_is_rejected(client, monkeypatch):
+    monkeypatch.setattr(admission, "MAX_TRANSCRIPT_BYTES", 32)
+
+    response = client.post("/api/transcripts", json={"text": "John will prepare the report. " * 2})
+    assert response.status_code == 413
+
+    response = client.post("/api/transcripts", json={"text": "John will prepare the report. " * 10})
+    assert response.status_code == 413
+
+
+def test_malformed_content_length_is_rejected(client):
+    response = client.post(
+        "/api/transcripts",
+        content=b'{"text": "John will prepare the report."}',
+        headers={"Content-Type": "application/json", "Content-Length": "lots"},
+    )
+    assert response.status_code == 400
+
+
+def test_saturated_service_returns_retry_after(client, monkeypatch):
+    def overloaded(*args, **kwargs):
+        raise Overloaded("Server is busy, try again later", retry_after=7)
+
+    monkeypatch.setattr(admission.extraction_admission, "slot", overloaded)
+
+    response = client.post("/api/transcripts", json={"text": "John will prepare the report."})
+    assert response.status_code == 503
+    assert response.headers["Retry-After"] == "7"
+
+
+def test_admission_stats(client):
+    client.post("/api/transcripts", json={"text": "John will prepare the report."})
+
+    stats = client.get("/api/admission").json()
+    assert stats["in_flight"] == 0
+    assert stats["admitted"] >= 1
@@ -0,0 +1,57 @@
+"""Tests for the bulk task mutation endpoints."""
+from app.models import Task
+
+TRANSCRIPT = "John will prepare the report. Sarah should review the deck. Mike needs to book the room."
+
+
+def test_bulk_update_by_ids(client, db):
+    tasks = client.post("/api/transcripts", json={"text": TRANSCRIPT}).json()["tasks"]
+    ids = [task["id"] for task in tasks[:2]]
+
+    response = client.patch("/api/tasks", json={"ids": ids, "changes": {"status": "done"}})
+
+    assert response.status_code == 200
+    assert response.json() == {"affected": 2}
+    assert {t.id for t in db.query(Task).filter(Task.status == "done")} == set(ids)
+
+
+def test_bulk_update_by_filter(client, db):
+    first = client.post("/api/transcripts", json={"text": TRANSCRIPT}).json()
+    client.post("/api/transcripts", json={"text": "Alice will send the notes."})
+
+    response = client.patch(
+        "/api/tasks",
+        json={"transcript_id": first["transcript_id"], "status": "open", "changes": {"status": "done"}},
+    )
+
+    assert response.json() == {"affected": 3}
+    assert db.query(Task).filter(Task.status == "open").count() == 1
+
+
+def test_bulk_delete(client, db):
+    tasks = client.post("/api/transcripts", json={"text": TRANSCRIPT}).json()["tasks"]
+
+    response = client.request("DELETE", "/api/tasks", json={"ids": [tasks[0]["id"], 9999]})
+
+    assert response.json() == {"affected": 1}
+    assert db.query(Task).count() == 2
+
+
+def test_bulk_requires_selection_and_changes(client):
+    client.post("/api/transcripts", json={"text": TRANSCRIPT})
+
+    assert client.request("DELETE", "/api/tasks", json={}).status_code == 400
+    assert client.patch("/api/tasks", json={"changes": {"status": "done"}}).status_code == 400
+    assert client.patch("/api/tasks", json={"ids": [1], "changes": {}}).status_code == 400
+
+
+def test_null_for_required_field_is_rejected(client):
+    task = client.post("/api/transcripts", json={"text": TRANSCRIPT}).json()["tasks"][0]
+
+    assert client.patch("/api/tasks", json={"ids": [task["id"]], "changes": {"status": None}}).status_code == 422
+    assert client.patch(f"/api/tasks/{task['id']}", json={"task": None}).status_code == 422
+    assert client.post("/api/tasks/mutations", json={"mutations": [
+        {"id": task["id"], "version": task["version"], "changes": {"status": None}}
+    ]}).status_code == 422
+    # Nullable fields may still be cleared
+    assert client.patch(f"/api/tasks/{task['id']}", json={"owner": None}).status_code == 200
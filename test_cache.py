@@ -0,0 +1,70 @@
+"""Tests for the listing response cache."""
+from app.cache import LocalCacheBackend, ResponseCache, current_generations, invalidate, response_cache
+
+
+def test_lru_evicts_least_recently_used():
+    backend = LocalCacheBackend(max_entries=2)
+    backend.set("a", b"1")
+    backend.set("b", b"2")
+    backend.get("a")
+    backend.set("c", b"3")
+
+    assert backend.get("b") is None
+    assert backend.get("a") == b"1" and backend.get("c") == b"3"
+
+
+def test_expired_entries_are_dropped():
+    backend = LocalCacheBackend(ttl=-1)
+    backend.set("a", b"1")
+
+    assert backend.prune_expired() == 1
+    assert backend.get("a") is None
+
+
+def test_listing_is_served_from_cache_until_a_write(client):
+    client.post("/api/transcripts", json={"text": "John will prepare the report."})
+    hits = response_cache.hits
+
+    first = client.get("/api/tasks").json()
+    second = client.get("/api/tasks").json()
+    assert response_cache.hits == hits + 1
+    assert first == second
+
+    client.patch(f"/api/tasks/{first[0]['id']}", json={"status": "done"})
+
+    assert client.get("/api/tasks").json()[0]["status"] == "done"
+    assert client.get("/api/transcripts").json()[0]["tasks"][0]["status"] == "done"
+
+
+def test_generation_counter_invalidates_other_workers(db):
+    # Two workers with their own in-process caches over one database
+    worker_a = ResponseCache(LocalCacheBackend())
+    worker_b = ResponseCache(LocalCacheBackend())
+    builds = []
+
+    def build():
+        builds.append(1)
+        return b"[]"
+
+    worker_a.get_or_build(db, ("tasks",), {}, build)
+    worker_a.get_or_build(db, ("tasks",), {}, build)
+    assert len(builds) == 1
+
+    # A write handled by the other worker bumps the shared counter
+    invalidate(db, "tasks")
+    db.commit()
+    worker_b.get_or_build(db, ("tasks",), {}, build)
+    worker_a.get_or_build(db, ("tasks",), {}, build)
+
+    assert len(builds) == 3
+    assert current_generations(db, ["tasks", "transcripts"]) == {"tasks": 1, "transcripts": 0}
+
+
+
+def test_new_counter_is_bumped_twice_before_commit(db):
+    # The first bump creates the row, which is not flushed before the second
+    invalidate(db, "notes")
+    invalidate(db, "notes", "tasks")
+    db.commit()
+
+    assert current_generations(db, ["notes", "tasks"]) == {"notes": 2, "tasks": 1}
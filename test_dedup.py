@@ -0,0 +1,48 @@
+"""Tests for task deduplication across transcripts."""
+from datetime import date
+
+from app.dedup import dedupe_existing_tasks, normalize_text, task_fingerprint
+from app.models import Task, Transcript
+
+
+def test_fingerprint_ignores_case_punctuation_and_filler():
+    assert normalize_text("Update the slides.") == "update slides"
+    assert task_fingerprint("Update the slides.", "John") == task_fingerprint("update slides", "john")
+    assert task_fingerprint("Update the slides", "John") != task_fingerprint("Update the slides", "Sarah")
+
+
+def test_recurring_item_merges_into_open_task(client, db):
+    first = client.post("/api/transcripts", json={"text": "John will update the slides by Friday."})
+    second = client.post("/api/transcripts", json={"text": "Standup: John will update the slides."})
+
+    assert first.status_code == 200 and second.status_code == 200
+    original = first.json()["tasks"][0]
+    assert second.json()["tasks"][0]["id"] == original["id"]
+    assert db.query(Task).count() == 1
+
+
+def test_done_task_is_not_reused(client, db):
+    task_id = client.post("/api/transcripts", json={"text": "John will update the slides."}).json()["tasks"][0]["id"]
+    client.patch(f"/api/tasks/{task_id}", json={"status": "done"})
+
+    again = client.post("/api/transcripts", json={"text": "John will update the slides."}).json()
+
+    assert again["tasks"][0]["id"] != task_id
+    assert db.query(Task).count() == 2
+
+
+def test_offline_job_backfills_and_merges(db):
+    transcript = Transcript(text="legacy")
+    db.add(transcript)
+    db.commit()
+    for due_date in (None, date(2024, 3, 1), None):
+        db.add(Task(transcript_id=transcript.id, task="Update the slides", owner="John", due_date=due_date))
+    db.add(Task(transcript_id=transcript.id, task="Send the invoice", owner="Sarah"))
+    db.commit()
+
+    result = dedupe_existing_tasks(db, batch_size=2)
+
+    assert result == {"fingerprinted": 4, "merged": 2}
+    remaining = db.query(Task).order_by(Task.id).all()
+    assert [t.task for t in remaining] == ["Update the slides", "Send the invoice"]
+    assert remaining[0].due_date == date(2024, 3, 1)
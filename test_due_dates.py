@@ -0,0 +1,58 @@
+"""Tests for typed due dates and due date filters."""
+from datetime import date, timedelta
+
+from sqlalchemy import text
+
+from app.database import engine
+from app.llm import parse_due_date
+from app.migrations import MIGRATIONS
+from app.models import Task, Transcript
+
+
+def _task(db, name, due_date, status="open"):
+    transcript = db.query(Transcript).first()
+    if transcript is None:
+        transcript = Transcript(text="Planning meeting")
+        db.add(transcript)
+        db.flush()
+    db.add(Task(transcript_id=transcript.id, task=name, due_date=due_date, status=status))
+    db.commit()
+
+
+def test_parse_due_date_returns_date():
+    assert parse_due_date("2024-12-20") == date(2024, 12, 20)
+    assert parse_due_date("tomorrow") == date.today() + timedelta(days=1)
+    assert parse_due_date("2024-02-30") is None
+
+
+def test_due_date_filters(client, db):
+    today = date.today()
+    _task(db, "Overdue", today - timedelta(days=3))
+    _task(db, "Done late", today - timedelta(days=3), status="done")
+    _task(db, "This week", today + timedelta(days=2))
+    _task(db, "Later", today + timedelta(days=30))
+    _task(db, "Someday", None)
+
+    def names(**params):
+        return [t["task"] for t in client.get("/api/tasks", params=params).json()]
+
+    assert names(overdue="true") == ["Overdue"]
+    assert sorted(names(due_after=today.isoformat(), due_before=(today + timedelta(days=7)).isoformat())) == ["This week"]
+    assert names(sort="due_date", status="open") == ["Overdue", "This week", "Later", "Someday"]
+    assert client.get("/api/tasks", params={"sort": "owner"}).status_code == 400
+
+
+def test_migration_normalizes_legacy_strings(db):
+    db.add(Transcript(id=1, text="Legacy"))
+    db.commit()
+    for task_id, value in [(1, "2024-03-01"), (2, "next friday"), (3, None)]:
+        db.execute(text(
+            "INSERT INTO tasks (id, transcript_id, task, due_date, status, created_at) "
+            "VALUES (:id, 1, 'Legacy task', :due_date, 'open', CURRENT_TIMESTAMP)"
+        ), {"id": task_id, "due_date": value})
+    db.commit()
+
+    with engine.begin() as conn:
+        dict(MIGRATIONS)["0005_task_due_date_type"](conn)
+
+    assert [t.due_date for t in db.query(Task).order_by(Task.id)] == [date(2024, 3, 1), None, None]
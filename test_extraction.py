@@ -0,0 +1,64 @@
+"""Tests for the keyword prefilter and source spans in action item extraction."""
+from app.llm import candidate_sentences, extract_action_items
+
+
+def test_prefilter_skips_sentences_without_triggers():
+    transcript = "Revenue came in ahead of plan. John will send the notes! Nothing else to report."
+
+    candidates = list(candidate_sentences(transcript))
+
+    assert candidates == [(30, 55, {"will", "verb"})]
+    assert transcript[30:55] == " John will send the notes"
+
+
+def test_prefilter_keeps_sentence_order_and_boundaries():
+    transcript = "Need to book the venue by Friday\nSOMEONE MUST ORDER LUNCH? Weekly sync went fine."
+
+    assert [transcript[start:end].strip() for start, end, _ in candidate_sentences(transcript)] == [
+        "Need to book the venue by Friday",
+        "SOMEONE MUST ORDER LUNCH",
+    ]
+
+
+def test_prefilter_folds_case_outside_ascii():
+    # Non-ASCII text is scanned case-insensitively rather than lowercased,
+    # so offsets stay put and Unicode case folding still finds triggers
+    transcript = "José will send the notes. Café menu is fine. \u017fomeone must order lunch."
+
+    assert [(transcript[start:end].strip(), families) for start, end, families in candidate_sentences(transcript)] == [
+        ("José will send the notes", {"will", "verb"}),
+        ("\u017fomeone must order lunch", {"someone"}),
+    ]
+
+
+def test_extraction_results_unchanged():
+    transcript = (
+        "Team sync. Mike needs to update the slides. Alice agreed to draft the agenda. "
+        "Prepare the budget draft. Someone has to call the vendor. Bob is going to fix CI."
+    )
+
+    items = extract_action_items(transcript)
+
+    assert [(i["owner"], i["task"]) for i in items] == [
+        ("Mike", "Update the slides"),
+        ("Alice", "Draft the agenda"),
+        (None, "The budget draft"),
+        (None, "Call the vendor"),
+        ("Bob", "Fix ci"),
+    ]
+
+
+def test_items_carry_source_span():
+    transcript = "Weekly sync.\n  Sarah should review the deck by Friday!  Done."
+
+    item = extract_action_items(transcript)[0]
+
+    assert transcript[item["source_start"]:item["source_end"]] == "Sarah should review the deck by Friday"
+
+
+def test_source_span_is_stored_on_task(client):
+    transcript = "Intro. Mike needs to book the room."
+
+    task = client.post("/api/transcripts", json={"text": transcript}).json()["tasks"][0]
+
+    assert transcript[task["source_start"]:task["source_end"]] == "Mike needs to book the room"
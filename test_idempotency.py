@@ -0,0 +1,83 @@
+"""Tests for Idempotency-Key handling on transcript submission."""
+import threading
+import time
+from datetime import datetime, timedelta
+
+from app import idempotency, main
+from app.database import SessionLocal
+from app.models import IdempotencyKey, Task, Transcript
+
+TEXT = "John will prepare the report by Friday."
+
+
+def test_retry_replays_stored_response(client, db, monkeypatch):
+    headers = {"Idempotency-Key": "retry-1"}
+    first = client.post("/api/transcripts", json={"text": TEXT}, headers=headers)
+    assert first.status_code == 200
+
+    def fail(text):
+        raise AssertionError("extraction ran again")
+
+    monkeypatch.setattr(main, "extract_action_items", fail)
+    second = client.post("/api/transcripts", json={"text": TEXT}, headers=headers)
+
+    assert second.status_code == 200
+    assert second.headers["Idempotent-Replayed"] == "true"
+    assert second.json() == first.json()
+    assert db.query(Transcript).count() == 1
+    assert db.query(Task).count() == 1
+
+
+def test_key_reused_with_different_body_is_rejected(client):
+    headers = {"Idempotency-Key": "retry-2"}
+    client.post("/api/transcripts", json={"text": TEXT}, headers=headers)
+
+    response = client.post("/api/transcripts", json={"text": "Mary will book a room."}, headers=headers)
+    assert response.status_code == 422
+
+
+def test_failed_request_releases_key(client, db, monkeypatch):
+    def fail(text):
+        raise RuntimeError("model unavailable")
+
+    monkeypatch.setattr(main, "extract_action_items", fail)
+    headers = {"Idempotency-Key": "retry-3"}
+    assert client.post("/api/transcripts", json={"text": TEXT}, headers=headers).status_code == 500
+    assert db.query(IdempotencyKey).count() == 0
+
+    monkeypatch.undo()
+    assert client.post("/api/transcripts", json={"text": TEXT}, headers=headers).status_code == 200
+
+
+def test_concurrent_duplicate_waits_for_first_request(client, db):
+    # Simulate a first request that is still running
+    key = idempotency.scoped_key("default", "retry-4")
+    db.add(IdempotencyKey(key=key, request_hash=idempotency.request_hash(TEXT), status="pending"))
+    db.commit()
+
+    def finish_first_request():
+        time.sleep(0.3)
+        session = SessionLocal()
+        idempotency.record_response(session, key, 200, '{"transcript_id": 42, "tasks": []}')
+        session.commit()
+        session.close()
+
+    worker = threading.Thread(target=finish_first_request)
+    worker.start()
+    response = client.post("/api/transcripts", json={"text": TEXT}, headers={"Idempotency-Key": "retry-4"})
+    worker.join()
+
+    assert response.json() == {"transcript_id": 42, "tasks": []}
+    assert db.query(Transcript).count() == 0
+
+
+def test_expired_keys_are_purged(db):
+    db.add(IdempotencyKey(
+        key="old", request_hash="x", status="completed",
+        created_at=datetime.utcnow() - timedelta(days=2)
+    ))
+    db.add(IdempotencyKey(key="new", request_hash="x", status="completed"))
+    db.commit()
+
+    assert idempotency.purge_expired(db, ttl_seconds=24 * 60 * 60) == 1
+    assert [row.key for row in db.query(IdempotencyKey)] == ["new"]
@@ -0,0 +1,111 @@
+"""Tests for the owner directory."""
+from sqlalchemy import text
+
+from app.database import engine
+from app.migrations import run_migrations
+from app.models import Owner, Task, Transcript
+from app.owners import OwnerDirectory, normalize_owner
+
+
+def test_normalize_owner():
+    assert normalize_owner("  John. ") == "john"
+    assert normalize_owner("Mary  Ann") == "mary ann"
+    assert normalize_owner(None) == ""
+
+
+def test_resolve_creates_once_and_caches(db):
+    directory = OwnerDirectory()
+    first = directory.resolve(db, "default", ["John", "john.", None, "Mary"])
+    assert first["John"] == first["john."]
+    assert first["John"] != first["Mary"]
+    assert db.query(Owner).count() == 2
+
+    # A fresh directory finds the stored aliases; a warm one needs no query at all
+    assert OwnerDirectory().resolve(db, "default", ["JOHN"]) == {"JOHN": first["John"]}
+    assert directory.resolve(db, "other", ["John"])["John"] != first["John"]
+
+
+def test_ingestion_links_tasks_to_owners(client):
+    client.post("/api/transcripts", json={"text": "John will prepare the report. Mary will book a room."})
+    client.post("/api/transcripts", json={"text": "John should update the roadmap."})
+
+    owners = {owner["name"]: owner for owner in client.get("/api/owners").json()}
+    assert set(owners) == {"John", "Mary"}
+    assert owners["John"]["open_tasks"] == 2
+    assert owners["Mary"]["open_tasks"] == 1
+
+    tasks = client.get(f"/api/owners/{owners['John']['id']}/tasks").json()
+    assert sorted(task["task"] for task in tasks) == ["Prepare the report", "Update the roadmap"]
+    assert all(task["owner_id"] == owners["John"]["id"] for task in tasks)
+
+    client.patch(f"/api/tasks/{tasks[0]['id']}", json={"status": "done", "owner": "Mary"})
+    owners = {owner["name"]: owner for owner in client.get("/api/owners").json()}
+    assert owners["John"]["open_tasks"] == 1
+    assert owners["Mary"]["done_tasks"] == 1
+
+
+def test_alias_resolves_to_existing_owner(client):
+    client.post("/api/transcripts", json={"text": "John will prepare the report."})
+    john = client.get("/api/owners").json()[0]
+
+    response = client.post(f"/api/owners/{john['id']}/aliases", json={"alias": "Johnny"})
+    assert response.json()["aliases"] == ["john", "johnny"]
+    assert client.post(f"/api/owners/{john['id']}/aliases", json={"alias": "johnny!"}).status_code == 409
+
+    client.post("/api/transcripts", json={"text": "Johnny will book a room."})
+    assert len(client.get(f"/api/owners/{john['id']}/tasks").json()) == 2
+
+
+def test_owners_are_scoped_to_workspace(client):
+    client.post("/api/transcripts", json={"text": "John will prepare the report."})
+    john = client.get("/api/owners").json()[0]
+
+    assert client.get("/api/owners", headers={"X-Workspace": "acme"}).json() == []
+    response = client.get(f"/api/owners/{john['id']}/tasks", headers={"X-Workspace": "acme"})
+    assert response.status_code == 404
+
+
+def test_migration_backfills_owner_ids(db):
+    transcript = Transcript(text="Notes")
+    db.add(transcript)
+    db.flush()
+    db.add_all([
+        Task(transcript_id=transcript.id, task="Prepare the report", owner="John"),
+        Task(transcript_id=transcript.id, task="Book a room", owner="john"),
+        Task(transcript_id=transcript.id, task="Send notes", owner=None),
+    ])
+    db.commit()
+    db.execute(text("DELETE FROM schema_migrations WHERE name = '0008_owner_directory'"))
+    db.commit()
+
+    assert run_migrations(engine) == ["0008_owner_directory"]
+
+    db.expire_all()
+    owners = db.query(Owner).all()
+    assert [owner.normalized_name for owner in owners] == ["john"]
+    assert [task.owner_id for task in db.query(Task).order_by(Task.id)] == [owners[0].id, owners[0].id, None]
+
+
+def test_failed_update_creates_no_owner(client):
+    task = client.post("/api/transcripts", json={"text": "John will prepare the report."}).json()["tasks"][0]
+
+    assert client.patch("/api/tasks/9999", json={"owner": "Zed"}).status_code == 404
+    result = client.post("/api/tasks/mutations", json={"mutations": [
+        {"id": task["id"], "version": task["version"] + 1, "changes": {"owner": "Zed"}}
+    ]}).json()
+    assert len(result["conflicts"]) == 1
+
+    assert [owner["name"] for owner in client.get("/api/owners").json()] == ["John"]
+
+
+def test_failed_submission_creates_no_owner(client, monkeypatch):
+    from app import main
+
+    def fail(*args, **kwargs):
+        raise RuntimeError("disk full")
+
+    monkeypatch.setattr(main, "find_open_duplicates", fail)
+
+    response = client.post("/api/transcripts", json={"text": "Zed will prepare the report."})
+    assert response.status_code == 500
+    assert client.get("/api/owners").json() == []
@@ -0,0 +1,65 @@
+"""Tests for routing reads to a replica, using a second SQLite file as the replica."""
+import pytest
+from sqlalchemy.orm import sessionmaker
+
+from app import database
+from app.database import Base, make_engine
+from app.migrations import run_migrations
+from app.models import Task, Transcript
+
+
+@pytest.fixture
+def replica(db, tmp_path, monkeypatch):
+    """Session on a separate database that read-only routes are pointed at."""
+    replica_engine = make_engine(f"sqlite:///{tmp_path / 'replica.db'}")
+    Base.metadata.create_all(bind=replica_engine)
+    run_migrations(replica_engine)
+    factory = sessionmaker(autocommit=False, autoflush=False, bind=replica_engine)
+    monkeypatch.setattr(database, "ReadSessionLocal", factory)
+
+    session = factory()
+    try:
+        yield session
+    finally:
+        session.close()
+        replica_engine.dispose()
+
+
+def add_task(session, text):
+    transcript = Transcript(text=text)
+    session.add(transcript)
+    session.flush()
+    session.add(Task(transcript_id=transcript.id, task=text, status="open"))
+    session.commit()
+
+
+def test_reads_are_served_by_replica(client, db, replica):
+    add_task(replica, "Only on the replica")
+
+    assert [t["task"] for t in client.get("/api/tasks").json()] == ["Only on the replica"]
+    assert len(client.get("/api/transcripts").json()) == 1
+    assert "Only on the replica" in client.get("/api/export/tasks").text
+    assert db.query(Task).count() == 0
+
+
+def test_writer_reads_its_own_writes_from_primary(client, db, replica):
+    response = client.post("/api/transcripts", json={"text": "John will prepare the report."})
+    assert response.status_code == 200
+    task_id = response.json()["tasks"][0]["id"]
+    assert db.query(Task).count() == 1
+    assert replica.query(Task).count() == 0
+
+    assert len(client.get("/api/tasks").json()) == 1
+    assert client.get(f"/api/tasks/{task_id}").status_code == 200
+
+    # Another client, without the last-write cookie, reads the (lagging) replica
+    client.cookies.clear()
+    assert client.get("/api/tasks").json() == []
+    assert client.get(f"/api/tasks/{task_id}").status_code == 404
+
+
+def test_reads_return_to_replica_after_window(client, replica, monkeypatch):
+    client.post("/api/transcripts", json={"text": "John will prepare the report."})
+    monkeypatch.setattr(database, "READ_YOUR_WRITES_SECONDS", 0)
+
+    assert client.get("/api/tasks").json() == []
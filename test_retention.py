@@ -0,0 +1,61 @@
+"""Tests for the retention and archival job."""
+from datetime import datetime, timedelta
+
+from app.compression import compress_text, decompress_text
+from app.models import ArchivedTask, ArchivedTranscript, Task, Transcript
+from app.retention import run_retention
+
+
+def _transcript(db, days_old, statuses):
+    created_at = datetime.utcnow() - timedelta(days=days_old)
+    transcript = Transcript(text=f"Meeting from {days_old} days ago", created_at=created_at)
+    db.add(transcript)
+    db.flush()
+    for i, status in enumerate(statuses):
+        db.add(Task(transcript_id=transcript.id, task=f"Task {i}", status=status, created_at=created_at))
+    db.commit()
+    return transcript.id
+
+
+def test_compression_round_trip():
+    payload = compress_text("John will prepare the report. " * 50)
+
+    assert len(payload) < 200
+    assert decompress_text(payload) == "John will prepare the report. " * 50
+
+
+def test_old_transcripts_without_open_tasks_are_archived(db):
+    old_done = _transcript(db, 400, ["done", "done"])
+    old_open = _transcript(db, 400, ["open", "done"])
+    recent = _transcript(db, 5, ["done"])
+
+    result = run_retention(db, transcript_days=365, task_days=None, batch_size=1)
+
+    assert result == {"transcripts": 1, "tasks": 0}
+    assert {t.id for t in db.query(Transcript)} == {old_open, recent}
+    assert db.query(ArchivedTranscript).one().task_count == 2
+    assert db.query(Task).filter(Task.transcript_id == old_done).count() == 0
+
+
+def test_old_done_tasks_are_archived(db):
+    transcript_id = _transcript(db, 100, ["open", "done", "done"])
+
+    result = run_retention(db, transcript_days=None, task_days=90, batch_size=1)
+
+    assert result == {"transcripts": 0, "tasks": 2}
+    assert [t.status for t in db.query(Task)] == ["open"]
+    assert db.query(ArchivedTask).filter(ArchivedTask.transcript_id == transcript_id).count() == 2
+
+
+def test_archived_transcript_is_retrievable(client, db):
+    transcript_id = _transcript(db, 400, ["done", "done"])
+    run_retention(db, transcript_days=None, task_days=90)
+    run_retention(db, transcript_days=365, task_days=None)
+
+    listing = client.get("/api/archive/transcripts").json()
+    restored = client.get(f"/api/archive/transcripts/{transcript_id}").json()
+
+    assert [a["id"] for a in listing] == [transcript_id]
+    assert restored["text"] == "Meeting from 400 days ago"
+    assert [t["task"] for t in restored["tasks"]] == ["Task 0", "Task 1"]
+    assert client.get("/api/archive/transcripts/999").status_code == 404
@@ -0,0 +1,182 @@
+"""Tests for the scheduled maintenance jobs and their leases."""
+import json
+from datetime import date, datetime, timedelta
+
+from sqlalchemy import text
+
+from app import cache, schemas, transfer
+from app.database import engine
+from app.migrations import run_migrations
+from app.models import JobLease, Task, Transcript
+from app.scheduler import (
+    Job, Scheduler, acquire_lease, flag_overdue_tasks, optimize_database, refresh_task_stats,
+    release_lease, renew_lease,
+)
+
+YESTERDAY = date.today() - timedelta(days=1)
+TOMORROW = date.today() + timedelta(days=1)
+
+
+def add_tasks(db, *tasks):
+    transcript = Transcript(text="Notes")
+    db.add(transcript)
+    db.flush()
+    rows = [Task(transcript_id=transcript.id, task=f"Task {i}", **fields) for i, fields in enumerate(tasks)]
+    db.add_all(rows)
+    db.commit()
+    return rows
+
+
+def test_flag_overdue_tasks_in_batches(db):
+    late, later, on_time, done = add_tasks(
+        db,
+        {"due_date": YESTERDAY},
+        {"due_date": YESTERDAY},
+        {"due_date": TOMORROW},
+        {"due_date": YESTERDAY, "status": "done"},
+    )
+    # As if the flags were set before the dates moved on
+    db.query(Task).update({Task.overdue: False})
+    db.query(Task).filter(Task.id.in_([on_time.id, done.id])).update({Task.overdue: True})
+    db.commit()
+
+    assert flag_overdue_tasks(db, batch_size=1) == {"flagged": 2, "cleared": 2}
+    db.expire_all()
+    assert [task.overdue for task in (late, later, on_time, done)] == [True, True, False, False]
+    assert flag_overdue_tasks(db) == {"flagged": 0, "cleared": 0}
+
+
+def test_edits_keep_overdue_flag_current(client):
+    response = client.post("/api/transcripts", json={"text": "John will prepare the report."})
+    task_id = response.json()["tasks"][0]["id"]
+
+    task = client.patch(f"/api/tasks/{task_id}", json={"due_date": str(YESTERDAY)}).json()
+    assert task["overdue"] is True
+    task = client.patch(f"/api/tasks/{task_id}", json={"status": "done"}).json()
+    assert task["overdue"] is False
+
+    client.patch("/api/tasks", json={"ids": [task_id], "changes": {"status": "open"}})
+    assert client.get(f"/api/tasks/{task_id}").json()["overdue"] is True
+
+
+def test_migration_backfills_overdue_flag(client, db):
+    late, on_time, done = add_tasks(
+        db, {"due_date": YESTERDAY}, {"due_date": TOMORROW}, {"due_date": YESTERDAY, "status": "done"}
+    )
+    # A database from before the flag existed
+    db.query(Task).update({Task.overdue: False})
+    db.execute(text("DELETE FROM schema_migrations WHERE name = '0009_task_overdue'"))
+    db.commit()
+
+    assert run_migrations(engine) == ["0009_task_overdue"]
+
+    db.expire_all()
+    assert [task.overdue for task in (late, on_time, done)] == [True, False, False]
+    assert [task["id"] for task in client.get("/api/tasks", params={"overdue": "true"}).json()] == [late.id]
+    assert client.get("/api/stats").json()["overdue_tasks"] == 1
+
+
+def test_imported_tasks_are_flagged(db):
+    transcript = Transcript(text="Notes")
+    db.add(transcript)
+    db.commit()
+
+    transfer.import_records(db, "tasks", [
+        {"transcript_id": transcript.id, "task": "Late", "due_date": str(YESTERDAY)},
+        {"transcript_id": transcript.id, "task": "Done", "due_date": str(YESTERDAY), "status": "done"},
+    ])
+
+    assert [task.overdue for task in db.query(Task).order_by(Task.id)] == [True, False]
+
+
+def test_overdue_is_judged_by_todays_date(client, db):
+    response = client.post("/api/transcripts", json={"text": "John will prepare the report."})
+    task_id = response.json()["tasks"][0]["id"]
+    client.cookies.clear()
+    # The date moved past the due date, and no overdue job has run since
+    db.query(Task).update({Task.due_date: YESTERDAY, Task.overdue: False})
+    db.commit()
+
+    assert [task["id"] for task in client.get("/api/tasks", params={"overdue": "true"}).json()] == [task_id]
+    assert client.get("/api/tasks").json()[0]["overdue"] is True
+    transcript = client.get("/api/transcripts").json()[0]
+    assert [task["overdue"] for task in transcript["tasks"] if task["id"] == task_id] == [True]
+    assert client.get("/api/stats").json()["overdue_tasks"] == 1
+
+
+def test_cached_listings_expire_with_the_day(client, monkeypatch):
+    client.post("/api/transcripts", json={"text": "John will prepare the report by 2030-01-02."})
+    client.cookies.clear()
+    assert client.get("/api/tasks").json()[0]["overdue"] is False
+
+    class Tomorrow(date):
+        @classmethod
+        def today(cls):
+            return date(2030, 1, 3)
+
+    monkeypatch.setattr(cache, "date", Tomorrow)
+    monkeypatch.setattr(schemas, "date", Tomorrow)
+    assert client.get("/api/tasks").json()[0]["overdue"] is True
+
+
+def test_stats_are_refreshed(client, db):
+    add_tasks(db, {"due_date": YESTERDAY}, {}, {"status": "done"})
+
+    live = client.get("/api/stats").json()
+    assert live == {"open_tasks": 2, "done_tasks": 1, "overdue_tasks": 1, "refreshed_at": None}
+
+    assert refresh_task_stats(db) == 1
+    stored = client.get("/api/stats").json()
+    assert stored["open_tasks"] == 2 and stored["refreshed_at"] is not None
+    assert client.get("/api/stats", headers={"X-Workspace": "acme"}).json()["open_tasks"] == 0
+
+
+def test_lease_is_held_by_one_instance(db):
+    assert acquire_lease(db, "overdue", "a")
+    assert not acquire_lease(db, "overdue", "b")
+    assert renew_lease(db, "overdue", "a")
+
+    # A holder that stopped renewing loses the lease once it expires
+    db.query(JobLease).update({JobLease.leased_until: datetime.utcnow() - timedelta(seconds=1)})
+    db.commit()
+    assert acquire_lease(db, "overdue", "b")
+    assert not renew_lease(db, "overdue", "a")
+
+    # Released jobs are not due again until their interval has passed
+    release_lease(db, "overdue", "b", interval=60, result="{}")
+    assert not acquire_lease(db, "overdue", "a")
+
+
+def test_due_jobs_run_once_across_instances(db):
+    runs = []
+
+    def run(heartbeat):
+        runs.append(1)
+        heartbeat()
+        return {"runs": len(runs)}
+
+    jobs = [Job("count", 60, run)]
+    assert Scheduler(jobs, holder="a").run_pending() == {"count": {"runs": 1}}
+    assert Scheduler(jobs, holder="b").run_pending() == {}
+    assert len(runs) == 1
+
+    lease = db.get(JobLease, "count")
+    assert lease.leased_until is None
+    assert lease.next_run_at > datetime.utcnow()
+    assert json.loads(lease.last_result) == {"runs": 1}
+
+
+def test_failed_job_is_rescheduled(db):
+    def fail(heartbeat):
+        raise RuntimeError("disk full")
+
+    assert Scheduler([Job("broken", 60, fail)], holder="a").run_pending() == {}
+
+    lease = db.get(JobLease, "broken")
+    assert lease.leased_until is None
+    assert json.loads(lease.last_result) == {"error": "disk full"}
+
+
+def test_optimize_database(db):
+    optimize_database(engine)
+    optimize_database(engine, vacuum=True)
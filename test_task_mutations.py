@@ -0,0 +1,90 @@
+"""Tests for the batched task mutation endpoint."""
+from sqlalchemy import event, text
+from sqlalchemy.orm import Session
+
+from app.models import Task, Transcript
+
+
+def make_tasks(db, count):
+    transcript = Transcript(text="Standup notes")
+    db.add(transcript)
+    db.flush()
+    tasks = [Task(transcript_id=transcript.id, task=f"Task {i}", status="open") for i in range(count)]
+    db.add_all(tasks)
+    db.commit()
+    return [task.id for task in tasks]
+
+
+def test_batch_applies_changes_and_returns_changed_rows(client, db):
+    ids = make_tasks(db, 3)
+
+    response = client.post("/api/tasks/mutations", json={"mutations": [
+        {"id": ids[0], "version": 1, "changes": {"status": "done"}},
+        {"id": ids[1], "version": 1, "changes": {"status": "done"}},
+        # No-op change: not returned
+        {"id": ids[2], "version": 1, "changes": {"status": "open"}},
+    ]})
+
+    assert response.status_code == 200
+    result = response.json()
+    assert result["conflicts"] == []
+    assert sorted(task["id"] for task in result["tasks"]) == ids[:2]
+    assert all(task["status"] == "done" and task["version"] == 2 for task in result["tasks"])
+
+    statuses = {task["id"]: task["status"] for task in client.get("/api/tasks").json()}
+    assert statuses == {ids[0]: "done", ids[1]: "done", ids[2]: "open"}
+
+
+def test_stale_version_is_reported_as_conflict(client, db):
+    ids = make_tasks(db, 2)
+    # Someone else edits the first task and deletes the second
+    client.patch(f"/api/tasks/{ids[0]}", json={"owner": "Mary"})
+    client.delete(f"/api/tasks/{ids[1]}")
+
+    response = client.post("/api/tasks/mutations", json={"mutations": [
+        {"id": ids[0], "version": 1, "changes": {"status": "done"}},
+        {"id": ids[1], "version": 1, "changes": {"status": "done"}},
+    ]})
+
+    result = response.json()
+    assert result["tasks"] == []
+    conflicts = {conflict["id"]: conflict["current"] for conflict in result["conflicts"]}
+    assert conflicts[ids[0]]["owner"] == "Mary"
+    assert conflicts[ids[0]]["status"] == "open"
+    assert conflicts[ids[0]]["version"] == 2
+    assert conflicts[ids[1]] is None
+
+
+def test_bulk_update_bumps_versions(client, db):
+    ids = make_tasks(db, 2)
+    client.patch("/api/tasks", json={"ids": ids, "changes": {"status": "done"}})
+
+    assert {task["version"] for task in client.get("/api/tasks").json()} == {2}
+
+
+def test_duplicate_task_in_batch_is_rejected(client, db):
+    ids = make_tasks(db, 1)
+    mutation = {"id": ids[0], "version": 1, "changes": {"status": "done"}}
+
+    response = client.post("/api/tasks/mutations", json={"mutations": [mutation, mutation]})
+    assert response.status_code == 400
+
+
+def test_concurrent_write_to_single_task_is_a_conflict(client, db):
+    ids = make_tasks(db, 1)
+
+    def interleave(session, flush_context, instances):
+        # The row moves on between this request's SELECT and its flush
+        session.execute(text("UPDATE tasks SET version = version + 1"))
+
+    event.listen(Session, "before_flush", interleave, once=True)
+    try:
+        assert client.patch(f"/api/tasks/{ids[0]}", json={"status": "done"}).status_code == 409
+    finally:
+        event.remove(Session, "before_flush", interleave)
+
+    event.listen(Session, "before_flush", interleave, once=True)
+    try:
+        assert client.delete(f"/api/tasks/{ids[0]}").status_code == 409
+    finally:
+        event.remove(Session, "before_flush", interleave)
@@ -0,0 +1,79 @@
+"""Tests for keyset-paginated task listings."""
+from datetime import date, datetime, timedelta
+
+import pytest
+from sqlalchemy import text
+
+from app.models import Task, Transcript
+
+
+@pytest.fixture
+def tasks(db):
+    transcript = Transcript(text="Planning notes")
+    db.add(transcript)
+    db.flush()
+    created = datetime(2024, 1, 1)
+    due_dates = [date(2024, 3, 1), None, date(2024, 2, 1), date(2024, 3, 1), None, date(2024, 1, 15), None]
+    for i, due in enumerate(due_dates):
+        db.add(Task(
+            transcript_id=transcript.id,
+            task=f"Task {i}",
+            status="open" if i % 3 else "done",
+            due_date=due,
+            # Pairs of tasks share a timestamp, so ties are broken by id
+            created_at=created + timedelta(minutes=i // 2),
+        ))
+    db.commit()
+
+
+def collect_pages(client, **params):
+    ids, cursor = [], None
+    while True:
+        query = dict(params, limit=3, **({"cursor": cursor} if cursor else {}))
+        page = client.get("/api/tasks/page", params=query).json()
+        assert len(page["tasks"]) <= 3
+        ids += [task["id"] for task in page["tasks"]]
+        cursor = page["next_cursor"]
+        if cursor is None:
+            return ids
+
+
+@pytest.mark.parametrize("sort", ["created_at", "due_date"])
+@pytest.mark.parametrize("status", [None, "open"])
+def test_pages_match_full_listing(client, tasks, sort, status):
+    params = {"sort": sort, **({"status": status} if status else {})}
+    expected = [task["id"] for task in client.get("/api/tasks", params=params).json()]
+
+    assert collect_pages(client, **params) == expected
+
+
+def test_invalid_page_parameters(client, tasks):
+    assert client.get("/api/tasks/page", params={"cursor": "not-a-cursor"}).status_code == 400
+    assert client.get("/api/tasks/page", params={"limit": 0}).status_code == 400
+
+
+def test_due_date_pages_put_undated_tasks_last(client, tasks):
+    assert collect_pages(client, sort="due_date") == [6, 3, 1, 4, 2, 5, 7]
+
+
+@pytest.mark.parametrize("query, index", [
+    (
+        "SELECT * FROM tasks WHERE workspace = 'acme' AND (created_at, id) < ('2024-01-01', 5) "
+        "ORDER BY created_at DESC, id DESC LIMIT 51",
+        "ix_tasks_workspace_created_at_id",
+    ),
+    (
+        "SELECT * FROM tasks WHERE workspace = 'acme' AND due_date IS NOT NULL "
+        "AND (due_date, id) > ('2024-01-01', 5) ORDER BY due_date, id LIMIT 51",
+        "ix_tasks_workspace_due_date_id",
+    ),
+    (
+        "SELECT * FROM tasks WHERE workspace = 'acme' AND due_date IS NULL AND id > 5 "
+        "ORDER BY id LIMIT 51",
+        "ix_tasks_workspace_due_date_id",
+    ),
+])
+def test_unfiltered_pages_use_keyset_index(db, query, index):
+    plan = " ".join(str(row) for row in db.execute(text(f"EXPLAIN QUERY PLAN {query}")).all())
+    assert index in plan
+    assert "TEMP B-TREE" not in plan
@@ -0,0 +1,47 @@
+"""Tests for compressed transcript storage and previews."""
+from sqlalchemy import text
+
+from app.database import engine
+from app.migrations import MIGRATIONS
+from app.models import PREVIEW_LENGTH, Transcript
+
+LONG_TRANSCRIPT = "John will prepare the quarterly report by Friday. " * 200
+
+
+def test_text_is_stored_compressed(db):
+    db.add(Transcript(text=LONG_TRANSCRIPT))
+    db.commit()
+
+    raw = db.execute(text("SELECT text, preview, text_length FROM transcripts")).one()
+
+    assert isinstance(raw.text, bytes) and len(raw.text) < len(LONG_TRANSCRIPT) // 10
+    assert raw.preview == LONG_TRANSCRIPT[:PREVIEW_LENGTH]
+    assert raw.text_length == len(LONG_TRANSCRIPT)
+    assert db.query(Transcript).one().text == LONG_TRANSCRIPT
+
+
+def test_listing_returns_preview_and_detail_returns_text(client):
+    transcript_id = client.post("/api/transcripts", json={"text": LONG_TRANSCRIPT}).json()["transcript_id"]
+
+    listing = client.get("/api/transcripts").json()
+    detail = client.get(f"/api/transcripts/{transcript_id}").json()
+
+    assert "text" not in listing[0]
+    assert listing[0]["text_length"] == len(LONG_TRANSCRIPT)
+    assert len(listing[0]["tasks"]) == 1
+    assert detail["text"] == LONG_TRANSCRIPT
+
+
+def test_migration_compresses_legacy_rows(db):
+    db.execute(text(
+        "INSERT INTO transcripts (id, text, created_at) VALUES (7, :text, CURRENT_TIMESTAMP)"
+    ), {"text": "Legacy   plain\ntext transcript"})
+    db.commit()
+
+    migrate = dict(MIGRATIONS)["0003_compressed_transcripts"]
+    with engine.begin() as conn:
+        migrate(conn)
+
+    raw = db.execute(text("SELECT typeof(text), preview, text_length FROM transcripts")).one()
+    assert tuple(raw) == ("blob", "Legacy plain text transcript", 30)
+    assert db.query(Transcript).one().text == "Legacy   plain\ntext transcript"
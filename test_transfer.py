@@ -0,0 +1,97 @@
+"""Tests for streaming export and bulk import."""
+import json
+
+import pytest
+
+from app import transfer
+from app.models import Task, Transcript
+
+TRANSCRIPT = "John will prepare the report by 2024-03-01. Sarah should review the deck."
+
+
+def test_export_ndjson_and_csv(client):
+    client.post("/api/transcripts", json={"text": TRANSCRIPT})
+
+    ndjson = client.get("/api/export/tasks")
+    assert ndjson.headers["content-type"].startswith("application/x-ndjson")
+    rows = [json.loads(line) for line in ndjson.text.splitlines()]
+    assert [row["owner"] for row in rows] == ["John", "Sarah"]
+
+    csv_text = client.get("/api/export/tasks?format=csv").text
+    assert csv_text.splitlines()[0] == ",".join(transfer.EXPORTS["tasks"][1])
+    assert len(csv_text.splitlines()) == 3
+
+
+def test_export_is_chunked(db, monkeypatch):
+    monkeypatch.setattr(transfer, "CHUNK_BYTES", 10)
+    db.add_all([Transcript(text=f"Transcript number {i}") for i in range(5)])
+    db.commit()
+
+    chunks = list(transfer.iter_export(db, "transcripts", "ndjson", "default"))
+
+    assert len(chunks) == 5
+
+
+def test_round_trip_import(client, db):
+    client.post("/api/transcripts", json={"text": TRANSCRIPT})
+    transcripts = client.get("/api/export/transcripts").content
+    tasks = client.get("/api/export/tasks?format=csv").content
+    db.query(Task).delete()
+    db.query(Transcript).delete()
+    db.commit()
+
+    first = client.post("/api/import/transcripts", files={"file": ("t.ndjson", transcripts)})
+    second = client.post("/api/import/tasks?format=csv", files={"file": ("t.csv", tasks)})
+
+    assert first.json() == {"imported": 1}
+    assert second.json() == {"imported": 2}
+    assert [t.owner for t in db.query(Task).order_by(Task.id)] == ["John", "Sarah"]
+
+
+def test_invalid_import_is_rolled_back(client, db):
+    body = b'{"text": "First transcript"}\n{"text": ""}\n'
+
+    response = client.post("/api/import/transcripts", files={"file": ("t.ndjson", body)})
+
+    assert response.status_code == 400
+    assert db.query(Transcript).count() == 0
+
+
+def test_import_cannot_reach_another_workspace(client, db):
+    beta = {"X-Workspace": "beta"}
+    submitted = client.post("/api/transcripts", json={"text": TRANSCRIPT}, headers=beta).json()
+    task_id = submitted["tasks"][0]["id"]
+
+    foreign_transcript = json.dumps({"transcript_id": submitted["transcript_id"], "task": "Injected"})
+    response = client.post("/api/import/tasks", files={"file": ("t.ndjson", foreign_transcript.encode())})
+    assert response.status_code == 400
+
+    own_transcript = client.post("/api/transcripts", json={"text": "Mary will book a room."}).json()
+    taken_id = json.dumps({"id": task_id, "transcript_id": own_transcript["transcript_id"], "task": "Injected"})
+    response = client.post("/api/import/tasks", files={"file": ("t.ndjson", taken_id.encode())})
+    assert response.status_code == 400
+
+    assert db.query(Task).count() == 3
+    assert all(task["task"] != "Injected" for task in client.get("/api/transcripts", headers=beta).json()[0]["tasks"])
+
+
+def test_command_line_export_covers_one_workspace(client, db, tmp_path):
+    client.post("/api/transcripts", json={"text": TRANSCRIPT})
+    client.post("/api/transcripts", json={"text": "Mary will book a room."}, headers={"X-Workspace": "beta"})
+    path = tmp_path / "tasks.ndjson"
+
+    with pytest.raises(SystemExit):
+        transfer.main(["export", "tasks", "--output", str(path)])
+    assert transfer.main(["export", "tasks", "--workspace", "beta", "--output", str(path)]) == 0
+
+    rows = [json.loads(line) for line in path.read_text().splitlines()]
+    assert [row["task"] for row in rows] == ["Book a room"]
+
+
+def test_non_utf8_import_is_rejected(client, db):
+    body = '{"text": "Café notes"}\n'.encode("latin-1")
+
+    for fmt in ("ndjson", "csv"):
+        response = client.post(f"/api/import/transcripts?format={fmt}", files={"file": ("t", body)})
+        assert response.status_code == 400
+    assert db.query(Transcript).count() == 0
@@ -0,0 +1,97 @@
+"""Tests for workspace (tenant) scoping."""
+import os
+
+import pytest
+from sqlalchemy import text
+
+from app import database
+from app.cache import response_cache
+
+ACME = {"X-Workspace": "acme"}
+GLOBEX = {"X-Workspace": "globex"}
+
+
+def submit(client, headers, transcript="John will prepare the report."):
+    response = client.post("/api/transcripts", json={"text": transcript}, headers=headers)
+    assert response.status_code == 200
+    return response.json()
+
+
+def test_workspaces_are_isolated(client):
+    acme_task = submit(client, ACME)["tasks"][0]
+    submit(client, GLOBEX, "Mary will book the venue.")
+
+    assert [t["owner"] for t in client.get("/api/tasks", headers=ACME).json()] == ["John"]
+    assert [t["owner"] for t in client.get("/api/tasks", headers=GLOBEX).json()] == ["Mary"]
+    assert client.get("/api/tasks").json() == []
+    assert len(client.get("/api/transcripts", headers=GLOBEX).json()) == 1
+
+    assert client.get(f"/api/tasks/{acme_task['id']}", headers=GLOBEX).status_code == 404
+    assert client.delete(f"/api/tasks/{acme_task['id']}", headers=GLOBEX).status_code == 404
+
+    # Filter-based bulk updates only reach the caller's workspace
+    affected = client.patch(
+        "/api/tasks", json={"status": "open", "changes": {"status": "done"}}, headers=GLOBEX
+    ).json()["affected"]
+    assert affected == 1
+    assert client.get("/api/tasks", headers=ACME).json()[0]["status"] == "open"
+
+
+def test_duplicates_are_not_merged_across_workspaces(client):
+    submit(client, ACME)
+    submit(client, GLOBEX)
+
+    assert len(client.get("/api/tasks", headers=ACME).json()) == 1
+    assert len(client.get("/api/tasks", headers=GLOBEX).json()) == 1
+
+
+def test_write_keeps_other_workspace_cache_valid(client):
+    submit(client, ACME)
+    client.get("/api/tasks", headers=ACME)
+    hits = response_cache.hits
+
+    submit(client, GLOBEX, "Mary will book the venue.")
+    client.get("/api/tasks", headers=ACME)
+
+    assert response_cache.hits == hits + 1
+
+
+def test_workspace_cookie_and_validation(client):
+    assert client.get("/?workspace=acme").status_code == 200
+    submit(client, {})
+    assert len(client.get("/api/tasks", headers=ACME).json()) == 1
+
+    assert client.get("/api/tasks", headers={"X-Workspace": "../etc"}).status_code == 400
+    assert client.get("/?workspace=Not Valid").status_code == 400
+
+
+def test_listing_uses_workspace_leading_index(db):
+    plan = db.execute(text(
+        "EXPLAIN QUERY PLAN SELECT * FROM tasks "
+        "WHERE workspace = 'acme' AND status = 'open' ORDER BY created_at DESC"
+    )).all()
+    assert "ix_tasks_workspace_status_created_at" in " ".join(str(row) for row in plan)
+
+
+@pytest.fixture
+def tenant_files(tmp_path, monkeypatch):
+    """Store each workspace in its own SQLite file under tmp_path."""
+    monkeypatch.setattr(database, "TENANT_DATABASE_DIR", str(tmp_path))
+    monkeypatch.setattr(database, "TENANT_ENGINE_CACHE_SIZE", 1)
+    yield tmp_path
+    for factory in database._tenant_sessions.values():
+        factory.kw["bind"].dispose()
+    database._tenant_sessions.clear()
+
+
+def test_per_tenant_database_files(client, tenant_files):
+    submit(client, ACME)
+    submit(client, GLOBEX, "Mary will book the venue.")
+
+    assert os.path.exists(tenant_files / "acme.db")
+    assert os.path.exists(tenant_files / "globex.db")
+    # Only the most recently used tenant stays open
+    assert list(database._tenant_sessions) == ["globex"]
+
+    assert [t["owner"] for t in client.get("/api/tasks", headers=ACME).json()] == ["John"]
+    assert [t["owner"] for t in client.get("/api/tasks", headers=GLOBEX).json()] == ["Mary"]
@@ -0,0 +1,5 @@
+"""Run the scheduled maintenance jobs in their own process (see app/scheduler.py)."""
+from app.scheduler import main
+
+if __name__ == "__main__":
+    raise SystemExit(main())